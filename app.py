@@ -1,48 +1,143 @@
+import re
+from typing import Any, Callable
+
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 
-from matplotlib.colors import LinearSegmentedColormap
-
-from decision_maker import DecisionMaker
-from decision_maker_defaults import default_decision_maker
-from decision_maker_mockup import example_decision_maker
+from decision_file import DECISION_FILE_EXTENSION, DecisionFileError, read_decision_file
+from decision_maker import DecisionMaker, InvalidInputError, plotly_cmap_default
+from decision_maker_defaults import set_attributes_from_default
+from decision_maker_mockup import set_attributes_from_example
 from progress_tracker import ProgressTracker
-from utils import snake_case, parse_toml
+from session_memory import limit_session_history, session_memory_usage
+from utils import snake_case, load_toml, gradient_cmap
+
+# The config and colormap are built once per process rather than on every script run.
+streamlit_config = load_toml(".streamlit/config.toml")
+cmap = gradient_cmap(
+    "bggradient", (streamlit_config['theme']['backgroundColor'], streamlit_config['theme']['primaryColor']))
+plotly_cmap = plotly_cmap_default  # https://plotly.com/python/builtin-colorscales/
+
+# Decision input widget keys are not stored upfront for every label and cell,
+# they are derived from the decision maker when their widget is rendered.
+decision_widget_key_pattern = re.compile(
+    r"decision|decision_options_count|evaluation_factors_count"
+    r"|option_(?P<option>\d+)(?:_factor_(?P<rated_factor>\d+))?|factor_(?P<factor>\d+)(?P<importance>_importance)?")
+
+
+def derive_widget_state(key: str, value):
+    if key not in st.session_state:
+        st.session_state[key] = value
+
+
+def decision_widget_value(decision_maker: DecisionMaker, key: re.Match) -> Any:
+    """Value of a decision input widget key in the decision maker, `None` if its option or factor was removed."""
+    if key['option'] is not None:
+        option = int(key['option'])
+        if option >= decision_maker.decision_options_count:
+            return None
+        if key['rated_factor'] is None:
+            return decision_maker.decision_options_list[option]
+        factor = int(key['rated_factor'])
+        if factor >= decision_maker.evaluation_factors_count:
+            return None
+        return int(decision_maker.decision_options_evaluation_array[factor, option])
+    if key['factor'] is not None:
+        factor = int(key['factor'])
+        if factor >= decision_maker.evaluation_factors_count:
+            return None
+        if key['importance']:
+            return int(decision_maker.evaluation_factor_importance_array[factor])
+        return decision_maker.evaluation_factors_list[factor]
+    return getattr(decision_maker, key[0])
+
+
+def decision_widget_states(decision_maker: DecisionMaker) -> list[tuple[str, Any]]:
+    """Decision input widget keys in the session with their value in the decision maker."""
+    return [
+        (match[0], decision_widget_value(decision_maker, match))
+        for match in map(decision_widget_key_pattern.fullmatch, list(st.session_state.keys())) if match
+    ]
 
-pd.options.plotting.backend = "plotly"
-streamlit_config = parse_toml(".streamlit/config.toml")
-cmap = LinearSegmentedColormap.from_list(
-    "bggradient", [streamlit_config['theme']['backgroundColor'], streamlit_config['theme']['primaryColor']])
-plotly_cmap = px.colors.sequential.Tealgrn  # https://plotly.com/python/builtin-colorscales/
 
 def update_session_state_from_decision_maker(decision_maker: DecisionMaker):
-    st.session_state['decision_options_count'] = decision_maker.decision_options_count
-    for decision_option_number in range(st.session_state['decision_options_count']):
-        st.session_state[f'option_{decision_option_number}'] = decision_maker.decision_options_list[
-            decision_option_number]
-    st.session_state['evaluation_factors_count'] = decision_maker.evaluation_factors_count
-    for evaluation_factor_number in range(st.session_state['evaluation_factors_count']):
-        st.session_state[f'factor_{evaluation_factor_number}'] = decision_maker.evaluation_factors_list[
-            evaluation_factor_number]
-        st.session_state[f'factor_{evaluation_factor_number}_importance'] = \
-            decision_maker.evaluation_factor_importance_dict[
-                decision_maker.evaluation_factors_list[evaluation_factor_number]]
-        for decision_option_number in range(st.session_state['decision_options_count']):
-            st.session_state[
-                f"option_{decision_option_number}_factor_{evaluation_factor_number}"
-            ] = decision_maker.decision_options_evaluation_dict[
-                decision_maker.decision_options_list[decision_option_number]
-            ][
-                decision_maker.evaluation_factors_list[evaluation_factor_number]
-            ]
+    """
+    Sync the decision input widget keys in the session with the decision maker.
+
+    Only keys whose value changed are written and keys of removed options and factors are deleted;
+    keys that are not in the session yet are derived when their widget is rendered.
+    """
+    for key, value in decision_widget_states(decision_maker):
+        if value is None:
+            del st.session_state[key]
+        elif st.session_state[key] != value:
+            st.session_state[key] = value
+
+
+def remove_stale_widget_state(decision_maker: DecisionMaker):
+    """Delete the widget keys of options and factors removed during the run, which is too late to sync the others."""
+    for key, value in decision_widget_states(decision_maker):
+        if value is None:
+            del st.session_state[key]
 
 
 def reset_data_editors():
     st.session_state.data_editor_version += 1
+    st.session_state.pop("table_edits_error", None)
+
+
+def undo_changes():
+    decision_maker.undo()
+    update_session_state_from_decision_maker(decision_maker)
+    reset_data_editors()
+
+
+def redo_changes():
+    decision_maker.redo()
+    update_session_state_from_decision_maker(decision_maker)
+    reset_data_editors()
+
+
+def table_edits_decision_df(
+        edited_decision_options_df: pd.DataFrame,
+        edited_evaluation_factors_df: pd.DataFrame,
+        edited_decision_options_evaluation_df: pd.DataFrame,
+        edited_evaluation_factor_importance_df: pd.DataFrame,
+        **_,
+) -> pd.DataFrame:
+    """The table edits as one decision dataframe, labelled with the edited decision options and evaluation factors."""
+    evaluation_factors_list = edited_evaluation_factors_df["Evaluation factor"].tolist()
+    # Rows below the evaluation factors, like the score row, are not edits.
+    ratings = edited_decision_options_evaluation_df.iloc[:len(evaluation_factors_list)].to_numpy()
+    importance = edited_evaluation_factor_importance_df["Importance"].to_numpy()
+    return pd.DataFrame(
+        np.column_stack([importance, ratings]),
+        index=evaluation_factors_list,
+        columns=["Importance", *edited_decision_options_df["Decision option"].tolist()],
+    )
+
+
+def save_changes(table_edits: dict[str, pd.DataFrame]):
+    # Every edit is validated before any is saved, so invalid edits do not leave a partial save behind.
+    result = DecisionMaker.check_decision_dataframe(table_edits_decision_df(**table_edits))
+    if not result.is_valid:
+        st.session_state.table_edits_error = result.message
+        return
+    st.session_state.pop("table_edits_error", None)
+    with decision_maker.batch():
+        _save_changes(**table_edits)
+    update_session_state_from_decision_maker(decision_maker)
 
 
-def save_changes():
+def _save_changes(
+        decision_options_df: pd.DataFrame,
+        edited_decision_options_df: pd.DataFrame,
+        evaluation_factors_df: pd.DataFrame,
+        edited_evaluation_factors_df: pd.DataFrame,
+        edited_decision_options_evaluation_df: pd.DataFrame,
+        edited_evaluation_factor_importance_df: pd.DataFrame,
+):
     if not edited_decision_options_df.equals(decision_options_df):
         decision_maker.set_decision_options_with_list(
             edited_decision_options_df["Decision option"].tolist()
@@ -54,19 +149,41 @@ def save_changes():
         )
         edited_decision_options_evaluation_df.index = edited_evaluation_factors_df["Evaluation factor"].tolist()
         edited_evaluation_factor_importance_df.index = edited_evaluation_factors_df["Evaluation factor"].tolist()
-    if not edited_decision_options_evaluation_df.equals(decision_maker.decision_options_evaluation_df):
-        decision_maker.set_decision_options_evaluation_df(edited_decision_options_evaluation_df)
-    if not edited_evaluation_factor_importance_df.equals(decision_maker.evaluation_factor_importance_df):
-        decision_maker.set_evaluation_factor_importance_df(edited_evaluation_factor_importance_df)
-    update_session_state_from_decision_maker(decision_maker)
+    decision_maker.update_decision_options_evaluation_from_df(edited_decision_options_evaluation_df)
+    decision_maker.update_evaluation_factor_importance_from_df(edited_evaluation_factor_importance_df)
 
 
-def expander(section_label: str):
-    label_in_snake_case = snake_case(section_label)
-    return st.expander(
-        section_label,
-        expanded=st.session_state.progress_tracker.check(label_in_snake_case),
+def decision_file_preview(decision_data_file, rows: int) -> pd.DataFrame:
+    """The first rows of a binary decision file, laid out like `DecisionMaker.to_dataframe`, without loading it."""
+    header, ratings, importance = read_decision_file(decision_data_file)
+    preview = pd.DataFrame(
+        ratings[:rows],
+        index=pd.Index(header['evaluation_factors_list'][:rows], name=header.get('decision')),
+        columns=header['decision_options_list'],
     )
+    preview.insert(len(preview.columns), "Importance", importance[:rows], allow_duplicates=True)
+    return preview
+
+
+def render_section(section_label: str, render: Callable[[], Any]):
+    """
+    Render an app section in its expander while the section is unfolded.
+
+    Folded sections only render a button to open them: their widgets, scores and charts are not built,
+    so a rerun only costs as much as the unfolded sections.
+    """
+    label_in_snake_case = snake_case(section_label)
+    unfolded = progress_tracker.check(label_in_snake_case)
+    with st.expander(section_label, expanded=unfolded):
+        if unfolded:
+            render()
+        else:
+            st.button(
+                "Open section",
+                key=f"{label_in_snake_case}_open_button",
+                on_click=open_section,
+                args=[section_label],
+            )
 
 
 def next_button(section_label: str):
@@ -113,6 +230,10 @@ def previous_section(section: str):
     progress_tracker.back()
 
 
+def open_section(section_label: str):
+    progress_tracker.step_set_active(snake_case(section_label))
+
+
 def navigate_to_section(section_label: str):
     progress_tracker.focus(snake_case(section_label))
 
@@ -120,221 +241,169 @@ def navigate_to_section(section_label: str):
 def fold_all_sections(fold: bool = True):
     progress_tracker.steps_set_active(progress_tracker.steps, not fold)
 
-###########################
-### Configuration Setup ###
-###########################
+################
+### Sections ###
+################
 
-st.set_page_config(
-    page_title="Decision Maker",
-    page_icon=":brain:", layout="wide",
-    initial_sidebar_state="collapsed",
-    menu_items=None
-)
-
-section_labels = [
-    'Decision',
-    'Decision options',
-    'Evaluation factors',
-    'Evaluation factor importance',
-    'Decision options evaluation',
-    'Table editor',
-    'Final decision inputs',
-    'Decision scores',
-    'Decision analysis',
-]
-section_index = 0
-
-if 'debug_mode' not in st.session_state:
-    st.session_state.debug_mode = False
-debug_mode = st.session_state.debug_mode
-
-# debug_mode = st.toggle("Enable debug mode")
-
-if 'decision_maker' in st.session_state:
-    decision_maker = st.session_state['decision_maker']
-    if debug_mode:
-        st.write("*Using pre-loaded decision maker object.*")
-else:
-    decision_maker = DecisionMaker()
-    decision_maker.set_attributes_from(default_decision_maker)
-    st.session_state['decision_maker'] = decision_maker
-    if debug_mode:
-        st.write("*Using default decision maker object.*")
-    update_session_state_from_decision_maker(decision_maker)
-
-if 'progress_tracker' in st.session_state:
-    progress_tracker = st.session_state['progress_tracker']
-    if debug_mode:
-        st.write("*Using pre-loaded progress tracker object.*")
-else:
-    progress_tracker = ProgressTracker(steps=[snake_case(s) for s in section_labels])
-    st.session_state['progress_tracker'] = progress_tracker
-    if debug_mode:
-        st.write("*Using default progress tracker object.*")
-
-if 'data_editor_version' not in st.session_state:
-    st.session_state.data_editor_version = 0
-
-############################
-### Production Front End ###
-############################
-
-st.title("Welcome to Decision Assistant!")
-st.write("This app helps you make decisions by understanding your values, "
-         "their importance and how each option aligns with those.")
-
-# Debug mode section
-if debug_mode:
-
-    col1, col2 = st.columns([1, 6])
-
-    with col1:
-        if st.button("Use default values"):
-            decision_maker.set_attributes_from(default_decision_maker)
-            update_session_state_from_decision_maker(decision_maker)
-    with col2:
-        if st.button("Use mockup values"):
-            decision_maker.set_attributes_from(example_decision_maker)
-            update_session_state_from_decision_maker(decision_maker)
-
-    col1, col2 = st.columns([1, 1])
-    with col1:
-        st.write("Decision maker representation:")
-        st.json(decision_maker.to_dict(), expanded=False)
-    with col2:
-        st.write("Progress tracker representation:")
-        st.json(progress_tracker.to_dict(), expanded=False)
-
-# Sidebar
-with st.sidebar:
-    with st.expander("Quick navigation"):
-        if st.button("Fold all sections", key='fold_all_sections_button'):
-            fold_all_sections(True)
-        st.write('---')
-        for section in section_labels:
-            st.button(section, on_click=navigate_to_section, args=[section])
-        st.write('---')
-        if st.button("Unfold all sections", key='unfold_all_sections_button'):
-            fold_all_sections(False)
-
-    with st.expander("Decision data download"):
-        file_type = st.selectbox("File type", list(decision_maker.save_options.keys()))
-        st.download_button(
-            "Download decision data",
-            decision_maker.save_options[file_type],
-            f"decision_assistant_data.{file_type}",
-            f"text/{file_type}",
-            key='download_decision_data'
-        )
-
-    with st.expander("Decision data upload"):
-        decision_data_file = st.file_uploader(
-            "Upload decision data",
-            type=["csv", "xlsx"],
-            key="upload_decision_data"
-        )
-        if decision_data_file:
-            if decision_data_file.name.endswith(".csv"):
-                decision_data = pd.read_csv(decision_data_file, index_col=0)
-            elif decision_data_file.name.endswith(".xlsx"):
-                decision_data = pd.read_excel(decision_data_file, index_col=0)
-            st.write("Data preview")
-            st.dataframe(decision_data)
-            if st.button("Update decision data"):
-                error_message = decision_maker.from_dataframe(decision_data, errors="message")
-                if error_message:
-                    st.error(error_message)
-                else:
-                    update_session_state_from_decision_maker(decision_maker)
-                    st.success("Decision data successully updated.")
-        else:
-            st.write("No data uploaded")
-
-# Main section
-st.header("Decision inputs")
-with expander(section_labels[0]):
+def decision_section():
+    derive_widget_state("decision", decision_maker.decision)
     decision_maker.set_decision(
-        st.text_input("What decision do you need to make?",
-                      "What is the best way to take decisions?")
+        st.text_input("What decision do you need to make?", key="decision")
     )
     next_button(section_labels[0])
 
-with expander(section_labels[1]):
+
+def decision_options_section():
+    derive_widget_state("decision_options_count", decision_maker.decision_options_count)
     decision_maker.set_decision_options_count(
         st.number_input("How many options do you have?",
                         key="decision_options_count", min_value=2)
     )
     for i in range(decision_maker.decision_options_count):
-        decision_maker.set_decision_option(
-            i,
-            st.text_input(
-                f"Option {i + 1}",
-                value=decision_maker.decision_options_list[i],
-                key=f"option_{i}"
+        derive_widget_state(f"option_{i}", decision_maker.decision_options_list[i])
+        try:
+            decision_maker.set_decision_option(
+                i,
+                st.text_input(
+                    f"Option {i + 1}",
+                    key=f"option_{i}"
+                )
             )
-        )
+        except InvalidInputError as error:
+            st.error(error)
     next_and_back_buttons(section_labels[1])
 
-with expander(section_labels[2]):
+
+def evaluation_factors_section():
     st.write("To evaluate each option, we need to understand the evaluation factors of the best decision.")
+    derive_widget_state("evaluation_factors_count", decision_maker.evaluation_factors_count)
     decision_maker.set_evaluation_factors_count(
         st.number_input("How many evaluation factors are important?",
                         key="evaluation_factors_count", min_value=1)
     )
     for i in range(decision_maker.evaluation_factors_count):
-        decision_maker.set_evaluation_factor(
-            i,
-            st.text_input(
-                f"Factor {i + 1}",
-                decision_maker.evaluation_factors_list[i],
-                key=f"factor_{i}"
+        derive_widget_state(f"factor_{i}", decision_maker.evaluation_factors_list[i])
+        try:
+            decision_maker.set_evaluation_factor(
+                i,
+                st.text_input(
+                    f"Factor {i + 1}",
+                    key=f"factor_{i}"
+                )
             )
-        )
+        except InvalidInputError as error:
+            st.error(error)
     next_and_back_buttons(section_labels[2])
 
-with expander(section_labels[3]):
+
+def evaluation_factor_importance_section():
     st.write("Rate importance of each evaluation factor with a number from 0 to 10 "
              "where 0 is the least important and 10 is the most important.")
     for i in range(decision_maker.evaluation_factors_count):
         evaluation_factor = decision_maker.evaluation_factors_list[i]
+        derive_widget_state(f"factor_{i}_importance", int(decision_maker.evaluation_factor_importance_array[i]))
         decision_maker.set_evaluation_factor_importance(
             i,
             st.number_input(
                 f"Importance of {evaluation_factor}",
                 key=f"factor_{i}_importance",
-                value=DecisionMaker.DEFAULT_EVALUATION_FACTOR_IMPORTANCE,
                 min_value=DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE,
                 max_value=DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE,
             )
         )
     next_and_back_buttons(section_labels[3])
 
-with expander(section_labels[4]):
+
+def rating_grid_page_input(label: str, key: str, count: int, page_size: int) -> range:
+    """Render a page number input of the rating grid and return the numbers on its page."""
+    pages = max(-(-count // page_size), 1)
+    # The page is kept in range when decision options or evaluation factors are removed.
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    derive_widget_state(key, 1)
+    page = st.number_input(f"{label} (of {pages})", key=key, min_value=1, max_value=pages)
+    return range((page - 1) * page_size, min(page * page_size, count))
+
+
+def jump_to_decision_option():
+    decision_option = st.session_state.rating_grid_decision_option
+    if decision_option is not None:
+        decision_option_number = decision_maker.decision_option_index[decision_option]
+        st.session_state.rating_grid_options_page = decision_option_number // rating_grid_options_per_page + 1
+
+
+def jump_to_evaluation_factor():
+    evaluation_factor = st.session_state.rating_grid_evaluation_factor
+    if evaluation_factor is not None:
+        evaluation_factor_number = decision_maker.evaluation_factor_index[evaluation_factor]
+        st.session_state.rating_grid_factors_page = evaluation_factor_number // rating_grid_factors_per_page + 1
+
+
+def rating_grid_window() -> tuple[range, range]:
+    """
+    Render the page inputs and the jump-to-cell navigator of the paged rating grid.
+
+    Returns the evaluation factor and decision option numbers of the visible window.
+    """
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        evaluation_factor_numbers = rating_grid_page_input(
+            "Evaluation factors page", "rating_grid_factors_page",
+            decision_maker.evaluation_factors_count, rating_grid_factors_per_page)
+    with col2:
+        decision_option_numbers = rating_grid_page_input(
+            "Decision options page", "rating_grid_options_page",
+            decision_maker.decision_options_count, rating_grid_options_per_page)
+    with col3:
+        st.selectbox(
+            "Jump to evaluation factor",
+            decision_maker.evaluation_factors_list,
+            index=None,
+            key="rating_grid_evaluation_factor",
+            on_change=jump_to_evaluation_factor,
+        )
+    with col4:
+        st.selectbox(
+            "Jump to decision option",
+            decision_maker.decision_options_list,
+            index=None,
+            key="rating_grid_decision_option",
+            on_change=jump_to_decision_option,
+        )
+    return evaluation_factor_numbers, decision_option_numbers
+
+
+def decision_options_evaluation_section():
     st.write("Rate each evaluation factor for each decision option with a number from 0 to 10 "
              "where 0 is the least favorable and 10 is the most favorable.")
-    col1, col2 = st.columns([1, 3])
-    for evaluation_factor_number in range(decision_maker.evaluation_factors_count):
+    evaluation_factor_numbers = range(decision_maker.evaluation_factors_count)
+    decision_option_numbers = range(decision_maker.decision_options_count)
+    # Large decisions are rated page by page: only the ratings of the visible window get widgets.
+    derive_widget_state(
+        "rating_grid_paged", len(evaluation_factor_numbers) * len(decision_option_numbers) > rating_grid_max_cells)
+    if st.toggle("Show the ratings page by page", key="rating_grid_paged"):
+        evaluation_factor_numbers, decision_option_numbers = rating_grid_window()
+    for evaluation_factor_number in evaluation_factor_numbers:
         evaluation_factor = decision_maker.evaluation_factors_list[evaluation_factor_number]
-        for decision_option_number, col in zip(
-                range(decision_maker.decision_options_count),
-                st.columns(decision_maker.decision_options_count)
-        ):
+        for decision_option_number, col in zip(decision_option_numbers, st.columns(len(decision_option_numbers))):
             decision_option = decision_maker.decision_options_list[decision_option_number]
             with col:
+                key = f"option_{decision_option_number}_factor_{evaluation_factor_number}"
+                derive_widget_state(key, int(decision_maker.decision_options_evaluation_array[
+                    evaluation_factor_number, decision_option_number]))
                 decision_maker.set_decision_options_evaluation(
                     decision_option_number, evaluation_factor_number,
                     st.number_input(
                         f"{evaluation_factor} of {decision_option}",
-                        key=f"option_{decision_option_number}"
-                            f"_factor_{evaluation_factor_number}",
-                        value=DecisionMaker.DEFAULT_DECISION_OPTION_VALUE,
+                        key=key,
                         min_value=DecisionMaker.MIN_DECISION_OPTION_VALUE,
                         max_value=DecisionMaker.MAX_DECISION_OPTION_VALUE,
                     )
                 )
     next_and_back_buttons(section_labels[4])
 
-with expander(section_labels[5]):
+
+def table_editor_section():
     st.write("You can quickly edit the inputs in the tabular format here.")
     col1, col2 = st.columns([1, 5])
 
@@ -374,18 +443,35 @@ with expander(section_labels[5]):
             hide_index=True
         )
 
-    col1, col2 = st.columns([1, 5])
+    col1, col2, col3, col4 = st.columns([1, 1, 1, 3])
     with col1:
         if st.button("Revert changes"):
             reset_data_editors()
             st.rerun()
 
     with col2:
-        if st.button("Save changes", on_click=save_changes):
+        table_edits = dict(
+            decision_options_df=decision_options_df,
+            edited_decision_options_df=edited_decision_options_df,
+            evaluation_factors_df=evaluation_factors_df,
+            edited_evaluation_factors_df=edited_evaluation_factors_df,
+            edited_decision_options_evaluation_df=edited_decision_options_evaluation_df,
+            edited_evaluation_factor_importance_df=edited_evaluation_factor_importance_df,
+        )
+        if st.button("Save changes", on_click=save_changes, args=[table_edits]):
             st.rerun()
+
+    with col3:
+        st.button("Undo", on_click=undo_changes, disabled=not decision_maker.history.can_undo)
+
+    with col4:
+        st.button("Redo", on_click=redo_changes, disabled=not decision_maker.history.can_redo)
+    if "table_edits_error" in st.session_state:
+        st.error(st.session_state.table_edits_error)
     next_and_back_buttons(section_labels[5])
 
-with expander(section_labels[6]):
+
+def final_decision_inputs_section():
     st.write("This is the final input the decision scores will be calculated on.")
 
     col1, col2 = st.columns([1, 5])
@@ -399,20 +485,27 @@ with expander(section_labels[6]):
         st.dataframe(decision_maker.decision_options_evaluation_df)
     next_and_back_buttons(section_labels[6])
 
-st.header("Decision outputs")
 
-with expander(section_labels[7]):
+def decision_scores_section():
     decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
     decision_maker.compute_decision_score()
 
+    scoring_engines = {engine.label: name for name, engine in decision_maker.scoring_engines.items()}
+    scoring_engine = scoring_engines[st.selectbox("Scoring method", list(scoring_engines), key="scoring_engine")]
+    # The decision score is the weighted sum, other engines are scored on demand and cached by version.
+    result = None if scoring_engine == 'weighted_sum' else decision_maker.score(scoring_engine)
     st.plotly_chart(
-        decision_maker.plot_score(),
+        decision_maker.plot_score(result=result),
         use_container_width=True,
         color_discrete_sequence=plotly_cmap,
     )
     next_and_back_buttons(section_labels[7])
 
-with expander(section_labels[8]):
+
+def decision_analysis_section():
+    # The scores section may be folded, both computations are cached by version.
+    decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+    decision_maker.compute_decision_score()
     st.subheader("Importance factor values by decision option")
 
     tab1, tab2 = st.tabs([
@@ -452,4 +545,174 @@ with expander(section_labels[8]):
         )
     back_button(section_labels[8])
 
+
+###########################
+### Configuration Setup ###
+###########################
+
+st.set_page_config(
+    page_title="Decision Maker",
+    page_icon=":brain:", layout="wide",
+    initial_sidebar_state="collapsed",
+    menu_items=None
+)
+
+section_labels = [
+    'Decision',
+    'Decision options',
+    'Evaluation factors',
+    'Evaluation factor importance',
+    'Decision options evaluation',
+    'Table editor',
+    'Final decision inputs',
+    'Decision scores',
+    'Decision analysis',
+]
+section_index = 0
+upload_preview_rows = 50
+# The rating grid is paged by default above this many cells.
+rating_grid_max_cells = 100
+rating_grid_factors_per_page = 10
+rating_grid_options_per_page = 8
+
+if 'debug_mode' not in st.session_state:
+    st.session_state.debug_mode = False
+debug_mode = st.session_state.debug_mode
+
+# debug_mode = st.toggle("Enable debug mode")
+
+if 'decision_maker' in st.session_state:
+    decision_maker = st.session_state['decision_maker']
+    if debug_mode:
+        st.write("*Using pre-loaded decision maker object.*")
+else:
+    decision_maker = DecisionMaker()
+    set_attributes_from_default(decision_maker)
+    decision_maker.history.clear()
+    limit_session_history(decision_maker)
     st.session_state['decision_maker'] = decision_maker
+    if debug_mode:
+        st.write("*Using default decision maker object.*")
+    update_session_state_from_decision_maker(decision_maker)
+
+if 'progress_tracker' in st.session_state:
+    progress_tracker = st.session_state['progress_tracker']
+    if debug_mode:
+        st.write("*Using pre-loaded progress tracker object.*")
+else:
+    progress_tracker = ProgressTracker(steps=[snake_case(s) for s in section_labels])
+    st.session_state['progress_tracker'] = progress_tracker
+    if debug_mode:
+        st.write("*Using default progress tracker object.*")
+
+if 'data_editor_version' not in st.session_state:
+    st.session_state.data_editor_version = 0
+
+############################
+### Production Front End ###
+############################
+
+st.title("Welcome to Decision Assistant!")
+st.write("This app helps you make decisions by understanding your values, "
+         "their importance and how each option aligns with those.")
+
+# Debug mode section
+if debug_mode:
+
+    col1, col2 = st.columns([1, 6])
+
+    with col1:
+        if st.button("Use default values"):
+            set_attributes_from_default(decision_maker)
+            update_session_state_from_decision_maker(decision_maker)
+    with col2:
+        if st.button("Use mockup values"):
+            set_attributes_from_example(decision_maker)
+            update_session_state_from_decision_maker(decision_maker)
+
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.write("Decision maker representation:")
+        st.json(decision_maker.to_dict(), expanded=False)
+    with col2:
+        st.write("Progress tracker representation:")
+        st.json(progress_tracker.to_dict(), expanded=False)
+    st.write("Session memory usage in bytes:")
+    st.json(session_memory_usage(st.session_state), expanded=False)
+
+# Sidebar
+with st.sidebar:
+    with st.expander("Quick navigation"):
+        if st.button("Fold all sections", key='fold_all_sections_button'):
+            fold_all_sections(True)
+        st.write('---')
+        for section in section_labels:
+            st.button(section, on_click=navigate_to_section, args=[section])
+        st.write('---')
+        if st.button("Unfold all sections", key='unfold_all_sections_button'):
+            fold_all_sections(False)
+
+    with st.expander("Decision data download"):
+        file_type = st.selectbox("File type", list(decision_maker.save_options.keys()))
+        st.download_button(
+            "Download decision data",
+            decision_maker.save_options[file_type],
+            f"decision_assistant_data.{file_type}",
+            "application/octet-stream" if file_type == DECISION_FILE_EXTENSION else f"text/{file_type}",
+            key='download_decision_data'
+        )
+
+    with st.expander("Decision data upload"):
+        decision_data_file = st.file_uploader(
+            "Upload decision data",
+            type=["csv", "xlsx", DECISION_FILE_EXTENSION],
+            key="upload_decision_data"
+        )
+        if decision_data_file:
+            # Only the preview rows are parsed here, the full file is streamed into the decision maker on update.
+            if decision_data_file.name.endswith(".csv"):
+                decision_data_preview = pd.read_csv(decision_data_file, index_col=0, nrows=upload_preview_rows)
+                load_decision_data = decision_maker.from_csv
+            elif decision_data_file.name.endswith(".xlsx"):
+                decision_data_preview = pd.read_excel(decision_data_file, index_col=0, nrows=upload_preview_rows)
+                load_decision_data = decision_maker.from_excel
+            elif decision_data_file.name.endswith(f".{DECISION_FILE_EXTENSION}"):
+                try:
+                    decision_data_preview = decision_file_preview(decision_data_file, upload_preview_rows)
+                except DecisionFileError as e:
+                    decision_data_preview = None
+                    st.error(str(e))
+                load_decision_data = decision_maker.from_binary
+            if decision_data_preview is not None:
+                st.write("Data preview")
+                st.dataframe(decision_data_preview)
+            if st.button("Update decision data"):
+                decision_data_file.seek(0)
+                error_message = load_decision_data(decision_data_file, errors="message")
+                if error_message:
+                    st.error(error_message)
+                else:
+                    update_session_state_from_decision_maker(decision_maker)
+                    st.success("Decision data successully updated.")
+        else:
+            st.write("No data uploaded")
+
+# Main section
+st.header("Decision inputs")
+render_section(section_labels[0], decision_section)
+render_section(section_labels[1], decision_options_section)
+render_section(section_labels[2], evaluation_factors_section)
+render_section(section_labels[3], evaluation_factor_importance_section)
+render_section(section_labels[4], decision_options_evaluation_section)
+render_section(section_labels[5], table_editor_section)
+render_section(section_labels[6], final_decision_inputs_section)
+
+st.header("Decision outputs")
+render_section(section_labels[7], decision_scores_section)
+render_section(section_labels[8], decision_analysis_section)
+
+st.session_state['decision_maker'] = decision_maker
+remove_stale_widget_state(decision_maker)
+
+# Derived state is rebuilt on the next run when needed, idle sessions only keep the compact decision.
+decision_maker.compact()
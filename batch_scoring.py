@@ -0,0 +1,130 @@
+"""
+Headless batch scoring of decision files.
+
+Loads every CSV, XLSX or binary decision file matching the given glob patterns, scores each decision
+and writes one ranking table with a row per decision option of every file:
+
+    python batch_scoring.py "decisions/**/*.csv" --output rankings.csv --jobs 8
+
+Files are scored in parallel on a process pool. A file that fails to load or score is reported
+with its error and does not stop the other files; the exit code is 1 when any file failed.
+"""
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+import pandas as pd
+
+from decision_file import DECISION_FILE_EXTENSION
+from decision_maker import DecisionMaker
+
+RANKING_COLUMNS = ["File", "Decision", "Decision option", "Score", "Rank"]
+ERROR_COLUMNS = ["File", "Error"]
+DECISION_FILE_LOADERS = {
+    ".csv": DecisionMaker.from_csv,
+    ".xlsx": DecisionMaker.from_excel,
+    f".{DECISION_FILE_EXTENSION}": DecisionMaker.from_binary,
+}
+
+
+def find_decision_files(patterns: Iterable[str]) -> list[str]:
+    """Expand glob patterns (`**` matches nested directories) to the sorted decision files they match."""
+    return sorted({
+        path
+        for pattern in patterns
+        for path in glob.glob(pattern, recursive=True)
+        if os.path.splitext(path)[1].lower() in DECISION_FILE_LOADERS
+    })
+
+
+def score_decision_file(path: str) -> tuple[str, Union[list[tuple], None], Union[str, None]]:
+    """
+    Load and score one decision file.
+
+    Returns
+    -------
+    tuple[str, list[tuple] | None, str | None]
+        The path, ranking rows of its decision options or None, and an error message or None.
+    """
+    try:
+        decision_maker = DecisionMaker()
+        load = DECISION_FILE_LOADERS[os.path.splitext(path)[1].lower()]
+        error_message = load(decision_maker, path, errors="message")
+        if error_message:
+            return path, None, error_message
+        decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        decision_maker.compute_decision_score()
+        scores = decision_maker.decision_options_evaluation_df.loc['Score']
+        ranks = scores.rank(method='min', ascending=False)
+        # Decisions without any importance have no scores, their options are listed without a rank.
+        return path, [
+            (path, decision_maker.decision, decision_option, scores[decision_option],
+             None if np.isnan(ranks[decision_option]) else int(ranks[decision_option]))
+            for decision_option in scores.sort_values(ascending=False, kind='stable').index
+        ], None
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def score_decision_files(paths: list[str], n_jobs: int = 1, chunksize: int = 16) -> Iterator[tuple]:
+    """Yield the result of `score_decision_file` for every path, in order, scoring on `n_jobs` processes."""
+    if n_jobs == 1:
+        yield from map(score_decision_file, paths)
+        return
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        yield from executor.map(score_decision_file, paths, chunksize=chunksize)
+
+
+def run_batch_scoring(
+        paths: list[str],
+        n_jobs: int = 1,
+        progress: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Score decision files into a consolidated ranking table and a table of the files that failed.
+    """
+    rankings = []
+    errors = []
+    for done, (path, rows, error_message) in enumerate(score_decision_files(paths, n_jobs), start=1):
+        if error_message:
+            errors.append((path, error_message))
+        else:
+            rankings.extend(rows)
+        if progress:
+            print(f"\rScored {done}/{len(paths)} files, {len(errors)} failed", end="", file=sys.stderr)
+    if progress and paths:
+        print(file=sys.stderr)
+    return pd.DataFrame(rankings, columns=RANKING_COLUMNS), pd.DataFrame(errors, columns=ERROR_COLUMNS)
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Score decision files and write a consolidated ranking table.")
+    parser.add_argument("patterns", nargs="+",
+                        help="Glob patterns of CSV, XLSX or binary decision files, `**` matches nested directories.")
+    parser.add_argument("--output", help="Path of the ranking table CSV, standard output by default.")
+    parser.add_argument("--errors", help="Path of a CSV listing the files that failed with their error.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Number of scoring processes.")
+    parser.add_argument("--no-progress", action="store_true", help="Do not report progress on standard error.")
+    args = parser.parse_args(argv)
+
+    paths = find_decision_files(args.patterns)
+    if not paths:
+        print("No decision files match the given patterns.", file=sys.stderr)
+        return 1
+
+    rankings_df, errors_df = run_batch_scoring(paths, max(args.jobs, 1), progress=not args.no_progress)
+
+    rankings_df.to_csv(args.output or sys.stdout, index=False)
+    if args.errors:
+        errors_df.to_csv(args.errors, index=False)
+    for path, error_message in errors_df.itertuples(index=False):
+        print(f"Failed to score {path}: {error_message}", file=sys.stderr)
+    return 1 if len(errors_df) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""
+Benchmark suite for the DecisionMaker hot paths.
+
+Times every benchmark for square decisions of growing size, optionally saves the timings
+as a JSON baseline and fails when a timing regresses past a threshold against a baseline:
+
+    python benchmark.py --save-baseline benchmark_baseline.json
+    python benchmark.py --baseline benchmark_baseline.json --threshold 0.25
+
+Startup is benchmarked by importing the modules the app imports in a fresh interpreter.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from decision_maker import DecisionMaker
+from group_decision import GroupDecision
+
+DEFAULT_SIZES = [2, 10, 100, 1000]
+STARTUP_MODULES = ["decision_maker", "decision_maker_defaults", "decision_maker_mockup", "progress_tracker", "utils"]
+# Plotting and Excel dependencies are imported on first use, never at startup.
+LAZY_MODULES = ["plotly", "matplotlib", "openpyxl", "xlsxwriter"]
+
+
+def example_attributes(size: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    decision_options_list = [f"Option {i + 1}" for i in range(size)]
+    evaluation_factors_list = [f"Factor {k + 1}" for k in range(size)]
+    ratings = rng.integers(DecisionMaker.MIN_DECISION_OPTION_VALUE, DecisionMaker.MAX_DECISION_OPTION_VALUE + 1,
+                           size=(size, size)).tolist()
+    importance = rng.integers(DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE + 1,
+                              DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE + 1, size=size).tolist()
+    return dict(
+        decision="Benchmark decision",
+        decision_options_count=size,
+        decision_options_list=decision_options_list,
+        evaluation_factors_count=size,
+        evaluation_factors_list=evaluation_factors_list,
+        evaluation_factor_importance_dict=dict(zip(evaluation_factors_list, importance)),
+        decision_options_evaluation_dict={
+            decision_option: dict(zip(evaluation_factors_list, [row[i] for row in ratings]))
+            for i, decision_option in enumerate(decision_options_list)
+        },
+    )
+
+
+def example_decision_maker(size: int) -> DecisionMaker:
+    decision_maker = DecisionMaker()
+    decision_maker.set_attributes(**example_attributes(size))
+    return decision_maker
+
+
+def scored_decision_maker(size: int) -> DecisionMaker:
+    decision_maker = example_decision_maker(size)
+    decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+    decision_maker.compute_decision_score()
+    return decision_maker
+
+
+def edited_decision_options_evaluation_df(size: int) -> tuple[DecisionMaker, pd.DataFrame]:
+    decision_maker = example_decision_maker(size)
+    df = decision_maker.decision_options_evaluation_df.copy()
+    df.iloc[0, 0] = (df.iloc[0, 0] + 1) % (DecisionMaker.MAX_DECISION_OPTION_VALUE + 1)
+    return decision_maker, df
+
+
+def example_group_decision(size: int, raters_count: int = 50) -> GroupDecision:
+    decision_maker = example_decision_maker(size)
+    rng = np.random.default_rng(0)
+    group_decision = GroupDecision(decision_maker.decision_options_list, decision_maker.evaluation_factors_list)
+    for rater in range(raters_count):
+        group_decision.add_rater(
+            f"Rater {rater}",
+            rng.integers(DecisionMaker.MIN_DECISION_OPTION_VALUE, DecisionMaker.MAX_DECISION_OPTION_VALUE + 1,
+                         size=(size, size)),
+            rng.integers(DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE,
+                         DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE + 1, size=size),
+        )
+    return group_decision
+
+
+def import_in_fresh_interpreter(modules: list[str]) -> list[str]:
+    """Import `modules` in a new Python process and return the `LAZY_MODULES` the import loaded."""
+    code = (f"import sys; import {', '.join(modules)}; "
+            f"print(' '.join(module for module in {LAZY_MODULES!r} if module in sys.modules))")
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    return completed.stdout.split()
+
+
+def compute_scores(decision_maker: DecisionMaker):
+    decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+    decision_maker.compute_decision_score()
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    # Sizes above `max_size` are skipped unless the full suite is requested.
+    max_size: int = max(DEFAULT_SIZES)
+
+
+BENCHMARKS = [
+    # Startup does not depend on the decision size, it is only timed at the smallest size.
+    Benchmark(
+        "import_startup_modules",
+        lambda size: STARTUP_MODULES,
+        import_in_fresh_interpreter,
+        max_size=min(DEFAULT_SIZES),
+    ),
+    Benchmark(
+        "set_attributes",
+        lambda size: example_attributes(size),
+        lambda attributes: DecisionMaker().set_attributes(**attributes),
+    ),
+    Benchmark(
+        "set_decision_options_evaluation_with_dict",
+        lambda size: (example_decision_maker(size), example_attributes(size, seed=1)),
+        lambda state: state[0].set_decision_options_evaluation_with_dict(
+            state[1]['decision_options_evaluation_dict']),
+    ),
+    Benchmark(
+        "update_decision_options_evaluation_from_df",
+        edited_decision_options_evaluation_df,
+        lambda state: state[0].update_decision_options_evaluation_from_df(state[1]),
+    ),
+    Benchmark(
+        "update_evaluation_factors_count",
+        example_decision_maker,
+        lambda decision_maker: decision_maker.set_evaluation_factors_count(
+            max(decision_maker.evaluation_factors_count // 2, 1)),
+    ),
+    Benchmark(
+        "from_dataframe",
+        lambda size: example_decision_maker(size).to_dataframe(),
+        lambda df: DecisionMaker().from_dataframe(df),
+    ),
+    Benchmark(
+        "compute_decision_score",
+        example_decision_maker,
+        compute_scores,
+    ),
+    Benchmark(
+        "score_topsis",
+        example_decision_maker,
+        lambda decision_maker: decision_maker.score('topsis'),
+    ),
+    Benchmark(
+        "score_promethee_ii",
+        example_decision_maker,
+        lambda decision_maker: decision_maker.score('promethee_ii'),
+        max_size=100,
+    ),
+    Benchmark(
+        "group_decision_aggregate_scores",
+        example_group_decision,
+        lambda group_decision: group_decision.aggregate_scores("trimmed_mean"),
+        max_size=100,
+    ),
+    Benchmark(
+        "to_csv",
+        scored_decision_maker,
+        lambda decision_maker: decision_maker.to_csv(),
+    ),
+    Benchmark(
+        "to_excel_writer",
+        scored_decision_maker,
+        lambda decision_maker: decision_maker.to_excel_writer(),
+        max_size=100,
+    ),
+    Benchmark(
+        "style_score_df",
+        scored_decision_maker,
+        lambda decision_maker: decision_maker.style_score_df().to_html(),
+    ),
+    Benchmark(
+        "style_decision_options_evaluation_df",
+        scored_decision_maker,
+        lambda decision_maker: decision_maker.style_decision_options_evaluation_df().to_html(),
+        max_size=100,
+    ),
+    Benchmark(
+        "style_decision_options_evaluation_adj_by_importance_df",
+        scored_decision_maker,
+        lambda decision_maker: decision_maker.style_decision_options_evaluation_adj_by_importance_df().to_html(),
+        max_size=100,
+    ),
+    Benchmark(
+        "plot_score",
+        scored_decision_maker,
+        lambda decision_maker: decision_maker.plot_score(),
+    ),
+    Benchmark(
+        "plot_decision_options_evaluation_df",
+        scored_decision_maker,
+        lambda decision_maker: decision_maker.plot_decision_options_evaluation_df(),
+        max_size=100,
+    ),
+    Benchmark(
+        "plot_decision_options_evaluation_adj_by_importance_df",
+        scored_decision_maker,
+        lambda decision_maker: decision_maker.plot_decision_options_evaluation_adj_by_importance_df(),
+        max_size=100,
+    ),
+]
+
+
+def time_benchmark(benchmark: Benchmark, size: int, repeat: int = 3) -> float:
+    """Return the best of `repeat` timings in seconds, each run on a fresh setup."""
+    timings = []
+    for _ in range(repeat):
+        state = benchmark.setup(size)
+        start = time.perf_counter()
+        benchmark.run(state)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmarks(
+        sizes: list[int] = None,
+        names: list[str] = None,
+        repeat: int = 3,
+        full: bool = False,
+        verbose: bool = False,
+) -> dict[str, dict[str, float]]:
+    results = {}
+    for benchmark in BENCHMARKS:
+        if names and benchmark.name not in names:
+            continue
+        for size in sizes or DEFAULT_SIZES:
+            if size > benchmark.max_size and not full:
+                continue
+            timing = time_benchmark(benchmark, size, repeat)
+            results.setdefault(benchmark.name, {})[str(size)] = timing
+            if verbose:
+                print(f"{benchmark.name:<55} {size:>6} {timing * 1000:>12.3f} ms", file=sys.stderr)
+    return results
+
+
+def find_regressions(
+        results: dict[str, dict[str, float]],
+        baseline: dict[str, dict[str, float]],
+        threshold: float = 0.25,
+        min_seconds: float = 0.001,
+) -> list[str]:
+    """
+    Compare timings to a baseline.
+
+    A timing regresses when it is more than `threshold` slower than the baseline
+    and the slowdown is above `min_seconds`, which ignores noise on very fast paths.
+    """
+    regressions = []
+    for name, timings in results.items():
+        for size, timing in timings.items():
+            baseline_timing = baseline.get(name, {}).get(size)
+            if baseline_timing is None:
+                continue
+            if timing > baseline_timing * (1 + threshold) and timing - baseline_timing > min_seconds:
+                regressions.append(
+                    f"{name} (size {size}): {timing * 1000:.3f} ms vs baseline {baseline_timing * 1000:.3f} ms")
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DecisionMaker hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Decision option and evaluation factor counts to benchmark.")
+    parser.add_argument("--benchmarks", nargs="+", help="Names of the benchmarks to run, all by default.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per timing, the best run is kept.")
+    parser.add_argument("--full", action="store_true", help="Run every benchmark at every size.")
+    parser.add_argument("--save-baseline", help="Path to save the timings to as a JSON baseline.")
+    parser.add_argument("--baseline", help="Path of a JSON baseline to compare the timings to.")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Relative slowdown against the baseline that counts as a regression.")
+    parser.add_argument("--min-seconds", type=float, default=0.001,
+                        help="Absolute slowdown below which a timing never counts as a regression.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.benchmarks, args.repeat, args.full, verbose=True)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({'python': platform.python_version(), 'results': results}, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = find_regressions(results, baseline, args.threshold, args.min_seconds)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import io
+import json
+import os
+import struct
+from typing import Union
+
+import numpy as np
+
+DECISION_FILE_EXTENSION = "dab"
+DECISION_FILE_MAGIC = b"DCSNBIN\0"
+DECISION_FILE_VERSION = 1
+DECISION_FILE_RATINGS_DTYPE = np.dtype('i1')
+DECISION_FILE_IMPORTANCE_DTYPE = np.dtype('<i2')
+
+# Magic, format version and header length.
+_PREAMBLE = struct.Struct(f"<{len(DECISION_FILE_MAGIC)}sII")
+
+
+class DecisionFileError(ValueError):
+    pass
+
+
+def _align(offset: int, alignment: int) -> int:
+    return -(-offset // alignment) * alignment
+
+
+def write_decision_file(
+        decision: str,
+        decision_options_list: list[str],
+        evaluation_factors_list: list[str],
+        evaluation_factor_importance: np.ndarray,
+        decision_options_evaluation: np.ndarray,
+) -> bytes:
+    """
+    Serialise a decision to the binary decision file format.
+
+    The file is a preamble (magic, version, header length), a JSON header with the decision,
+    decision option and evaluation factor labels, a raw int8 (evaluation factors x decision options)
+    ratings block and a little-endian int16 importance vector.
+    """
+    header = json.dumps({
+        'decision': decision,
+        'decision_options_list': list(decision_options_list),
+        'evaluation_factors_list': list(evaluation_factors_list),
+    }).encode('utf-8')
+    header += b" " * (_align(_PREAMBLE.size + len(header), 8) - _PREAMBLE.size - len(header))
+    ratings = np.ascontiguousarray(decision_options_evaluation, dtype=DECISION_FILE_RATINGS_DTYPE).tobytes()
+    padding = b"\0" * (_align(len(ratings), DECISION_FILE_IMPORTANCE_DTYPE.itemsize) - len(ratings))
+    importance = np.ascontiguousarray(evaluation_factor_importance, dtype=DECISION_FILE_IMPORTANCE_DTYPE).tobytes()
+    return (
+        _PREAMBLE.pack(DECISION_FILE_MAGIC, DECISION_FILE_VERSION, len(header))
+        + header + ratings + padding + importance
+    )
+
+
+def _read_header(preamble_and_header: bytes) -> tuple[dict, int]:
+    if len(preamble_and_header) < _PREAMBLE.size:
+        raise DecisionFileError("Invalid input: decision file is truncated.")
+    magic, version, header_length = _PREAMBLE.unpack_from(preamble_and_header)
+    if magic != DECISION_FILE_MAGIC:
+        raise DecisionFileError("Invalid input: not a decision file.")
+    if version != DECISION_FILE_VERSION:
+        raise DecisionFileError(f"Invalid input: unsupported decision file version {version}.")
+    header_end = _PREAMBLE.size + header_length
+    if len(preamble_and_header) < header_end:
+        raise DecisionFileError("Invalid input: decision file is truncated.")
+    try:
+        header = json.loads(preamble_and_header[_PREAMBLE.size:header_end].decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise DecisionFileError("Invalid input: decision file header is corrupted.")
+    for key in ['decision_options_list', 'evaluation_factors_list']:
+        if not isinstance(header.get(key), list) or not all(isinstance(label, str) for label in header[key]):
+            raise DecisionFileError(f"Invalid input: decision file header must have a `{key}` list of labels.")
+    if len(set(header['decision_options_list'])) != len(header['decision_options_list']):
+        raise DecisionFileError("Invalid input: decision file must have no duplicated decision options.")
+    if len(set(header['evaluation_factors_list'])) != len(header['evaluation_factors_list']):
+        raise DecisionFileError("Invalid input: decision file must have no duplicated evaluation factors.")
+    return header, header_end
+
+
+def _block_offsets(header: dict, header_end: int) -> tuple[tuple[int, int], int, int]:
+    shape = (len(header['evaluation_factors_list']), len(header['decision_options_list']))
+    importance_offset = _align(header_end + shape[0] * shape[1], DECISION_FILE_IMPORTANCE_DTYPE.itemsize)
+    file_size = importance_offset + shape[0] * DECISION_FILE_IMPORTANCE_DTYPE.itemsize
+    return shape, importance_offset, file_size
+
+
+def _memmap(path: Union[str, os.PathLike], dtype: np.dtype, offset: int, shape: tuple) -> np.ndarray:
+    # Empty blocks cannot be memory-mapped.
+    if not np.prod(shape):
+        return np.zeros(shape, dtype=dtype)
+    return np.asarray(np.memmap(path, dtype=dtype, mode='c', offset=offset, shape=shape))
+
+
+def read_decision_file(path_or_buffer: Union[str, os.PathLike, io.IOBase, bytes]) -> tuple[dict, np.ndarray, np.ndarray]:
+    """
+    Read a binary decision file.
+
+    Files on disk are memory-mapped copy-on-write, so the ratings and importance are not copied
+    until they are modified; buffers and bytes are read once and wrapped without a further copy.
+
+    Returns
+    -------
+    tuple[dict, np.ndarray, np.ndarray]
+        Header with `decision`, `decision_options_list` and `evaluation_factors_list`,
+        (evaluation factors x decision options) ratings and importance.
+    """
+    if isinstance(path_or_buffer, (str, os.PathLike)):
+        with open(path_or_buffer, 'rb') as f:
+            preamble_and_header = f.read(_PREAMBLE.size)
+            if len(preamble_and_header) == _PREAMBLE.size:
+                preamble_and_header += f.read(_PREAMBLE.unpack(preamble_and_header)[2])
+            actual_size = os.fstat(f.fileno()).st_size
+        header, header_end = _read_header(preamble_and_header)
+        shape, importance_offset, file_size = _block_offsets(header, header_end)
+        if actual_size != file_size:
+            raise DecisionFileError(
+                f"Invalid input: decision file size is {actual_size} bytes, expected {file_size} bytes.")
+        ratings = _memmap(path_or_buffer, DECISION_FILE_RATINGS_DTYPE, header_end, shape)
+        importance = _memmap(path_or_buffer, DECISION_FILE_IMPORTANCE_DTYPE, importance_offset, shape[:1])
+        return header, ratings, importance
+
+    data = path_or_buffer if isinstance(path_or_buffer, bytes) else path_or_buffer.read()
+    header, header_end = _read_header(data)
+    shape, importance_offset, file_size = _block_offsets(header, header_end)
+    if len(data) != file_size:
+        raise DecisionFileError(
+            f"Invalid input: decision file size is {len(data)} bytes, expected {file_size} bytes.")
+    ratings = np.frombuffer(data, dtype=DECISION_FILE_RATINGS_DTYPE, count=shape[0] * shape[1], offset=header_end)
+    importance = np.frombuffer(data, dtype=DECISION_FILE_IMPORTANCE_DTYPE, count=shape[0], offset=importance_offset)
+    return header, ratings.reshape(shape), importance
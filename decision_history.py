@@ -0,0 +1,217 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+
+import numpy as np
+
+from label_index import LabelIndex
+
+
+@dataclass(frozen=True)
+class Change:
+    """
+    A reversible edit of a decision maker.
+
+    Calling the decision maker method named `method` with `args` applies the edit,
+    calling `inverse_method` with `inverse_args` reverts it.
+    """
+    method: str
+    args: tuple
+    inverse_method: str
+    inverse_args: tuple
+
+    def inverted(self) -> "Change":
+        return Change(self.inverse_method, self.inverse_args, self.method, self.args)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the change, counting arrays and label tables in its arguments."""
+        nbytes = 64
+        for arg in self.args + self.inverse_args:
+            if isinstance(arg, Checkpoint):
+                nbytes += arg.nbytes
+            elif isinstance(arg, np.ndarray):
+                nbytes += arg.nbytes
+            elif isinstance(arg, (list, tuple)):
+                nbytes += 8 * len(arg)
+        return nbytes
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """
+    Labels and storage arrays of a decision maker, recorded around structural edits.
+
+    The arrays are shared with the decision maker rather than copied: structural edits replace
+    the storage arrays instead of writing to them, and in-place edits are recorded and undone first,
+    so a checkpoint's arrays hold the recorded values whenever it is restored.
+    """
+    decision: str
+    decision_option_labels: LabelIndex
+    evaluation_factor_labels: LabelIndex
+    evaluation_factor_importance_array: np.ndarray
+    decision_options_evaluation_array: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return (
+                self.evaluation_factor_importance_array.nbytes
+                + self.decision_options_evaluation_array.nbytes
+                + 8 * (len(self.decision_option_labels) + len(self.evaluation_factor_labels))
+        )
+
+    def same_as(self, other: "Checkpoint") -> bool:
+        return (
+                self.decision == other.decision
+                and self.decision_option_labels == other.decision_option_labels
+                and self.evaluation_factor_labels == other.evaluation_factor_labels
+                and (self.evaluation_factor_importance_array is other.evaluation_factor_importance_array
+                     or np.array_equal(self.evaluation_factor_importance_array,
+                                       other.evaluation_factor_importance_array))
+                and (self.decision_options_evaluation_array is other.decision_options_evaluation_array
+                     or np.array_equal(self.decision_options_evaluation_array,
+                                       other.decision_options_evaluation_array))
+        )
+
+
+class DecisionHistory:
+    """
+    Undo/redo log of decision maker edits and a change feed for caches derived from the decision.
+
+    Undo steps are lists of changes, usually one change, or all changes made within a group.
+    The oldest undo steps are dropped once there are more than `max_steps` of them
+    or they hold more than `max_bytes`.
+
+    Every applied change, including undone and redone ones, gets the next `sequence` number;
+    `changes_since` returns the changes after a sequence number so caches can be updated
+    instead of rebuilt, and listeners are called with every change as it is applied.
+    The feed is bounded like the undo steps, by `max_feed` changes and `max_feed_bytes`, `max_bytes` by default,
+    as structural edits publish checkpoints holding whole storage arrays.
+    """
+
+    def __init__(
+            self,
+            max_steps: int = 1000,
+            max_bytes: int = 64 * 2 ** 20,
+            max_feed: int = 10_000,
+            max_feed_bytes: int = None,
+    ):
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self.max_feed = max_feed
+        self.max_feed_bytes = max_feed_bytes
+        self.sequence: int = 0
+        self._undo_steps: deque[list[Change]] = deque()
+        self._redo_steps: list[list[Change]] = []
+        self._nbytes: int = 0
+        self._group: Union[list[Change], None] = None
+        self._group_depth: int = 0
+        self._feed: deque[tuple[int, Change]] = deque()
+        self._feed_nbytes: int = 0
+        self._listeners: list[Callable[[int, Change], Any]] = []
+
+    def __str__(self):
+        return f"Decision history with {len(self._undo_steps)} undo steps and {len(self._redo_steps)} redo steps."
+
+    def __len__(self) -> int:
+        return len(self._undo_steps)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @property
+    def feed_nbytes(self) -> int:
+        return self._feed_nbytes
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo_steps)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo_steps)
+
+    @property
+    def in_group(self) -> bool:
+        return self._group_depth > 0
+
+    def begin_group(self):
+        self._group_depth += 1
+        if self._group_depth == 1:
+            self._group = []
+
+    def end_group(self):
+        self._group_depth -= 1
+        if not self._group_depth:
+            group, self._group = self._group, None
+            if group:
+                self._push_undo_step(group)
+
+    def publish(self, change: Change):
+        """Add an applied change to the change feed without making it undoable."""
+        self.sequence += 1
+        self._feed.append((self.sequence, change))
+        self._feed_nbytes += change.nbytes
+        max_feed_bytes = self.max_bytes if self.max_feed_bytes is None else self.max_feed_bytes
+        while len(self._feed) > self.max_feed or (self._feed_nbytes > max_feed_bytes and len(self._feed) > 1):
+            self._feed_nbytes -= self._feed.popleft()[1].nbytes
+        for listener in self._listeners:
+            listener(self.sequence, change)
+
+    def record(self, change: Change):
+        """Publish an applied change and make it undoable, which discards the redo steps."""
+        self.publish(change)
+        self._redo_steps.clear()
+        if self._group is not None:
+            self._group.append(change)
+        else:
+            self._push_undo_step([change])
+
+    def _push_undo_step(self, step: list[Change]):
+        self._undo_steps.append(step)
+        self._nbytes += sum(change.nbytes for change in step)
+        while len(self._undo_steps) > self.max_steps or (
+                self._nbytes > self.max_bytes and len(self._undo_steps) > 1):
+            self._nbytes -= sum(change.nbytes for change in self._undo_steps.popleft())
+
+    def pop_undo_step(self) -> list[Change]:
+        """Remove the last undo step and keep it for redo, in the order the changes were applied."""
+        if self.in_group:
+            raise RuntimeError("Cannot undo while a group of changes is being recorded.")
+        step = self._undo_steps.pop()
+        self._nbytes -= sum(change.nbytes for change in step)
+        self._redo_steps.append(step)
+        return step
+
+    def pop_redo_step(self) -> list[Change]:
+        """Remove the last redo step and keep it for undo."""
+        if self.in_group:
+            raise RuntimeError("Cannot redo while a group of changes is being recorded.")
+        step = self._redo_steps.pop()
+        self._undo_steps.append(step)
+        self._nbytes += sum(change.nbytes for change in step)
+        return step
+
+    def changes_since(self, sequence: int) -> Union[list[Change], None]:
+        """
+        Return the changes applied after `sequence`, in order,
+        or None when some of them are no longer in the feed and derived state must be rebuilt.
+        """
+        if sequence >= self.sequence:
+            return []
+        if not self._feed or self._feed[0][0] > sequence + 1:
+            return None
+        return [change for change_sequence, change in self._feed if change_sequence > sequence]
+
+    def subscribe(self, listener: Callable[[int, Change], Any]):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[int, Change], Any]):
+        self._listeners.remove(listener)
+
+    def clear(self):
+        """Forget the undo and redo steps; the change feed and its sequence numbers are kept."""
+        self._undo_steps.clear()
+        self._redo_steps.clear()
+        self._nbytes = 0
@@ -1,17 +1,98 @@
 import io
 import json
+import sys
+from contextlib import contextmanager
+import numpy as np
 import pandas as pd
-from typing import Union, Literal
-from matplotlib.colors import LinearSegmentedColormap
-from utils import update_dict_key
-import plotly.express as px
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Iterator, Mapping, Union, Literal
 
+from decision_file import DECISION_FILE_EXTENSION, DecisionFileError, read_decision_file, write_decision_file
+from decision_history import Change, Checkpoint, DecisionHistory
+from decision_validation import (
+    DUPLICATED_ROW_MESSAGE, ValidationResult, Violation, importance_range_message, rating_range_message,
+    validate_decision_dataframe, validate_storage_values, validate_value_range,
+)
+from label_index import LabelIndex
+from render_cache import RenderCache
+from scoring_engines import SCORING_ENGINES, ScoringEngine, ScoringResult, get_scoring_engine
 
-cmap_input = Union[str, LinearSegmentedColormap]
-plotly_cmap_default = px.colors.sequential.Tealgrn
+if TYPE_CHECKING:
+    from matplotlib.colors import LinearSegmentedColormap
+
+# Plotly and matplotlib are only imported by the plot and style methods, so importing this module stays fast.
+cmap_input = Union[str, "LinearSegmentedColormap"]
+# px.colors.sequential.Tealgrn, https://plotly.com/python/builtin-colorscales/
+plotly_cmap_default = [
+    'rgb(176, 242, 188)', 'rgb(137, 232, 172)', 'rgb(103, 219, 165)', 'rgb(76, 200, 163)',
+    'rgb(56, 178, 163)', 'rgb(44, 152, 160)', 'rgb(37, 125, 152)',
+]
 
 class InvalidInputError(Exception):
-    pass
+
+    def __init__(self, message: str = "", violations: list[Violation] = None):
+        super().__init__(message)
+        self.violations: list[Violation] = violations or []
+
+
+def iter_worksheet_chunks(worksheet, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Yield the rows of an openpyxl worksheet as dataframes of `chunksize` rows, using the first row as header."""
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return
+    index_name, columns = header[0], list(header[1:])
+    rows = (row for row in rows if any(value is not None for value in row))
+    while chunk := list(islice(rows, chunksize)):
+        yield pd.DataFrame(
+            [row[1:] for row in chunk],
+            index=pd.Index([row[0] for row in chunk], name=index_name),
+            columns=columns,
+        )
+
+
+def is_frozen_array(array: np.ndarray) -> bool:
+    """
+    Whether no one can write to the memory of an array: it and every array it is a view of are read-only.
+
+    Frozen arrays can be shared as copy-on-write storage, a read-only view of a writable array cannot.
+    """
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    return True
+
+
+class SaveOptions(Mapping):
+    """
+    Registry of export formats which serialises a format only when it is requested.
+
+    Serialised data is cached until `clear` is called.
+    """
+
+    def __init__(self, exporters: dict[str, Callable[[], Any]] = None):
+        self._exporters: dict[str, Callable[[], Any]] = dict(exporters or {})
+        self._cache: dict[str, Any] = {}
+
+    def __getitem__(self, file_type: str):
+        if file_type not in self._cache:
+            self._cache[file_type] = self._exporters[file_type]()
+        return self._cache[file_type]
+
+    def __iter__(self):
+        return iter(self._exporters)
+
+    def __len__(self):
+        return len(self._exporters)
+
+    def register(self, file_type: str, exporter: Callable[[], Any]):
+        self._exporters[file_type] = exporter
+        self._cache.pop(file_type, None)
+
+    def clear(self):
+        self._cache.clear()
+
 
 class DecisionMaker:
 
@@ -22,37 +103,74 @@ class DecisionMaker:
     DEFAULT_DECISION_OPTION_VALUE = 5
     MAX_DECISION_OPTION_VALUE = 10
 
-    def __init__(self):
+    DECISION_OPTION_VALUE_DTYPE = np.int8
+    EVALUATION_FACTOR_IMPORTANCE_DTYPE = np.int16
+    IMPORT_CHUNK_SIZE = 10_000
+    DATAFRAME_VIEWS = ('evaluation_factor_importance_df', 'decision_options_evaluation_df')
+    # Engines available to `score`, see `scoring_engines.register_scoring_engine`.
+    scoring_engines: Mapping[str, ScoringEngine] = SCORING_ENGINES
+
+    def __init__(self, check_incremental_scores: bool = False):
         self.decision: str = ""
         self.decision_options_count: int = 2
-        self.decision_options_list: list[str] = []
+        self.decision_option_labels = LabelIndex()
         self.evaluation_factors_count: int = 2
-        self.evaluation_factors_list: list[str] = []
-        self.evaluation_factor_importance_dict: dict[str, int] = {}
-        self.decision_options_evaluation_dict: dict[str, dict[str, int]] = {}
+        self.evaluation_factor_labels = LabelIndex()
+
+        # Ratings are stored as a dense (evaluation factors x decision options) matrix,
+        # importance as a vector aligned with `evaluation_factors_list`.
+        # Dicts and dataframes are materialized from these arrays on first access.
+        self._decision_options_evaluation_array = np.empty((0, 0), dtype=self.DECISION_OPTION_VALUE_DTYPE)
+        self._evaluation_factor_importance_array = np.empty(0, dtype=self.EVALUATION_FACTOR_IMPORTANCE_DTYPE)
+        self._views: dict = {}
+        self._batch_depth: int = 0
+        self._dirty_views: set[str] = set()
+        # Incremented on every change of the decision; rendered tables and figures are cached by version
+        # and by the versions the scores were last computed for.
+        self.version: int = 0
+        self._adj_by_importance_version: Union[int, None] = None
+        self._score_version: Union[int, None] = None
+        self.render_cache = RenderCache()
+        self._save_options = SaveOptions({
+            'csv': self.to_csv,
+            'xlsx': self._to_xlsx_bytes,
+            DECISION_FILE_EXTENSION: self.to_binary,
+        })
+
+        # Importance-weighted rating sums per decision option and the importance total,
+        # kept up to date by single-cell edits and recomputed after bulk edits.
+        self._weighted_sums: Union[np.ndarray, None] = None
+        self._importance_total: Union[int, None] = None
+        self.check_incremental_scores = check_incremental_scores
+
+        # Edits are recorded as reversible changes; structural edits are recorded once as a whole
+        # and edits replayed by undo and redo are only published to the change feed.
+        self.history = DecisionHistory()
+        self._structural_edit_depth: int = 0
+        self._replaying: bool = False
 
         self.set_decision_options_count(self.decision_options_count)
         self.set_evaluation_factors_count(self.evaluation_factors_count)
+        self.history.clear()
 
-        self.evaluation_factor_importance_df = pd.DataFrame()
-        self.decision_options_evaluation_df = pd.DataFrame()
         self.decision_options_evaluation_adj_by_importance_df = pd.DataFrame()
 
     def __repr__(self):
         return json.dumps(self.to_dict(), indent=4)
 
     def to_dict(self):
-        repr_attrs = [
-            'decision',
-            'decision_options_count',
-            'decision_options_list',
-            'evaluation_factors_count',
-            'evaluation_factors_list',
-            'evaluation_factor_importance_dict',
-            'decision_options_evaluation_dict'
-        ]
+        # Copies of the cached views, so editing the dict cannot desynchronise the views from the storage.
         return {
-            k: v for k, v in self.__dict__.items() if k in repr_attrs
+            'decision': self.decision,
+            'decision_options_count': self.decision_options_count,
+            'decision_options_list': list(self.decision_options_list),
+            'evaluation_factors_count': self.evaluation_factors_count,
+            'evaluation_factors_list': list(self.evaluation_factors_list),
+            'evaluation_factor_importance_dict': dict(self.evaluation_factor_importance_dict),
+            'decision_options_evaluation_dict': {
+                decision_option: dict(evaluation)
+                for decision_option, evaluation in self.decision_options_evaluation_dict.items()
+            },
         }
 
     def __str__(self):
@@ -68,162 +186,611 @@ class DecisionMaker:
                 and self.decision_options_list == other.decision_options_list
                 and self.evaluation_factors_count == other.evaluation_factors_count
                 and self.evaluation_factors_list == other.evaluation_factors_list
-                and self.evaluation_factor_importance_dict == other.evaluation_factor_importance_dict
-                and self.decision_options_evaluation_dict == other.decision_options_evaluation_dict
+                and np.array_equal(self._evaluation_factor_importance_array,
+                                   other._evaluation_factor_importance_array)
+                and np.array_equal(self._decision_options_evaluation_array,
+                                   other._decision_options_evaluation_array)
                 and self.evaluation_factor_importance_df.equals(other.evaluation_factor_importance_df)
                 and self.decision_options_evaluation_df.equals(other.decision_options_evaluation_df)
             )
         return False
 
+    def _view(self, name: str, build):
+        if name not in self._views:
+            self._views[name] = build()
+        return self._views[name]
+
+    def _invalidate_views(self, *names: str):
+        self.version += 1
+        self._save_options.clear()
+        names = names or tuple(self._views) + self.DATAFRAME_VIEWS
+        if self._batch_depth:
+            self._dirty_views.update(names)
+        for name in names:
+            self._views.pop(name, None)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several edits so that derived dataframes are rebuilt once on exit.
+
+        Inside the block setters only mark views as dirty; views read within the block
+        are still materialized from the current state. Batches can be nested, dirty
+        dataframes are rebuilt when the outermost batch exits.
+        The edits are undone and redone together as one history step.
+        """
+        self._batch_depth += 1
+        self.history.begin_group()
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self.history.end_group()
+            if not self._batch_depth:
+                self._flush_dirty_views()
+
+    @property
+    def in_batch(self) -> bool:
+        return self._batch_depth > 0
+
+    def _flush_dirty_views(self):
+        dirty_views, self._dirty_views = self._dirty_views, set()
+        if 'evaluation_factor_importance_df' in dirty_views:
+            self.convert_evaluation_factor_importance_dict_to_df()
+        if 'decision_options_evaluation_df' in dirty_views:
+            self.convert_decision_options_evaluation_dict_to_df()
+
+    def _record(self, change: Change):
+        if self._structural_edit_depth or self._replaying:
+            return
+        self.history.record(change)
+
+    def _checkpoint(self) -> Checkpoint:
+        # Checkpoints share the storage arrays, which become read-only until `_make_storage_writeable`.
+        self._decision_options_evaluation_array.flags.writeable = False
+        self._evaluation_factor_importance_array.flags.writeable = False
+        return Checkpoint(
+            decision=self.decision,
+            decision_option_labels=self.decision_option_labels.copy(),
+            evaluation_factor_labels=self.evaluation_factor_labels.copy(),
+            evaluation_factor_importance_array=self._evaluation_factor_importance_array,
+            decision_options_evaluation_array=self._decision_options_evaluation_array,
+        )
+
+    def _restore_checkpoint(self, checkpoint: Checkpoint):
+        with self.batch():
+            self.set_decision(checkpoint.decision)
+            self.decision_option_labels = checkpoint.decision_option_labels.copy()
+            self.decision_options_count = len(self.decision_option_labels)
+            self.evaluation_factor_labels = checkpoint.evaluation_factor_labels.copy()
+            self.evaluation_factors_count = len(self.evaluation_factor_labels)
+            self._evaluation_factor_importance_array = checkpoint.evaluation_factor_importance_array
+            self._decision_options_evaluation_array = checkpoint.decision_options_evaluation_array
+            self._invalidate_scores()
+            self._invalidate_labels()
+
+    def _make_storage_writeable(self):
+        # Copy storage arrays shared with checkpoints before the first in-place edit after a checkpoint.
+        if not self._decision_options_evaluation_array.flags.writeable:
+            self._decision_options_evaluation_array = self._decision_options_evaluation_array.copy()
+        if not self._evaluation_factor_importance_array.flags.writeable:
+            self._evaluation_factor_importance_array = self._evaluation_factor_importance_array.copy()
+
+    @contextmanager
+    def _structural_edit(self):
+        """Record the edits in the block as one change between checkpoints taken before and after it."""
+        if self._structural_edit_depth or self._replaying:
+            yield
+            return
+        before = self._checkpoint()
+        self._structural_edit_depth += 1
+        try:
+            yield
+        finally:
+            self._structural_edit_depth -= 1
+        after = self._checkpoint()
+        if not after.same_as(before):
+            self.history.record(Change('_restore_checkpoint', (after,), '_restore_checkpoint', (before,)))
+
+    def _replay(self, changes: list[Change]):
+        with self.batch():
+            self._replaying = True
+            try:
+                for change in changes:
+                    getattr(self, change.method)(*change.args)
+                    self.history.publish(change)
+            finally:
+                self._replaying = False
+
+    def undo(self) -> bool:
+        """Revert the last history step, return False when there is nothing to undo."""
+        if not self.history.can_undo:
+            return False
+        step = self.history.pop_undo_step()
+        self._replay([change.inverted() for change in reversed(step)])
+        return True
+
+    def redo(self) -> bool:
+        """Apply the last undone history step again, return False when there is nothing to redo."""
+        if not self.history.can_redo:
+            return False
+        self._replay(self.history.pop_redo_step())
+        return True
+
+    @property
+    def decision_options_evaluation_array(self) -> np.ndarray:
+        """Read-only (evaluation factors x decision options) ratings."""
+        array = self._decision_options_evaluation_array.view()
+        array.flags.writeable = False
+        return array
+
+    @property
+    def evaluation_factor_importance_array(self) -> np.ndarray:
+        """Read-only importance of each evaluation factor."""
+        array = self._evaluation_factor_importance_array.view()
+        array.flags.writeable = False
+        return array
+
+    @property
+    def decision_options_list(self) -> list[str]:
+        return self._view('decision_options_list', self.decision_option_labels.to_list)
+
+    @property
+    def evaluation_factors_list(self) -> list[str]:
+        return self._view('evaluation_factors_list', self.evaluation_factor_labels.to_list)
+
+    @property
+    def decision_option_index(self) -> dict[str, int]:
+        return self._view('decision_option_index', lambda: {
+            decision_option: i for i, decision_option in enumerate(self.decision_options_list)
+        })
+
+    @property
+    def evaluation_factor_index(self) -> dict[str, int]:
+        return self._view('evaluation_factor_index', lambda: {
+            evaluation_factor: k for k, evaluation_factor in enumerate(self.evaluation_factors_list)
+        })
+
+    @property
+    def evaluation_factor_importance_dict(self) -> dict[str, int]:
+        return self._view('evaluation_factor_importance_dict', lambda: dict(zip(
+            self.evaluation_factors_list,
+            self._evaluation_factor_importance_array.tolist()
+        )))
+
+    @property
+    def decision_options_evaluation_dict(self) -> dict[str, dict[str, int]]:
+        return self._view('decision_options_evaluation_dict', lambda: {
+            decision_option: dict(zip(self.evaluation_factors_list, values))
+            for decision_option, values in zip(
+                self.decision_options_list,
+                self._decision_options_evaluation_array.T.tolist()
+            )
+        })
+
+    @property
+    def evaluation_factor_importance_df(self) -> pd.DataFrame:
+        if 'evaluation_factor_importance_df' not in self._views:
+            self.convert_evaluation_factor_importance_dict_to_df()
+        return self._views['evaluation_factor_importance_df']
+
+    @property
+    def decision_options_evaluation_df(self) -> pd.DataFrame:
+        if 'decision_options_evaluation_df' not in self._views:
+            self.convert_decision_options_evaluation_dict_to_df()
+        return self._views['decision_options_evaluation_df']
+
+    def _invalidate_labels(self):
+        self._invalidate_views()
+
+    def _invalidate_evaluation_factor_importance(self):
+        self._invalidate_views('evaluation_factor_importance_dict', 'evaluation_factor_importance_df')
+
+    def _invalidate_decision_options_evaluation(self):
+        self._invalidate_views('decision_options_evaluation_dict', 'decision_options_evaluation_df')
+
+    def _invalidate_scores(self):
+        self._weighted_sums = None
+        self._importance_total = None
+
+    def _compute_weighted_sums(self) -> tuple[np.ndarray, int]:
+        importance = self._evaluation_factor_importance_array.astype(np.int64)
+        return importance @ self._decision_options_evaluation_array.astype(np.int64), int(importance.sum())
+
+    def _get_weighted_sums(self) -> tuple[np.ndarray, int]:
+        if self._weighted_sums is None:
+            self._weighted_sums, self._importance_total = self._compute_weighted_sums()
+        return self._weighted_sums, self._importance_total
+
+    def _check_weighted_sums(self):
+        if not self.check_incremental_scores or self._weighted_sums is None:
+            return
+        weighted_sums, importance_total = self._compute_weighted_sums()
+        if not (np.array_equal(weighted_sums, self._weighted_sums) and importance_total == self._importance_total):
+            raise AssertionError(
+                "Incremental decision scores diverged from full recompute: "
+                f"{self._weighted_sums.tolist()} / {self._importance_total} != "
+                f"{weighted_sums.tolist()} / {importance_total}.")
+
+    def _resize_decision_options(self, value: int):
+        self._invalidate_scores()
+        array = self._decision_options_evaluation_array[:, :value]
+        if value > array.shape[1]:
+            padding = np.full(
+                (array.shape[0], value - array.shape[1]),
+                self.DEFAULT_DECISION_OPTION_VALUE, dtype=self.DECISION_OPTION_VALUE_DTYPE)
+            array = np.concatenate([array, padding], axis=1)
+        self._decision_options_evaluation_array = np.ascontiguousarray(array)
+
+    def _resize_evaluation_factors(self, value: int):
+        self._invalidate_scores()
+        array = self._decision_options_evaluation_array[:value]
+        importance = self._evaluation_factor_importance_array[:value]
+        if value > array.shape[0]:
+            padding = np.full(
+                (value - array.shape[0], array.shape[1]),
+                self.DEFAULT_DECISION_OPTION_VALUE, dtype=self.DECISION_OPTION_VALUE_DTYPE)
+            array = np.concatenate([array, padding], axis=0)
+            importance_padding = np.full(
+                value - importance.shape[0],
+                self.DEFAULT_EVALUATION_FACTOR_IMPORTANCE, dtype=self.EVALUATION_FACTOR_IMPORTANCE_DTYPE)
+            importance = np.concatenate([importance, importance_padding])
+        self._decision_options_evaluation_array = np.ascontiguousarray(array)
+        self._evaluation_factor_importance_array = importance.copy()
+
     def set_decision(self, value: str):
+        if value != self.decision:
+            self._record(Change('set_decision', (value,), 'set_decision', (self.decision,)))
+            self.version += 1
+            self._save_options.clear()
         self.decision = value
 
+    @staticmethod
+    def _check_unique_labels(kind: str, labels: Iterable[str]):
+        """Raise InvalidInputError when a label is repeated, lookups by label could not tell the repeats apart."""
+        seen = set()
+        for label in labels:
+            if label in seen:
+                raise InvalidInputError(f"Invalid input: {kind}s must be unique, found '{label}' more than once.")
+            seen.add(label)
+
+    @staticmethod
+    def _with_default_labels(prefix: str, labels: list[str], count: int) -> list[str]:
+        """The first `count` labels, followed by numbered default labels which are not taken yet."""
+        labels = labels[:count]
+        taken = set(labels)
+        number = len(labels)
+        while len(labels) < count:
+            number += 1
+            if f"{prefix} {number}" not in taken:
+                labels.append(f"{prefix} {number}")
+        return labels
+
     def init_decision_options_count(self, value: int):
         self.decision_options_count = value
-        self.set_decision_options_with_list([f"Option {i + 1}" for i in range(value)])
+        self.set_decision_options_with_list(self._with_default_labels("Option", [], value))
 
     def update_decision_options_count(self, value: int):
-        old_value = self.decision_options_count
-        self.decision_options_count = value
-        self.decision_options_list = self.decision_options_list[: min(old_value, value)]
-        self.decision_options_evaluation_dict = {
-            k: v for k, v in self.decision_options_evaluation_dict.items()
-            if k in self.decision_options_list
-        }
-        self.set_decision_options_with_list([
-            f"Option {i + 1}" if (i + 1) > len(self.decision_options_list)
-            else self.decision_options_list[i]
-            for i in range(value)
-        ])
-        self.convert_decision_options_evaluation_dict_to_df()
+        if value == self.decision_options_count == len(self.decision_option_labels):
+            return
+        with self._structural_edit():
+            old_value = self.decision_options_count
+            self.decision_options_count = value
+            self.decision_option_labels.truncate(min(old_value, value))
+            self._resize_decision_options(len(self.decision_option_labels))
+            self.set_decision_options_with_list(
+                self._with_default_labels("Option", self.decision_options_list, value))
+            self._invalidate_labels()
 
     def set_decision_options_count(self, value: int):
-        if not self.decision_options_list:
+        if not len(self.decision_option_labels):
             self.init_decision_options_count(value)
             return
         self.update_decision_options_count(value)
 
+    def init_decision_options(self, value_list: list[str]):
+        if not value_list:
+            return
+        self._check_unique_labels("decision option", [*self.decision_option_labels, *value_list])
+        with self._structural_edit():
+            self.decision_option_labels.extend(value_list)
+            self._resize_decision_options(len(self.decision_option_labels))
+            self._invalidate_labels()
+
     def init_decision_option(self, value: str):
-        self.decision_options_list.append(value)
-        self.decision_options_evaluation_dict[value] = {
-            k: self.DEFAULT_DECISION_OPTION_VALUE
-            for k in self.evaluation_factors_list
-        }
+        self.init_decision_options([value])
 
     def update_decision_option(self, i: int, value: str):
-        old_value = self.decision_options_list[i]
-        self.decision_options_list[i] = value
+        if value in self.decision_option_index and self.decision_option_index[value] != i:
+            raise InvalidInputError(f"Invalid input: decision option '{value}' already exists.")
+        self._rename_decision_option(i, value)
+
+    def _rename_decision_option(self, i: int, value: str):
+        old_value = self.decision_option_labels.rename(i, value)
         if value != old_value:
-            self.decision_options_evaluation_dict = update_dict_key(
-                dict_to_update=self.decision_options_evaluation_dict,
-                old_key=old_value,
-                new_key=value,
-            )
+            self._record(Change('update_decision_option', (i, value), 'update_decision_option', (i, old_value)))
+            self._invalidate_labels()
 
     def set_decision_option(self, i: int, value: str):
-        if (i + 1) > len(self.decision_options_list):
+        if (i + 1) > len(self.decision_option_labels):
             self.init_decision_option(value)
             return
         self.update_decision_option(i, value)
-        self.convert_decision_options_evaluation_dict_to_df()
 
     def set_decision_options_with_list(self, value_list: list[str]):
         assert len(value_list) == self.decision_options_count
-        for i, value in enumerate(value_list):
-            self.set_decision_option(i, value)
+        self._check_unique_labels("decision option", value_list)
+        with self._structural_edit():
+            existing_count = len(self.decision_option_labels)
+            # Renames are checked as a whole, so labels can be swapped.
+            for i, value in enumerate(value_list[:existing_count]):
+                self._rename_decision_option(i, value)
+            self.init_decision_options(value_list[existing_count:])
 
     def init_evaluation_factors_count(self, value: int):
         self.evaluation_factors_count = value
-        self.set_evaluation_factors_with_list([f"Factor {i + 1}" for i in range(value)])
+        self.set_evaluation_factors_with_list(self._with_default_labels("Factor", [], value))
 
     def update_evaluation_factors_count(self, value: int):
-        old_value = self.evaluation_factors_count
-        self.evaluation_factors_count = value
-        self.evaluation_factors_list = self.evaluation_factors_list[: min(old_value, value)]
-        self.evaluation_factor_importance_dict = {
-            k: v for k, v in self.evaluation_factor_importance_dict.items()
-            if k in self.evaluation_factors_list
-        }
-        self.set_evaluation_factors_with_list([
-            f"Factor {i + 1}" if (i + 1) > len(self.evaluation_factors_list)
-            else self.evaluation_factors_list[i]
-            for i in range(value)
-        ])
-        self.decision_options_evaluation_dict = {
-            k: {
-                evaluation_factor: ef_value
-                for evaluation_factor, ef_value in v.items()
-                if evaluation_factor in self.evaluation_factors_list
-            }
-            for k, v in self.decision_options_evaluation_dict.items()
-        }
-        self.convert_decision_options_evaluation_dict_to_df()
+        if value == self.evaluation_factors_count == len(self.evaluation_factor_labels):
+            return
+        with self._structural_edit():
+            old_value = self.evaluation_factors_count
+            self.evaluation_factors_count = value
+            self.evaluation_factor_labels.truncate(min(old_value, value))
+            self._resize_evaluation_factors(len(self.evaluation_factor_labels))
+            self.set_evaluation_factors_with_list(
+                self._with_default_labels("Factor", self.evaluation_factors_list, value))
+            self._invalidate_labels()
 
     def set_evaluation_factors_count(self, value: int):
-        if not self.evaluation_factors_list:
+        if not len(self.evaluation_factor_labels):
             self.init_evaluation_factors_count(value)
             return
         self.update_evaluation_factors_count(value)
 
+    def init_evaluation_factors(self, value_list: list[str]):
+        if not value_list:
+            return
+        self._check_unique_labels("evaluation factor", [*self.evaluation_factor_labels, *value_list])
+        with self._structural_edit():
+            self.evaluation_factor_labels.extend(value_list)
+            self._resize_evaluation_factors(len(self.evaluation_factor_labels))
+            self._invalidate_labels()
+
     def init_evaluation_factor(self, value: str):
-        self.evaluation_factors_list.append(value)
-        self.evaluation_factor_importance_dict[value] = self.DEFAULT_EVALUATION_FACTOR_IMPORTANCE
-        self.decision_options_evaluation_dict = {
-            k: {
-                **v,
-                **{value: self.DEFAULT_DECISION_OPTION_VALUE}
-            }
-            for k, v in self.decision_options_evaluation_dict.items()
-        }
+        self.init_evaluation_factors([value])
 
     def update_evaluation_factor(self, i: int, value: str):
-        old_value = self.evaluation_factors_list[i]
-        self.evaluation_factors_list[i] = value
+        if value in self.evaluation_factor_index and self.evaluation_factor_index[value] != i:
+            raise InvalidInputError(f"Invalid input: evaluation factor '{value}' already exists.")
+        self._rename_evaluation_factor(i, value)
+
+    def _rename_evaluation_factor(self, i: int, value: str):
+        old_value = self.evaluation_factor_labels.rename(i, value)
         if value != old_value:
-            self.evaluation_factor_importance_dict = update_dict_key(
-                dict_to_update=self.evaluation_factor_importance_dict,
-                old_key=old_value,
-                new_key=value,
-            )
-        self.decision_options_evaluation_dict = {
-            k: v if value == old_value else update_dict_key(
-                dict_to_update=v,
-                old_key=old_value,
-                new_key=value,
-            )
-            for k, v in self.decision_options_evaluation_dict.items()
-        }
+            self._record(Change('update_evaluation_factor', (i, value), 'update_evaluation_factor', (i, old_value)))
+            self._invalidate_labels()
 
     def set_evaluation_factor(self, i: int, value: str):
-        if (i + 1) > len(self.evaluation_factors_list):
+        if (i + 1) > len(self.evaluation_factor_labels):
             self.init_evaluation_factor(value)
             return
         self.update_evaluation_factor(i, value)
-        self.convert_dicts_to_df()
 
     def set_evaluation_factors_with_list(self, value_list: list[str]):
         assert len(value_list) == self.evaluation_factors_count
-        for i, value in enumerate(value_list):
-            self.set_evaluation_factor(i, value)
+        self._check_unique_labels("evaluation factor", value_list)
+        with self._structural_edit():
+            existing_count = len(self.evaluation_factor_labels)
+            # Renames are checked as a whole, so labels can be swapped.
+            for i, value in enumerate(value_list[:existing_count]):
+                self._rename_evaluation_factor(i, value)
+            self.init_evaluation_factors(value_list[existing_count:])
+
+    @staticmethod
+    def _as_checked_storage_array(
+            values, dtype: np.dtype, value_range: tuple[int, int], message: str,
+            row_labels: list, column_labels: list,
+    ) -> np.ndarray:
+        """Cast values to a storage dtype, raising InvalidInputError for values it would wrap or truncate."""
+        result = ValidationResult()
+        values = validate_storage_values(values, value_range, message, row_labels, column_labels, result)
+        if not result.is_valid:
+            raise InvalidInputError(result.message, result.violations)
+        return values.astype(dtype)
+
+    def _checked_importance(self, values, evaluation_factors_list: list[str]) -> np.ndarray:
+        importance_range = (self.MIN_EVALUATION_FACTOR_IMPORTANCE, self.MAX_EVALUATION_FACTOR_IMPORTANCE)
+        return self._as_checked_storage_array(
+            values, self.EVALUATION_FACTOR_IMPORTANCE_DTYPE, importance_range,
+            importance_range_message(importance_range), evaluation_factors_list, ["Importance"],
+        ).reshape(len(evaluation_factors_list))
+
+    def _checked_ratings(
+            self, values, evaluation_factors_list: list[str], decision_options_list: list[str]) -> np.ndarray:
+        rating_range = (self.MIN_DECISION_OPTION_VALUE, self.MAX_DECISION_OPTION_VALUE)
+        return self._as_checked_storage_array(
+            values, self.DECISION_OPTION_VALUE_DTYPE, rating_range,
+            rating_range_message(rating_range), evaluation_factors_list, decision_options_list,
+        )
+
+    def _decision_option_position(self, decision_option: Union[int, str]) -> int:
+        if isinstance(decision_option, str):
+            if decision_option not in self.decision_option_index:
+                raise KeyError(f"Decision option '{decision_option}' not found.")
+            return self.decision_option_index[decision_option]
+        return range(len(self.decision_option_labels))[decision_option]
+
+    def _evaluation_factor_position(self, evaluation_factor: Union[int, str]) -> int:
+        if isinstance(evaluation_factor, str):
+            if evaluation_factor not in self.evaluation_factor_index:
+                raise KeyError(f"Evaluation factor '{evaluation_factor}' not found.")
+            return self.evaluation_factor_index[evaluation_factor]
+        return range(len(self.evaluation_factor_labels))[evaluation_factor]
+
+    @staticmethod
+    def _move_along_axis(array: np.ndarray, i: int, j: int, axis: int):
+        # Rotate only the slice between the old and the new position in place.
+        lo, hi, shift = (i, j, -1) if i < j else (j, i, 1)
+        index = [slice(None)] * array.ndim
+        index[axis] = slice(lo, hi + 1)
+        array[tuple(index)] = np.roll(array[tuple(index)], shift, axis=axis)
+
+    def insert_decision_option(self, i: int, value: str, evaluation: list[int] = None):
+        """Insert a decision option before position `i`, rated `evaluation` or with default ratings."""
+        i = range(len(self.decision_option_labels) + 1)[i]
+        if value in self.decision_option_index:
+            raise InvalidInputError(f"Invalid input: decision option '{value}' already exists.")
+        column = self._checked_ratings(
+            evaluation if evaluation is not None
+            else [self.DEFAULT_DECISION_OPTION_VALUE] * self.evaluation_factors_count,
+            self.evaluation_factors_list, [value],
+        ).reshape(self.evaluation_factors_count)
+        self._record(Change('insert_decision_option', (i, value, column), 'remove_decision_option', (i,)))
+        self.decision_option_labels.insert(i, value)
+        self.decision_options_count += 1
+        self._decision_options_evaluation_array = np.insert(self._decision_options_evaluation_array, i, column, axis=1)
+        if self._weighted_sums is not None:
+            self._weighted_sums = np.insert(
+                self._weighted_sums, i, self._evaluation_factor_importance_array.astype(np.int64) @ column)
+            self._check_weighted_sums()
+        self._invalidate_labels()
+
+    def remove_decision_option(self, decision_option: Union[int, str]) -> str:
+        i = self._decision_option_position(decision_option)
+        value = self.decision_option_labels.remove(i)
+        self._record(Change(
+            'remove_decision_option', (i,),
+            'insert_decision_option', (i, value, self._decision_options_evaluation_array[:, i].copy())))
+        self.decision_options_count -= 1
+        self._decision_options_evaluation_array = np.delete(self._decision_options_evaluation_array, i, axis=1)
+        if self._weighted_sums is not None:
+            self._weighted_sums = np.delete(self._weighted_sums, i)
+            self._check_weighted_sums()
+        self._invalidate_labels()
+        return value
+
+    def move_decision_option(self, decision_option: Union[int, str], j: int):
+        i = self._decision_option_position(decision_option)
+        j = range(len(self.decision_option_labels))[j]
+        if i == j:
+            return
+        self._record(Change('move_decision_option', (i, j), 'move_decision_option', (j, i)))
+        self._make_storage_writeable()
+        self.decision_option_labels.move(i, j)
+        self._move_along_axis(self._decision_options_evaluation_array, i, j, axis=1)
+        if self._weighted_sums is not None:
+            self._move_along_axis(self._weighted_sums, i, j, axis=0)
+            self._check_weighted_sums()
+        self._invalidate_labels()
+
+    def insert_evaluation_factor(
+            self, k: int, value: str, importance: int = None, evaluation: list[int] = None):
+        """Insert an evaluation factor before position `k`, with default importance and ratings unless given."""
+        k = range(len(self.evaluation_factor_labels) + 1)[k]
+        if value in self.evaluation_factor_index:
+            raise InvalidInputError(f"Invalid input: evaluation factor '{value}' already exists.")
+        importance = int(self._checked_importance(
+            [self.DEFAULT_EVALUATION_FACTOR_IMPORTANCE if importance is None else importance], [value])[0])
+        row = self._checked_ratings(
+            evaluation if evaluation is not None
+            else [self.DEFAULT_DECISION_OPTION_VALUE] * self.decision_options_count,
+            [value], self.decision_options_list,
+        ).reshape(self.decision_options_count)
+        self._record(Change(
+            'insert_evaluation_factor', (k, value, importance, row), 'remove_evaluation_factor', (k,)))
+        self.evaluation_factor_labels.insert(k, value)
+        self.evaluation_factors_count += 1
+        self._decision_options_evaluation_array = np.insert(self._decision_options_evaluation_array, k, row, axis=0)
+        self._evaluation_factor_importance_array = np.insert(self._evaluation_factor_importance_array, k, importance)
+        if self._weighted_sums is not None:
+            self._weighted_sums += int(importance) * row.astype(np.int64)
+            self._importance_total += int(importance)
+            self._check_weighted_sums()
+        self._invalidate_labels()
+
+    def remove_evaluation_factor(self, evaluation_factor: Union[int, str]) -> str:
+        k = self._evaluation_factor_position(evaluation_factor)
+        value = self.evaluation_factor_labels.remove(k)
+        self._record(Change(
+            'remove_evaluation_factor', (k,),
+            'insert_evaluation_factor', (k, value, int(self._evaluation_factor_importance_array[k]),
+                                         self._decision_options_evaluation_array[k].copy())))
+        self.evaluation_factors_count -= 1
+        if self._weighted_sums is not None:
+            importance = int(self._evaluation_factor_importance_array[k])
+            self._weighted_sums -= importance * self._decision_options_evaluation_array[k].astype(np.int64)
+            self._importance_total -= importance
+        self._decision_options_evaluation_array = np.delete(self._decision_options_evaluation_array, k, axis=0)
+        self._evaluation_factor_importance_array = np.delete(self._evaluation_factor_importance_array, k)
+        self._check_weighted_sums()
+        self._invalidate_labels()
+        return value
+
+    def move_evaluation_factor(self, evaluation_factor: Union[int, str], j: int):
+        k = self._evaluation_factor_position(evaluation_factor)
+        j = range(len(self.evaluation_factor_labels))[j]
+        if k == j:
+            return
+        self._record(Change('move_evaluation_factor', (k, j), 'move_evaluation_factor', (j, k)))
+        self._make_storage_writeable()
+        self.evaluation_factor_labels.move(k, j)
+        self._move_along_axis(self._decision_options_evaluation_array, k, j, axis=0)
+        self._move_along_axis(self._evaluation_factor_importance_array, k, j, axis=0)
+        self._invalidate_labels()
 
     def set_evaluation_factor_importance(self, i: int, value: int):
-        self.evaluation_factor_importance_dict[
-            self.evaluation_factors_list[i]
-        ] = value
-        self.convert_evaluation_factor_importance_dict_to_df()
+        # Integers in range, as set by widgets on every run, skip the full check.
+        if not (isinstance(value, (int, np.integer))
+                and self.MIN_EVALUATION_FACTOR_IMPORTANCE <= value <= self.MAX_EVALUATION_FACTOR_IMPORTANCE):
+            value = self._checked_importance([value], [self.evaluation_factors_list[i]])[0]
+        value = int(value)
+        old_value = int(self._evaluation_factor_importance_array[i])
+        delta = value - old_value
+        if not delta:
+            # Widgets set every value on every run, unchanged values keep the version and shared storage.
+            return
+        self._record(Change(
+            'set_evaluation_factor_importance', (i, value), 'set_evaluation_factor_importance', (i, old_value)))
+        self._make_storage_writeable()
+        self._evaluation_factor_importance_array[i] = value
+        if self._weighted_sums is not None:
+            self._weighted_sums += delta * self._decision_options_evaluation_array[i].astype(np.int64)
+            self._importance_total += delta
+            self._check_weighted_sums()
+        self._invalidate_evaluation_factor_importance()
 
     def set_evaluation_factor_importance_with_dict(self, value_dict: dict[str, int]):
         assert [
                    ef for ef in self.evaluation_factors_list if ef in value_dict.keys()
                ] == self.evaluation_factors_list
-        for i, value in enumerate(value_dict.values()):
-            self.set_evaluation_factor_importance(i, value)
+        with self._structural_edit():
+            self._evaluation_factor_importance_array = self._checked_importance(
+                [value_dict[evaluation_factor] for evaluation_factor in self.evaluation_factors_list],
+                self.evaluation_factors_list,
+            )
+            self._invalidate_scores()
+            self._invalidate_evaluation_factor_importance()
 
     def set_decision_options_evaluation(self, i: int, k: int, value: int):
-        self.decision_options_evaluation_dict[
-            self.decision_options_list[i]
-        ][self.evaluation_factors_list[k]] = value
-        self.convert_decision_options_evaluation_dict_to_df()
+        if not (isinstance(value, (int, np.integer))
+                and self.MIN_DECISION_OPTION_VALUE <= value <= self.MAX_DECISION_OPTION_VALUE):
+            value = self._checked_ratings(
+                [[value]], [self.evaluation_factors_list[k]], [self.decision_options_list[i]])[0, 0]
+        value = int(value)
+        old_value = int(self._decision_options_evaluation_array[k, i])
+        delta = value - old_value
+        if not delta:
+            return
+        self._record(Change(
+            'set_decision_options_evaluation', (i, k, value), 'set_decision_options_evaluation', (i, k, old_value)))
+        self._make_storage_writeable()
+        self._decision_options_evaluation_array[k, i] = value
+        if self._weighted_sums is not None:
+            self._weighted_sums[i] += delta * int(self._evaluation_factor_importance_array[k])
+            self._check_weighted_sums()
+        self._invalidate_decision_options_evaluation()
 
     def set_decision_options_evaluation_with_dict(self, value_dict: dict[str, dict[str, int]]):
         assert [
@@ -234,52 +801,240 @@ class DecisionMaker:
                        ef for ef in self.evaluation_factors_list
                        if ef in value_dict[decision_option].keys()
                    ] == self.evaluation_factors_list
-        for i, decision_option in enumerate(value_dict.keys()):
-            for k, evaluation_factor in enumerate(value_dict[decision_option].keys()):
-                self.set_decision_options_evaluation(
-                    i, k, value_dict[decision_option][evaluation_factor])
+        with self._structural_edit():
+            self._decision_options_evaluation_array = self._checked_ratings(
+                [
+                    [value_dict[decision_option][evaluation_factor] for decision_option in self.decision_options_list]
+                    for evaluation_factor in self.evaluation_factors_list
+                ],
+                self.evaluation_factors_list, self.decision_options_list,
+            )
+            self._invalidate_scores()
+            self._invalidate_decision_options_evaluation()
 
     def convert_evaluation_factor_importance_dict_to_df(self):
-        self.evaluation_factor_importance_df = pd.DataFrame(
-            self.evaluation_factor_importance_dict.values(),
-            index=self.evaluation_factors_list,
+        self._views['evaluation_factor_importance_df'] = pd.DataFrame(
+            self._evaluation_factor_importance_array.astype(np.int64),
+            index=list(self.evaluation_factors_list),
             columns=['Importance'])
 
     def convert_decision_options_evaluation_dict_to_df(self):
-        self.decision_options_evaluation_df = pd.DataFrame(
-            self.decision_options_evaluation_dict)
+        self._views['decision_options_evaluation_df'] = pd.DataFrame(
+            self._decision_options_evaluation_array.astype(np.int64),
+            index=list(self.evaluation_factors_list),
+            columns=list(self.decision_options_list))
 
     def convert_dicts_to_df(self):
         self.convert_evaluation_factor_importance_dict_to_df()
         self.convert_decision_options_evaluation_dict_to_df()
 
     def set_evaluation_factor_importance_df(self, df: pd.DataFrame):
-        self.evaluation_factor_importance_df = df
         self.set_evaluation_factor_importance_with_dict(
-            self.evaluation_factor_importance_df['Importance'].to_dict()
+            df['Importance'].to_dict()
         )
 
     def set_decision_options_evaluation_df(self, df: pd.DataFrame):
-        self.decision_options_evaluation_df = df
         self.set_decision_options_evaluation_with_dict(
-            self.decision_options_evaluation_df.to_dict()
+            df.to_dict()
         )
 
+    def diff_evaluation_factor_importance_df(self, df: pd.DataFrame) -> list[tuple[str, int, int]]:
+        """
+        Compare an edited importance dataframe to the current importance.
+
+        Returns
+        -------
+        list[tuple[str, int, int]]
+            (evaluation factor, current importance, edited importance) of every changed cell.
+
+        Raises
+        ------
+        InvalidInputError
+            If an importance of the current evaluation factors is missing, not an integer or out of range.
+        """
+        edited_df = df.loc[self.evaluation_factors_list, ['Importance']]
+        result = self.check_decision_dataframe(edited_df)
+        if not result.is_valid:
+            raise InvalidInputError(result.message, result.violations)
+        edited = edited_df['Importance'].to_numpy()
+        current = self._evaluation_factor_importance_array
+        changed = np.flatnonzero(edited != current)
+        return [
+            (self.evaluation_factors_list[k], int(current[k]), int(edited[k]))
+            for k in changed
+        ]
+
+    def diff_decision_options_evaluation_df(self, df: pd.DataFrame) -> list[tuple[str, str, int, int]]:
+        """
+        Compare an edited (evaluation factors x decision options) ratings dataframe to the current ratings.
+
+        Rows and columns that are not current evaluation factors and decision options, like the score row, are ignored.
+
+        Returns
+        -------
+        list[tuple[str, str, int, int]]
+            (decision option, evaluation factor, current rating, edited rating) of every changed cell.
+
+        Raises
+        ------
+        InvalidInputError
+            If a rating of the current decision options is missing, not an integer or out of range.
+        """
+        edited_df = df.loc[self.evaluation_factors_list, self.decision_options_list]
+        # The current importance completes the decision dataframe, only the ratings can be invalid.
+        decision_df = edited_df.copy()
+        decision_df.insert(
+            0, 'Importance', self.evaluation_factor_importance_df['Importance'], allow_duplicates=True)
+        result = self.check_decision_dataframe(decision_df)
+        if not result.is_valid:
+            raise InvalidInputError(result.message, result.violations)
+        edited = edited_df.to_numpy()
+        current = self._decision_options_evaluation_array
+        changed_k, changed_i = np.nonzero(edited != current)
+        return [
+            (self.decision_options_list[i], self.evaluation_factors_list[k], int(current[k, i]), int(edited[k, i]))
+            for k, i in zip(changed_k, changed_i)
+        ]
+
+    def update_evaluation_factor_importance_from_df(self, df: pd.DataFrame) -> list[tuple[str, int, int]]:
+        """Set only the importance cells that differ in an edited dataframe and return the changes."""
+        changes = self.diff_evaluation_factor_importance_df(df)
+        with self.batch():
+            for evaluation_factor, _, value in changes:
+                self.set_evaluation_factor_importance(self.evaluation_factor_index[evaluation_factor], value)
+        return changes
+
+    def update_decision_options_evaluation_from_df(self, df: pd.DataFrame) -> list[tuple[str, str, int, int]]:
+        """Set only the rating cells that differ in an edited dataframe and return the changes."""
+        changes = self.diff_decision_options_evaluation_df(df)
+        with self.batch():
+            for decision_option, evaluation_factor, _, value in changes:
+                self.set_decision_options_evaluation(
+                    self.decision_option_index[decision_option], self.evaluation_factor_index[evaluation_factor], value)
+        return changes
+
     def compute_decision_options_evaluation_adj_by_importance_df(self):
-        self.decision_options_evaluation_adj_by_importance_df = (
-                self.decision_options_evaluation_df.mul(
-                    self.evaluation_factor_importance_df['Importance'], axis=0
-                ) / self.evaluation_factor_importance_df['Importance'].sum()
-        )
-        self.decision_options_evaluation_adj_by_importance_df.loc['Score'] = \
-            self.decision_options_evaluation_adj_by_importance_df.sum()
+        if self._adj_by_importance_version == self.version:
+            return
+        weighted_sums, importance_total = self._get_weighted_sums()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.decision_options_evaluation_adj_by_importance_df = pd.DataFrame(
+                self._decision_options_evaluation_array.astype(np.int64)
+                * self._evaluation_factor_importance_array.astype(np.int64)[:, None] / importance_total,
+                index=list(self.evaluation_factors_list),
+                columns=list(self.decision_options_list),
+            )
+            self.decision_options_evaluation_adj_by_importance_df.loc['Score'] = weighted_sums / importance_total
+        self._adj_by_importance_version = self.version
 
     def compute_decision_score(self):
-        self.decision_options_evaluation_df.loc['Score'] = (
-                self.decision_options_evaluation_df.T.dot(
-                    self.evaluation_factor_importance_df['Importance']
-                ) / sum(list(self.evaluation_factor_importance_dict.values()))
-        ).round(1).T
+        if self._score_version == self.version and 'Score' in self.decision_options_evaluation_df.index:
+            return
+        weighted_sums, importance_total = self._get_weighted_sums()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.decision_options_evaluation_df.loc['Score'] = (weighted_sums / importance_total).round(1)
+        self._score_version = self.version
+        self._save_options.clear()
+
+    def compute_scenario_scores(
+            self,
+            importance: Union[pd.DataFrame, np.ndarray],
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Score decision options under many importance scenarios with a single matrix multiply.
+
+        Parameters
+        ----------
+        importance: pd.DataFrame or np.ndarray
+            (scenarios x evaluation factors) importance matrix. Dataframe columns are matched
+            to `evaluation_factors_list` by label, array columns by position.
+            Weights can be fractional, they are normalised within each scenario.
+
+        Returns
+        -------
+        tuple[pd.DataFrame, pd.DataFrame]
+            (scenarios x decision options) scores, rounded and normalised like `compute_decision_score`,
+            and the rank of each decision option within its scenario (1 is the best).
+
+        Raises
+        ------
+        InvalidInputError
+            If a weight is negative or not finite, or the weights of a scenario sum to zero.
+        """
+        scenarios, importance = self._scenario_importance(importance)
+        scores = (
+            importance @ self._decision_options_evaluation_array.astype(np.float64)
+            / importance.sum(axis=1, keepdims=True)
+        ).round(1)
+        scores_df = pd.DataFrame(scores, index=scenarios, columns=list(self.decision_options_list))
+        rankings_df = scores_df.rank(axis=1, method='min', ascending=False).astype(np.int64)
+        return scores_df, rankings_df
+
+    def _scenario_importance(self, importance: Union[pd.DataFrame, np.ndarray]) -> tuple[pd.Index, np.ndarray]:
+        if isinstance(importance, pd.DataFrame):
+            missing_evaluation_factors = [
+                ef for ef in self.evaluation_factors_list if ef not in importance.columns]
+            if missing_evaluation_factors:
+                raise InvalidInputError(
+                    f"Invalid input: importance scenarios miss evaluation factors {missing_evaluation_factors}.")
+            scenarios = importance.index
+            importance = importance[self.evaluation_factors_list].to_numpy()
+        else:
+            importance = np.atleast_2d(importance)
+            scenarios = pd.RangeIndex(importance.shape[0])
+        if importance.ndim != 2 or importance.shape[1] != self.evaluation_factors_count:
+            raise InvalidInputError(
+                f"Invalid input: importance scenarios must have {self.evaluation_factors_count} columns, "
+                f"not shape {importance.shape}.")
+        try:
+            importance = importance.astype(np.float64)
+        except (TypeError, ValueError):
+            raise InvalidInputError("Invalid input: importance scenarios must be numbers.") from None
+        invalid = ~np.isfinite(importance) | (importance < 0)
+        if invalid.any():
+            raise InvalidInputError(
+                f"Invalid input: importance scenarios must be finite and non-negative, "
+                f"found in scenarios {scenarios[invalid.any(axis=1)].tolist()}.")
+        without_importance = importance.sum(axis=1) == 0
+        if without_importance.any():
+            raise InvalidInputError(
+                f"Invalid input: importance scenarios must have some importance, "
+                f"found scenarios {scenarios[without_importance].tolist()} without any.")
+        return scenarios, importance
+
+    def score(self, engine: Union[str, ScoringEngine] = 'weighted_sum', **params) -> ScoringResult:
+        """
+        Score decision options with a registered scoring engine, cached for the current version.
+
+        Parameters
+        ----------
+        engine: str or ScoringEngine
+            Name of an engine in `scoring_engines` or an unregistered engine.
+        params:
+            Engine parameters. The `stakeholder_importance` of the min-regret engine can be a dataframe
+            or an array of importance scenarios, as in `compute_scenario_scores`.
+
+        Returns
+        -------
+        ScoringResult
+            Scores by decision option, which `plot_score` and `style_score_df` can render.
+        """
+        engine = get_scoring_engine(engine)
+        if params.get('stakeholder_importance') is not None:
+            params['stakeholder_importance'] = self._scenario_importance(params['stakeholder_importance'])[1]
+
+        def build():
+            scores = engine.score(
+                self._decision_options_evaluation_array.astype(np.float64),
+                self._evaluation_factor_importance_array.astype(np.float64),
+                **params,
+            )
+            return ScoringResult(
+                engine.name, engine.label, pd.Series(scores, index=list(self.decision_options_list), name='Score'),
+                engine.decimals,
+            )
+
+        return self._render('score', build, engine.name, engine.score, *sorted(params.items()))
 
     def set_attributes(
             self,
@@ -290,6 +1045,27 @@ class DecisionMaker:
             evaluation_factors_list: list[str] = None,
             evaluation_factor_importance_dict: dict[str, int] = None,
             decision_options_evaluation_dict: dict[str, dict[str, int]] = None,
+    ):
+        with self.batch(), self._structural_edit():
+            self._set_attributes(
+                decision=decision,
+                decision_options_count=decision_options_count,
+                decision_options_list=decision_options_list,
+                evaluation_factors_count=evaluation_factors_count,
+                evaluation_factors_list=evaluation_factors_list,
+                evaluation_factor_importance_dict=evaluation_factor_importance_dict,
+                decision_options_evaluation_dict=decision_options_evaluation_dict,
+            )
+
+    def _set_attributes(
+            self,
+            decision: str,
+            decision_options_count: int,
+            decision_options_list: list[str],
+            evaluation_factors_count: int,
+            evaluation_factors_list: list[str],
+            evaluation_factor_importance_dict: dict[str, int],
+            decision_options_evaluation_dict: dict[str, dict[str, int]],
     ):
         self.set_decision(decision)
 
@@ -317,6 +1093,46 @@ class DecisionMaker:
             return
         self.set_decision_options_evaluation_with_dict(decision_options_evaluation_dict)
 
+    def set_attributes_from_arrays(
+            self,
+            decision: str,
+            decision_options_list: list[str],
+            evaluation_factors_list: list[str],
+            evaluation_factor_importance_array: np.ndarray,
+            decision_options_evaluation_array: np.ndarray,
+            copy: bool = True,
+    ):
+        """
+        Replace the whole decision with label lists and storage arrays.
+
+        With `copy=False` writable arrays of the storage dtypes (including copy-on-write memory maps)
+        are used as storage directly, and frozen arrays (see `is_frozen_array`) are shared
+        until the first in-place edit copies them.
+        """
+        assert evaluation_factor_importance_array.shape == (len(evaluation_factors_list),)
+        assert decision_options_evaluation_array.shape == (len(evaluation_factors_list), len(decision_options_list))
+        self._check_unique_labels("decision option", decision_options_list)
+        self._check_unique_labels("evaluation factor", evaluation_factors_list)
+        with self.batch(), self._structural_edit():
+            self.set_decision(decision)
+            self.decision_options_count = len(decision_options_list)
+            self.decision_option_labels = LabelIndex(decision_options_list)
+            self.evaluation_factors_count = len(evaluation_factors_list)
+            self.evaluation_factor_labels = LabelIndex(evaluation_factors_list)
+            self._evaluation_factor_importance_array = self._as_storage_array(
+                evaluation_factor_importance_array, self.EVALUATION_FACTOR_IMPORTANCE_DTYPE, copy)
+            self._decision_options_evaluation_array = self._as_storage_array(
+                decision_options_evaluation_array, self.DECISION_OPTION_VALUE_DTYPE, copy)
+            self._invalidate_scores()
+            self._invalidate_labels()
+
+    @staticmethod
+    def _as_storage_array(array: np.ndarray, dtype: np.dtype, copy: bool) -> np.ndarray:
+        if copy:
+            return np.array(array, dtype=dtype, order='C')
+        array = np.ascontiguousarray(array, dtype=dtype)
+        return array if array.flags.writeable or is_frozen_array(array) else array.copy()
+
     def set_attributes_from(self, other):
         self.set_attributes(
             decision=other.decision,
@@ -328,29 +1144,87 @@ class DecisionMaker:
             decision_options_evaluation_dict=other.decision_options_evaluation_dict,
         )
 
+    @staticmethod
+    def _render_key_part(value) -> Hashable:
+        # Colormaps are compared by their colors, as callers may build an equal colormap on every call.
+        # A colormap can only exist once matplotlib is imported, so it is never imported here.
+        colors = sys.modules.get('matplotlib.colors')
+        if colors is not None and isinstance(value, colors.Colormap):
+            return value.name, value(np.linspace(0, 1, value.N)).tobytes()
+        if isinstance(value, list):
+            return tuple(value)
+        if isinstance(value, np.ndarray):
+            return value.shape, value.tobytes()
+        if isinstance(value, tuple):
+            return tuple(DecisionMaker._render_key_part(part) for part in value)
+        # Results are compared by their scores, which may be computed again for every call.
+        if isinstance(value, ScoringResult):
+            return value.engine, tuple(value.scores.index), value.scores.to_numpy().tobytes(), value.decimals
+        return value
+
+    def compact(self):
+        """
+        Release derived state that is cheap to rebuild, to keep long-lived decision makers small.
+
+        Dict and label views are dropped and rebuilt on access, the dataframes used for rendering are kept.
+        Artifacts rendered for older versions, which can no longer be hit, are evicted from the render cache.
+        """
+        for name in [name for name in self._views if name not in self.DATAFRAME_VIEWS]:
+            del self._views[name]
+        current = (self.version, self._adj_by_importance_version, self._score_version)
+        self.render_cache.discard(lambda key: key[1:4] != current)
+
+    def _render(self, name: str, build: Callable[[], Any], *params):
+        """Return the artifact rendered by `build` for the current version, scores and `params` from the cache."""
+        key = (
+            name, self.version, self._adj_by_importance_version, self._score_version,
+            *(self._render_key_part(param) for param in params),
+        )
+        return self.render_cache.get_or_build(key, build)
+
+    def _score_df(self, result: ScoringResult = None) -> pd.DataFrame:
+        return self.decision_options_evaluation_df.T[['Score']] if result is None else result.score_df
+
     def style_score_df(
             self,
             sort_ascending: bool = False,
-            format_str: str = '{:.1f}',
-            cmap: cmap_input = 'PuBu'
+            format_str: str = None,
+            cmap: cmap_input = 'PuBu',
+            result: ScoringResult = None,
     ):
-        return (
-            self.decision_options_evaluation_df.T[['Score']]
-            .sort_values('Score', ascending=sort_ascending)
-            .style.format(format_str).background_gradient(cmap=cmap)
+        """Style the decision scores, or the scores of a scoring engine `result`, formatted to its decimals."""
+        format_str = format_str or ('{:.1f}' if result is None else result.format_str)
+        return self._render(
+            'style_score_df',
+            lambda: (
+                self._score_df(result)
+                .sort_values('Score', ascending=sort_ascending)
+                .style.format(format_str).background_gradient(cmap=cmap)
+            ),
+            sort_ascending, format_str, cmap, result,
         )
 
-    def plot_score(self, sort_ascending: bool = True, color_discrete_sequence: list[str] = plotly_cmap_default):
-        fig = px.bar(
-            self.decision_options_evaluation_df.T[['Score']].sort_values("Score", ascending=sort_ascending),
-            x='Score', text='Score', orientation='h',
-            labels={"index": "Decision option", "Score": "Decision score"},
-            title="Decision options ranked by decision score",
-            color_discrete_sequence=color_discrete_sequence,
-        )
-        fig.update_traces(textposition='outside', cliponaxis=False, textangle=0)
+    def plot_score(
+            self,
+            sort_ascending: bool = True,
+            color_discrete_sequence: list[str] = plotly_cmap_default,
+            result: ScoringResult = None,
+    ):
+        """Plot the decision scores, or the scores of a scoring engine `result`, as a ranked bar chart."""
+        def build():
+            import plotly.express as px
 
-        return fig
+            fig = px.bar(
+                self._score_df(result).sort_values("Score", ascending=sort_ascending),
+                x='Score', text='Score', orientation='h',
+                labels={"index": "Decision option", "Score": "Decision score"},
+                title=f"Decision options ranked by {'decision' if result is None else result.label} score",
+                color_discrete_sequence=color_discrete_sequence,
+            )
+            fig.update_traces(textposition='outside', cliponaxis=False, textangle=0)
+            return fig
+
+        return self._render('plot_score', build, sort_ascending, color_discrete_sequence, result)
 
     def style_decision_options_evaluation_df(
             self,
@@ -358,145 +1232,279 @@ class DecisionMaker:
             format_str: str = '{:.1f}',
             cmap: cmap_input = 'PuBu'
     ):
-        return (
-            self.decision_options_evaluation_df.T
-            .sort_values('Score', ascending=sort_ascending)
-            .style.format({
-                **{'Score': format_str},
-                **{col: '{:.0f}'
-                   for col in self.decision_options_evaluation_df.T.columns
-                   if col != 'Score'}
-            }).background_gradient(axis=None, cmap=cmap)
+        return self._render(
+            'style_decision_options_evaluation_df',
+            lambda: (
+                self.decision_options_evaluation_df.T
+                .sort_values('Score', ascending=sort_ascending)
+                .style.format({
+                    **{'Score': format_str},
+                    **{col: '{:.0f}'
+                       for col in self.decision_options_evaluation_df.T.columns
+                       if col != 'Score'}
+                }).background_gradient(axis=None, cmap=cmap)
+            ),
+            sort_ascending, format_str, cmap,
         )
 
     def plot_decision_options_evaluation_df(self, color_discrete_sequence: list[str] = plotly_cmap_default):
-        fig = (
-            self.decision_options_evaluation_df
-            .drop(index=['Score']).plot.bar(
-                barmode="group", text="value",
-                labels=dict(index="Importance factor", value="Factor value", variable="Decision option"),
-                color_discrete_sequence=color_discrete_sequence,
+        def build():
+            fig = (
+                self.decision_options_evaluation_df
+                .drop(index=['Score']).plot.bar(
+                    barmode="group", text="value",
+                    labels=dict(index="Importance factor", value="Factor value", variable="Decision option"),
+                    color_discrete_sequence=color_discrete_sequence,
+                    backend="plotly",
+                )
             )
-        )
-        fig.update_traces(textposition='outside', cliponaxis=False, textangle=0)
-        fig.update_layout(legend=dict(
-            orientation="h",
-            yanchor="auto",
-            y=-0.5,
-            xanchor="auto",
-        ))
-        return fig
+            fig.update_traces(textposition='outside', cliponaxis=False, textangle=0)
+            fig.update_layout(legend=dict(
+                orientation="h",
+                yanchor="auto",
+                y=-0.5,
+                xanchor="auto",
+            ))
+            return fig
+
+        return self._render('plot_decision_options_evaluation_df', build, color_discrete_sequence)
 
     def style_decision_options_evaluation_adj_by_importance_df(
             self,
             format_str: str = '{:.1f}',
             cmap: cmap_input = 'PuBu'
     ):
-        return (
-            self.decision_options_evaluation_adj_by_importance_df
-            .style.format(format_str).background_gradient(axis=None, cmap=cmap)
+        return self._render(
+            'style_decision_options_evaluation_adj_by_importance_df',
+            lambda: (
+                self.decision_options_evaluation_adj_by_importance_df
+                .style.format(format_str).background_gradient(axis=None, cmap=cmap)
+            ),
+            format_str, cmap,
         )
 
     def plot_decision_options_evaluation_adj_by_importance_df(
             self, color_discrete_sequence: list[str] = plotly_cmap_default):
-        fig = (
-            self.decision_options_evaluation_adj_by_importance_df
-            .drop(index=['Score']).T.round(1).plot.bar(
-                text="value",
-                labels=dict(index="Decision option", value="Factor value", variable="Importance factor"),
-                color_discrete_sequence=color_discrete_sequence,
+        def build():
+            fig = (
+                self.decision_options_evaluation_adj_by_importance_df
+                .drop(index=['Score']).T.round(1).plot.bar(
+                    text="value",
+                    labels=dict(index="Decision option", value="Factor value", variable="Importance factor"),
+                    color_discrete_sequence=color_discrete_sequence,
+                    backend="plotly",
+                )
             )
-        )
-        fig.update_traces(textposition='inside', cliponaxis=False, textangle=0)
-        fig.update_layout(legend=dict(
-            orientation="h",
-            yanchor="auto",
-            y=-1,
-            xanchor="auto",
-        ))
-        return fig
+            fig.update_traces(textposition='inside', cliponaxis=False, textangle=0)
+            fig.update_layout(legend=dict(
+                orientation="h",
+                yanchor="auto",
+                y=-1,
+                xanchor="auto",
+            ))
+            return fig
+
+        return self._render(
+            'plot_decision_options_evaluation_adj_by_importance_df', build, color_discrete_sequence)
 
     def to_dataframe(self) -> pd.DataFrame:
         df = self.decision_options_evaluation_df.join(self.evaluation_factor_importance_df)
         df.index.name = self.decision
         return df
 
+    @staticmethod
+    def check_decision_dataframe(df: pd.DataFrame, result: ValidationResult = None) -> ValidationResult:
+        """Find every violation in a decision dataframe, see `decision_validation.validate_decision_dataframe`."""
+        return validate_decision_dataframe(
+            df,
+            importance_range=(DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE,
+                              DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE),
+            rating_range=(DecisionMaker.MIN_DECISION_OPTION_VALUE, DecisionMaker.MAX_DECISION_OPTION_VALUE),
+            result=result,
+        )
+
     @staticmethod
     def validate_decision_dataframe(df: pd.DataFrame):
-        if "Importance" not in df.columns:
-            return "Invalid input: 'Importance' column must be present in decision dataframe."
-        if df.columns.duplicated().sum() > 0:
-            return "Invalid input: decision dataframe must have no duplicated column names."
-        if df.index.duplicated().sum() > 0:
-            return "Invalid input: decision dataframe must have no duplicated row names."
-        if df.isna().sum().sum() > 0:
-            return "Invalid input: decision dataframe must have no missing values."
-        non_int_types = [col for col in df.astype(int, errors='ignore').dtypes if col not in ["int32", "int64"]]
-        if len(non_int_types) > 0:
-            return (
-                "Invalid input: decision dataframe must only have integer values, "
-                f"not {non_int_types}.")
-        if (
-                (df['Importance'] > DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE)
-                | (df['Importance'] < DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE)
-        ).sum() > 0:
-            return (
-                "Invalid input: Importance values must be between "
-                f"{DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE} and "
-                f"{DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE}.")
-        if (
-                (df.drop(columns=['Importance']) > DecisionMaker.MAX_DECISION_OPTION_VALUE)
-                | (df.drop(columns=['Importance']) < DecisionMaker.MIN_DECISION_OPTION_VALUE)
-        ).sum().sum() > 0:
-            return (
-                "Invalid input: Decision evaluation values must be between "
-                f"{DecisionMaker.MAX_DECISION_OPTION_VALUE} and "
-                f"{DecisionMaker.MIN_DECISION_OPTION_VALUE}.")
+        return DecisionMaker.check_decision_dataframe(df).message
+
+    @staticmethod
+    def check_decision_arrays(
+            evaluation_factor_importance_array: np.ndarray,
+            decision_options_evaluation_array: np.ndarray,
+            evaluation_factors_list: list[str] = None,
+            decision_options_list: list[str] = None,
+            result: ValidationResult = None,
+    ) -> ValidationResult:
+        """Find every out of range value of integer storage arrays, located by label when labels are given."""
+        result = ValidationResult() if result is None else result
+        evaluation_factors_count, decision_options_count = decision_options_evaluation_array.shape
+        evaluation_factors_list = evaluation_factors_list or list(range(evaluation_factors_count))
+        decision_options_list = decision_options_list or list(range(decision_options_count))
+        importance_range = (DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE,
+                            DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE)
+        rating_range = (DecisionMaker.MIN_DECISION_OPTION_VALUE, DecisionMaker.MAX_DECISION_OPTION_VALUE)
+        validate_value_range(
+            evaluation_factor_importance_array, importance_range, importance_range_message(importance_range),
+            evaluation_factors_list, ["Importance"], result)
+        validate_value_range(
+            decision_options_evaluation_array, rating_range, rating_range_message(rating_range),
+            evaluation_factors_list, decision_options_list, result)
+        return result
+
+    @staticmethod
+    def validate_decision_arrays(
+            evaluation_factor_importance_array: np.ndarray,
+            decision_options_evaluation_array: np.ndarray
+    ):
+        return DecisionMaker.check_decision_arrays(
+            evaluation_factor_importance_array, decision_options_evaluation_array).message
 
     @staticmethod
     def raise_invalid_input_error(df: pd.DataFrame):
-        error_message = DecisionMaker.validate_decision_dataframe(df)
-        if error_message:
-            raise InvalidInputError(error_message)
+        result = DecisionMaker.check_decision_dataframe(df)
+        if not result.is_valid:
+            raise InvalidInputError(result.message, result.violations)
 
     def from_dataframe(
             self,
             df: pd.DataFrame,
             errors: Literal["raise", "message", "ignore"] = "raise"
     ):
-        df = df.loc[[c for c in df.index if c != 'Score']]
-        if errors != "ignore":
-            if errors == "raise":
-                self.raise_invalid_input_error(df)
-            if errors == "message":
-                error_message = self.validate_decision_dataframe(df)
-                if error_message:
-                    return error_message
+        return self.from_dataframe_chunks([df], errors=errors)
+
+    def from_dataframe_chunks(
+            self,
+            chunks: Iterable[pd.DataFrame],
+            errors: Literal["raise", "message", "ignore"] = "raise"
+    ):
+        """
+        Load a decision dataframe split into chunks of evaluation factor rows.
 
-        decision_options_list = [c for c in df.columns if c not in ['Importance']]
-        evaluation_factors_list = df.index.tolist()
-        df = df.loc[evaluation_factors_list]
+        Each chunk is validated on its own and converted straight to the storage dtypes, so only
+        one chunk is held as a dataframe at a time. Violations of every chunk are collected,
+        the decision maker is updated only if there are none.
+        """
+        decision = None
+        decision_options_list = None
+        evaluation_factors_list = []
+        evaluation_factor_importance_chunks = []
+        decision_options_evaluation_chunks = []
+        result = ValidationResult()
+        for chunk in chunks:
+            chunk = chunk[chunk.index != 'Score']
+            if decision_options_list is None:
+                decision = chunk.index.name
+                decision_options_list = [c for c in chunk.columns if c not in ['Importance']]
+            if errors != "ignore":
+                self.check_decision_dataframe(chunk, result)
+                if evaluation_factors_list:
+                    for row in chunk.index[chunk.index.isin(evaluation_factors_list)].unique():
+                        result.add(Violation(DUPLICATED_ROW_MESSAGE, row=row))
+            evaluation_factors_list.extend(chunk.index.tolist())
+            if not result.is_valid:
+                # Keep validating the remaining chunks, without converting them.
+                continue
+            # Values the storage dtypes cannot hold are refused even when validation errors are ignored.
+            evaluation_factor_importance_chunks.append(
+                self._checked_importance(chunk['Importance'].to_numpy(), chunk.index.tolist()))
+            decision_options_evaluation_chunks.append(
+                self._checked_ratings(chunk[decision_options_list].to_numpy(), chunk.index.tolist(),
+                                      decision_options_list))
 
-        self.set_attributes(
-            decision=df.index.name,
-            decision_options_count=len(decision_options_list),
+        if not result.is_valid:
+            if errors == "raise":
+                raise InvalidInputError(result.message, result.violations)
+            return result.message
+        if decision_options_list is None:
+            return
+        self.set_attributes_from_arrays(
+            decision=decision,
             decision_options_list=decision_options_list,
-            evaluation_factors_count=len(evaluation_factors_list),
             evaluation_factors_list=evaluation_factors_list,
-            evaluation_factor_importance_dict=df['Importance'].to_dict(),
-            decision_options_evaluation_dict=df.drop(columns=['Importance']).to_dict()
+            evaluation_factor_importance_array=np.concatenate(evaluation_factor_importance_chunks),
+            decision_options_evaluation_array=np.concatenate(decision_options_evaluation_chunks, axis=0),
+            copy=False,
+        )
+
+    def from_csv(
+            self,
+            path_or_buffer,
+            chunksize: int = IMPORT_CHUNK_SIZE,
+            errors: Literal["raise", "message", "ignore"] = "raise"
+    ):
+        with pd.read_csv(path_or_buffer, index_col=0, chunksize=chunksize) as chunks:
+            return self.from_dataframe_chunks(chunks, errors=errors)
+
+    def from_excel(
+            self,
+            path_or_buffer,
+            chunksize: int = IMPORT_CHUNK_SIZE,
+            errors: Literal["raise", "message", "ignore"] = "raise"
+    ):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path_or_buffer, read_only=True, data_only=True)
+        try:
+            return self.from_dataframe_chunks(
+                iter_worksheet_chunks(workbook.active, chunksize), errors=errors)
+        finally:
+            workbook.close()
+
+    def from_binary(
+            self,
+            path_or_buffer,
+            errors: Literal["raise", "message", "ignore"] = "raise"
+    ):
+        """
+        Load a binary decision file written by `to_binary`.
+
+        Files on disk are memory-mapped copy-on-write and used as storage without copying.
+        Validation is a header check and a vectorized range check of the ratings and importance.
+        """
+        result = ValidationResult()
+        try:
+            header, decision_options_evaluation_array, evaluation_factor_importance_array = \
+                read_decision_file(path_or_buffer)
+            if errors != "ignore":
+                self.check_decision_arrays(
+                    evaluation_factor_importance_array, decision_options_evaluation_array,
+                    header['evaluation_factors_list'], header['decision_options_list'], result)
+        except DecisionFileError as e:
+            result.add(Violation(str(e)))
+        if not result.is_valid:
+            if errors == "message":
+                return result.message
+            raise InvalidInputError(result.message, result.violations)
+
+        self.set_attributes_from_arrays(
+            decision=header.get('decision'),
+            decision_options_list=header['decision_options_list'],
+            evaluation_factors_list=header['evaluation_factors_list'],
+            evaluation_factor_importance_array=evaluation_factor_importance_array,
+            decision_options_evaluation_array=decision_options_evaluation_array,
+            copy=False,
         )
 
     @property
-    def save_options(self):
-        return {
-            'csv': self.to_csv(),
-            'xlsx': self.to_excel_writer()
-        }
+    def save_options(self) -> SaveOptions:
+        return self._save_options
 
     def to_csv(self, path: str = None):
         return self.to_dataframe().to_csv(path)
 
+    def to_binary(self, path: str = None):
+        data = write_decision_file(
+            decision=self.decision,
+            decision_options_list=self.decision_options_list,
+            evaluation_factors_list=self.evaluation_factors_list,
+            evaluation_factor_importance=self._evaluation_factor_importance_array,
+            decision_options_evaluation=self._decision_options_evaluation_array,
+        )
+        if path is None:
+            return data
+        with open(path, 'wb') as f:
+            f.write(data)
+
     def to_excel_writer(self, path: str = None):
         buffer = io.BytesIO()
         # Create a Pandas Excel writer using XlsxWriter as the engine.
@@ -507,3 +1515,7 @@ class DecisionMaker:
             # Close the Pandas Excel writer and output the Excel file to the buffer
             writer.close()
             return buffer
+
+    def _to_xlsx_bytes(self) -> bytes:
+        """The xlsx file as bytes, which unlike the buffer of `to_excel_writer` can be cached and shared."""
+        return self.to_excel_writer().getvalue()
@@ -1,3 +1,5 @@
+import numpy as np
+
 from decision_maker import DecisionMaker
 
 default_decision = "What is the best way to take decisions?"
@@ -20,13 +22,41 @@ default_decision_options_evaluation_dict = {
         for factor in default_evaluation_factors_list
     } for decision in default_decision_options_list
 }
-default_decision_maker = DecisionMaker()
-default_decision_maker.set_attributes(
-    decision=default_decision,
-    decision_options_count=len(default_decision_options_list),
-    decision_options_list=default_decision_options_list,
-    evaluation_factors_count=len(default_evaluation_factors_list),
-    evaluation_factors_list=default_evaluation_factors_list,
-    evaluation_factor_importance_dict=default_evaluation_factor_importance_dict,
-    decision_options_evaluation_dict=default_decision_options_evaluation_dict
+# Frozen storage arrays of the default decision, precomputed once at import; the default decision maker
+# is only built from them on first access, see `__getattr__`.
+default_evaluation_factor_importance_array = np.array(
+    [default_evaluation_factor_importance_dict[factor] for factor in default_evaluation_factors_list],
+    dtype=DecisionMaker.EVALUATION_FACTOR_IMPORTANCE_DTYPE,
+)
+default_evaluation_factor_importance_array.flags.writeable = False
+default_decision_options_evaluation_array = np.array(
+    [
+        [default_decision_options_evaluation_dict[decision_option][factor]
+         for decision_option in default_decision_options_list]
+        for factor in default_evaluation_factors_list
+    ],
+    dtype=DecisionMaker.DECISION_OPTION_VALUE_DTYPE,
 )
+default_decision_options_evaluation_array.flags.writeable = False
+
+
+def set_attributes_from_default(decision_maker: DecisionMaker):
+    """Load the default decision into a decision maker, sharing its frozen arrays until the first edit."""
+    decision_maker.set_attributes_from_arrays(
+        decision=default_decision,
+        decision_options_list=default_decision_options_list,
+        evaluation_factors_list=default_evaluation_factors_list,
+        evaluation_factor_importance_array=default_evaluation_factor_importance_array,
+        decision_options_evaluation_array=default_decision_options_evaluation_array,
+        copy=False,
+    )
+
+
+def __getattr__(name: str):
+    if name == "default_decision_maker":
+        decision_maker = DecisionMaker()
+        set_attributes_from_default(decision_maker)
+        decision_maker.history.clear()
+        globals()[name] = decision_maker
+        return decision_maker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
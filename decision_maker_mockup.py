@@ -1,3 +1,5 @@
+import numpy as np
+
 from decision_maker import DecisionMaker
 
 example_decision = "What is the best way to take decisions?"
@@ -45,13 +47,41 @@ example_decision_options_evaluation_dict = {
         "Certainty": 9
     }
 }
-example_decision_maker = DecisionMaker()
-example_decision_maker.set_attributes(
-    decision=example_decision,
-    decision_options_count=len(example_decision_options_list),
-    decision_options_list=example_decision_options_list,
-    evaluation_factors_count=len(example_evaluation_factors_list),
-    evaluation_factors_list=example_evaluation_factors_list,
-    evaluation_factor_importance_dict=example_evaluation_factor_importance_dict,
-    decision_options_evaluation_dict=example_decision_options_evaluation_dict
+# Frozen storage arrays of the example decision, precomputed once at import; the example decision maker
+# is only built from them on first access, see `__getattr__`.
+example_evaluation_factor_importance_array = np.array(
+    [example_evaluation_factor_importance_dict[factor] for factor in example_evaluation_factors_list],
+    dtype=DecisionMaker.EVALUATION_FACTOR_IMPORTANCE_DTYPE,
+)
+example_evaluation_factor_importance_array.flags.writeable = False
+example_decision_options_evaluation_array = np.array(
+    [
+        [example_decision_options_evaluation_dict[decision_option][factor]
+         for decision_option in example_decision_options_list]
+        for factor in example_evaluation_factors_list
+    ],
+    dtype=DecisionMaker.DECISION_OPTION_VALUE_DTYPE,
 )
+example_decision_options_evaluation_array.flags.writeable = False
+
+
+def set_attributes_from_example(decision_maker: DecisionMaker):
+    """Load the example decision into a decision maker, sharing its frozen arrays until the first edit."""
+    decision_maker.set_attributes_from_arrays(
+        decision=example_decision,
+        decision_options_list=example_decision_options_list,
+        evaluation_factors_list=example_evaluation_factors_list,
+        evaluation_factor_importance_array=example_evaluation_factor_importance_array,
+        decision_options_evaluation_array=example_decision_options_evaluation_array,
+        copy=False,
+    )
+
+
+def __getattr__(name: str):
+    if name == "example_decision_maker":
+        decision_maker = DecisionMaker()
+        set_attributes_from_example(decision_maker)
+        decision_maker.history.clear()
+        globals()[name] = decision_maker
+        return decision_maker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,226 @@
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Union
+
+import numpy as np
+import pandas as pd
+
+MISSING_IMPORTANCE_MESSAGE = "Invalid input: 'Importance' column must be present in decision dataframe."
+DUPLICATED_COLUMN_MESSAGE = "Invalid input: decision dataframe must have no duplicated column names."
+DUPLICATED_ROW_MESSAGE = "Invalid input: decision dataframe must have no duplicated row names."
+MISSING_VALUE_MESSAGE = "Invalid input: decision dataframe must have no missing values."
+NON_INTEGER_MESSAGE = "Invalid input: decision dataframe must only have integer values."
+
+
+def importance_range_message(importance_range: tuple[int, int]) -> str:
+    return f"Invalid input: Importance values must be between {importance_range[1]} and {importance_range[0]}."
+
+
+def rating_range_message(rating_range: tuple[int, int]) -> str:
+    return f"Invalid input: Decision evaluation values must be between {rating_range[1]} and {rating_range[0]}."
+
+
+@dataclass(frozen=True)
+class Violation:
+    """
+    A broken validation rule, at a row and column label of the decision dataframe.
+
+    Row-level violations have no column and column-level violations have no row.
+    """
+    message: str
+    row: Hashable = None
+    column: Hashable = None
+    value: Any = None
+
+    @property
+    def location(self) -> Union[str, None]:
+        if self.row is None and self.column is None:
+            return None
+        if self.column is None:
+            return f"row '{self.row}'"
+        if self.row is None:
+            return f"column '{self.column}'"
+        return f"('{self.row}', '{self.column}')"
+
+
+@dataclass
+class ValidationResult:
+    """
+    Violations found by validation, in the order they were found.
+
+    Only the first `max_violations` violations are kept, `violation_count` counts all of them.
+    """
+    violations: list[Violation] = field(default_factory=list)
+    violation_count: int = 0
+    max_violations: int = 1000
+    max_locations: int = 5
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.violation_count
+
+    def add(self, violation: Violation):
+        self.violation_count += 1
+        if len(self.violations) < self.max_violations:
+            self.violations.append(violation)
+
+    @property
+    def message(self) -> Union[str, None]:
+        """One line per broken rule with the locations of its first violations, None when valid."""
+        if self.is_valid:
+            return None
+        locations: dict[str, list[str]] = {}
+        for violation in self.violations:
+            rule_locations = locations.setdefault(violation.message, [])
+            if violation.location is not None:
+                rule_locations.append(violation.location)
+        lines = []
+        for message, rule_locations in locations.items():
+            if not rule_locations:
+                lines.append(message)
+                continue
+            listed = ", ".join(rule_locations[:self.max_locations])
+            if len(rule_locations) > self.max_locations:
+                listed += f" and {len(rule_locations) - self.max_locations} more"
+            lines.append(f"{message.rstrip('.')}, found at {listed}.")
+        if self.violation_count > len(self.violations):
+            lines.append(f"{self.violation_count - len(self.violations)} more violations were not listed.")
+        return "\n".join(lines)
+
+
+def _as_float_values(df: pd.DataFrame, dtypes: set) -> tuple[np.ndarray, np.ndarray]:
+    # Numeric frames are converted in one allocation; only object columns are parsed on their own.
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes):
+        return df.to_numpy(dtype=np.float64, na_value=np.nan), np.zeros(df.shape, dtype=bool)
+    values = np.empty(df.shape, dtype=np.float64)
+    non_numeric = np.zeros(df.shape, dtype=bool)
+    for j in range(df.shape[1]):
+        column = df.iloc[:, j]
+        if pd.api.types.is_numeric_dtype(column.dtype):
+            values[:, j] = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values[:, j] = pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            non_numeric[:, j] = np.isnan(values[:, j]) & column.notna().to_numpy()
+    return values, non_numeric
+
+
+def _add_violations(
+        mask: np.ndarray,
+        messages: Union[str, list[str]],
+        values: np.ndarray,
+        row_labels: list,
+        column_labels: list,
+        result: ValidationResult,
+):
+    # Only the flagged cells are visited, valid values are never touched in Python.
+    if not mask.any():
+        return
+    rows, columns = np.nonzero(mask)
+    for i, j in zip(rows.tolist(), columns.tolist()):
+        result.add(Violation(
+            messages if isinstance(messages, str) else messages[j],
+            row=row_labels[i], column=column_labels[j], value=values[i, j].item(),
+        ))
+
+
+def validate_value_range(
+        values: np.ndarray,
+        value_range: tuple[int, int],
+        message: str,
+        row_labels: list,
+        column_labels: list,
+        result: ValidationResult,
+):
+    """Check a (rows x columns) integer value matrix, like a binary decision file block, against a range."""
+    values = values.reshape(len(row_labels), len(column_labels))
+    if not values.size or value_range[0] <= values.min() and values.max() <= value_range[1]:
+        return
+    _add_violations(
+        (values < value_range[0]) | (values > value_range[1]), message, values, row_labels, column_labels, result)
+
+
+def validate_storage_values(
+        values,
+        value_range: tuple[int, int],
+        message: str,
+        row_labels: list,
+        column_labels: list,
+        result: ValidationResult,
+) -> np.ndarray:
+    """
+    Check values given to a decision maker for missing, non-integer and out of range values.
+
+    Returns the values as a (rows x columns) numeric matrix, which can be cast to a storage dtype
+    without wrapping or truncating when the result is valid.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iu':
+        try:
+            values = values.astype(np.float64) if values.dtype.kind not in 'US' else None
+        except (TypeError, ValueError):
+            values = None
+        if values is None:
+            result.add(Violation(NON_INTEGER_MESSAGE))
+            return np.zeros((len(row_labels), len(column_labels)))
+    values = values.reshape(len(row_labels), len(column_labels))
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        _add_violations(missing, MISSING_VALUE_MESSAGE, values, row_labels, column_labels, result)
+        _add_violations(~missing & (values != np.round(values)), NON_INTEGER_MESSAGE, values, row_labels,
+                        column_labels, result)
+    validate_value_range(values, value_range, message, row_labels, column_labels, result)
+    return values
+
+
+def validate_decision_dataframe(
+        df: pd.DataFrame,
+        importance_range: tuple[int, int],
+        rating_range: tuple[int, int],
+        result: ValidationResult = None,
+) -> ValidationResult:
+    """
+    Validate an (evaluation factors x decision options + Importance) decision dataframe.
+
+    Labels are checked with hashing and values in a single sweep over their float matrix,
+    so every violation is reported, not only the first one.
+    """
+    result = ValidationResult() if result is None else result
+    if "Importance" not in df.columns:
+        result.add(Violation(MISSING_IMPORTANCE_MESSAGE))
+    for column in df.columns[df.columns.duplicated()].unique():
+        result.add(Violation(DUPLICATED_COLUMN_MESSAGE, column=column))
+    for row in df.index[df.index.duplicated()].unique():
+        result.add(Violation(DUPLICATED_ROW_MESSAGE, row=row))
+
+    if not df.size:
+        return result
+    row_labels, column_labels = df.index.tolist(), df.columns.tolist()
+    dtypes = set(df.dtypes)
+    if all(isinstance(dtype, np.dtype) and dtype.kind in "iu" for dtype in dtypes):
+        # Integer frames cannot have missing or non-integer values, only the range is checked.
+        values = df.to_numpy()
+    else:
+        values, non_numeric = _as_float_values(df, dtypes)
+        missing = np.isnan(values)
+        non_integer = non_numeric | (~missing & (values != np.trunc(values)))
+        missing &= ~non_numeric
+        _add_violations(missing, MISSING_VALUE_MESSAGE, values, row_labels, column_labels, result)
+        _add_violations(non_integer, NON_INTEGER_MESSAGE, values, row_labels, column_labels, result)
+
+    is_importance = (df.columns == "Importance")
+    lower = np.where(is_importance, importance_range[0], rating_range[0])
+    upper = np.where(is_importance, importance_range[1], rating_range[1])
+    # Column extremes (ignoring missing values) select the columns whose cells need to be located.
+    out_of_range_columns = np.flatnonzero(
+        (np.fmin.reduce(values, axis=0) < lower) | (np.fmax.reduce(values, axis=0) > upper))
+    if len(out_of_range_columns):
+        out_of_range = np.zeros(values.shape, dtype=bool)
+        columns = values[:, out_of_range_columns]
+        out_of_range[:, out_of_range_columns] = \
+            (columns < lower[out_of_range_columns]) | (columns > upper[out_of_range_columns])
+        range_messages = [
+            importance_range_message(importance_range) if column_is_importance
+            else rating_range_message(rating_range)
+            for column_is_importance in is_importance
+        ]
+        _add_violations(out_of_range, range_messages, values, row_labels, column_labels, result)
+    return result
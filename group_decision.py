@@ -0,0 +1,250 @@
+from typing import Literal, Union
+
+import numpy as np
+import pandas as pd
+
+from decision_maker import DecisionMaker, InvalidInputError
+from decision_validation import NON_INTEGER_MESSAGE
+from scoring_engines import ScoringResult
+
+Aggregation = Literal["mean", "median", "trimmed_mean", "geometric_mean"]
+AGGREGATIONS = ("mean", "median", "trimmed_mean", "geometric_mean")
+
+
+class GroupDecision:
+    """
+    A decision rated by a group, where every rater rates the same decision options on the same evaluation factors.
+
+    Ratings are stacked in a (raters x evaluation factors x decision options) array and importance
+    in a (raters x evaluation factors) array. Both grow by doubling their capacity.
+
+    Each rater updates running statistics when added, so adding a rater never recomputes the others:
+    - histograms count the raters giving each integer value to every cell;
+    - weighted sums give the rater's own scores;
+    - rank sums and tie corrections feed Kendall's W.
+    Every aggregation, including the median and the trimmed mean, is computed from the histograms,
+    so its cost does not depend on the number of raters.
+    """
+
+    def __init__(self, decision_options_list: list[str], evaluation_factors_list: list[str], decision: str = ""):
+        self.decision = decision
+        self.decision_options_list: list[str] = list(decision_options_list)
+        self.evaluation_factors_list: list[str] = list(evaluation_factors_list)
+        self.raters: list[str] = []
+        evaluation_factors_count, decision_options_count = len(evaluation_factors_list), len(decision_options_list)
+
+        self._decision_options_evaluation = np.empty(
+            (0, evaluation_factors_count, decision_options_count), dtype=DecisionMaker.DECISION_OPTION_VALUE_DTYPE)
+        self._evaluation_factor_importance = np.empty(
+            (0, evaluation_factors_count), dtype=DecisionMaker.EVALUATION_FACTOR_IMPORTANCE_DTYPE)
+        self._weighted_sums = np.empty((0, decision_options_count), dtype=np.int64)
+        self._rating_counts = np.zeros(
+            (evaluation_factors_count, decision_options_count,
+             DecisionMaker.MAX_DECISION_OPTION_VALUE - DecisionMaker.MIN_DECISION_OPTION_VALUE + 1), dtype=np.int64)
+        self._importance_counts = np.zeros(
+            (evaluation_factors_count,
+             DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE - DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE + 1),
+            dtype=np.int64)
+        # Sums over raters of the average rank of each decision option and of the tie correction of each ranking.
+        self._rank_sums = np.zeros(decision_options_count)
+        self._tie_correction: int = 0
+
+    def __str__(self):
+        return f"Group decision " \
+               f"of {len(self.raters)} raters " \
+               f"on {len(self.decision_options_list)} decision options " \
+               f"and {len(self.evaluation_factors_list)} evaluation factors."
+
+    def __len__(self):
+        return len(self.raters)
+
+    @classmethod
+    def from_decision_makers(cls, decision_makers: dict[str, DecisionMaker]) -> "GroupDecision":
+        """Group the decisions of raters, labelled by the keys of `decision_makers`, on the labels of the first one."""
+        first = next(iter(decision_makers.values()))
+        group_decision = cls(first.decision_options_list, first.evaluation_factors_list, first.decision)
+        for rater, decision_maker in decision_makers.items():
+            group_decision.add_decision_maker(rater, decision_maker)
+        return group_decision
+
+    @property
+    def decision_options_evaluation(self) -> np.ndarray:
+        """(raters x evaluation factors x decision options) ratings."""
+        return self._decision_options_evaluation[:len(self.raters)]
+
+    @property
+    def evaluation_factor_importance(self) -> np.ndarray:
+        """(raters x evaluation factors) importance."""
+        return self._evaluation_factor_importance[:len(self.raters)]
+
+    def _grow(self):
+        capacity = max(2 * len(self.raters), 1)
+        for name in ('_decision_options_evaluation', '_evaluation_factor_importance', '_weighted_sums'):
+            array = getattr(self, name)
+            grown = np.empty((capacity, *array.shape[1:]), dtype=array.dtype)
+            grown[:len(self.raters)] = array[:len(self.raters)]
+            setattr(self, name, grown)
+
+    def add_rater(
+            self,
+            rater: str,
+            decision_options_evaluation: Union[np.ndarray, list[list[int]]],
+            evaluation_factor_importance: Union[np.ndarray, list[int]],
+    ):
+        """
+        Add the (evaluation factors x decision options) ratings and the importance of a rater.
+
+        Only the statistics of the new rater are computed, in O(evaluation factors x decision options).
+        """
+        if rater in self.raters:
+            raise InvalidInputError(f"Invalid input: rater '{rater}' is already in the group decision.")
+        decision_options_evaluation = np.asarray(decision_options_evaluation)
+        evaluation_factor_importance = np.asarray(evaluation_factor_importance)
+        expected_shape = (len(self.evaluation_factors_list), len(self.decision_options_list))
+        if decision_options_evaluation.shape != expected_shape \
+                or evaluation_factor_importance.shape != expected_shape[:1]:
+            raise InvalidInputError(
+                f"Invalid input: rater '{rater}' must rate {expected_shape[1]} decision options "
+                f"on {expected_shape[0]} evaluation factors, not shapes "
+                f"{decision_options_evaluation.shape} and {evaluation_factor_importance.shape}.")
+        for array in (decision_options_evaluation, evaluation_factor_importance):
+            if array.size and not np.array_equal(array, np.round(array)):
+                raise InvalidInputError(NON_INTEGER_MESSAGE)
+        result = DecisionMaker.check_decision_arrays(
+            evaluation_factor_importance, decision_options_evaluation,
+            self.evaluation_factors_list, self.decision_options_list)
+        if not result.is_valid:
+            raise InvalidInputError(result.message, result.violations)
+
+        if len(self.raters) == len(self._decision_options_evaluation):
+            self._grow()
+        i = len(self.raters)
+        self._decision_options_evaluation[i] = decision_options_evaluation
+        self._evaluation_factor_importance[i] = evaluation_factor_importance
+        ratings = self._decision_options_evaluation[i].astype(np.int64)
+        importance = self._evaluation_factor_importance[i].astype(np.int64)
+        self._weighted_sums[i] = importance @ ratings
+
+        factors, options = np.indices(ratings.shape)
+        self._rating_counts[factors, options, ratings - DecisionMaker.MIN_DECISION_OPTION_VALUE] += 1
+        self._importance_counts[
+            np.arange(len(importance)), importance - DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE] += 1
+
+        weighted_sums = pd.Series(self._weighted_sums[i])
+        min_ranks = weighted_sums.rank(method='min', ascending=False).to_numpy()
+        max_ranks = weighted_sums.rank(method='max', ascending=False).to_numpy()
+        self._rank_sums += (min_ranks + max_ranks) / 2
+        # A tie of t options adds t^3 - t, that is t^2 - 1 for each of its options.
+        self._tie_correction += int(((max_ranks - min_ranks + 1) ** 2 - 1).sum())
+        self.raters.append(rater)
+
+    def add_decision_maker(self, rater: str, decision_maker: DecisionMaker):
+        """Add the ratings and importance of a rater's decision maker, matched to the group by label."""
+        missing = [
+            label for labels, index in [
+                (self.decision_options_list, decision_maker.decision_option_index),
+                (self.evaluation_factors_list, decision_maker.evaluation_factor_index),
+            ] for label in labels if label not in index
+        ]
+        if missing or decision_maker.decision_options_count != len(self.decision_options_list) \
+                or decision_maker.evaluation_factors_count != len(self.evaluation_factors_list):
+            raise InvalidInputError(
+                f"Invalid input: rater '{rater}' must rate the decision options {self.decision_options_list} "
+                f"on the evaluation factors {self.evaluation_factors_list}.")
+        options = [decision_maker.decision_option_index[label] for label in self.decision_options_list]
+        factors = [decision_maker.evaluation_factor_index[label] for label in self.evaluation_factors_list]
+        self.add_rater(
+            rater,
+            decision_maker.decision_options_evaluation_array[np.ix_(factors, options)],
+            decision_maker.evaluation_factor_importance_array[factors],
+        )
+
+    @staticmethod
+    def _aggregate_counts(
+            counts: np.ndarray, n: int, aggregation: Aggregation, trim: float, first_value: int) -> np.ndarray:
+        """Aggregate the `n` values counted by each histogram on the last axis of `counts`."""
+        values = np.arange(first_value, first_value + counts.shape[-1], dtype=np.float64)
+        if not n:
+            return np.full(counts.shape[:-1], np.nan)
+        if aggregation == "geometric_mean":
+            with np.errstate(divide='ignore'):
+                log_values = np.log(values)
+            has_zero = counts[..., values == 0].sum(axis=-1) > 0
+            return np.where(has_zero, 0., np.exp(counts[..., values > 0] @ log_values[values > 0] / n))
+        if aggregation == "mean":
+            start, stop = 0, n
+        elif aggregation == "median":
+            start, stop = (n - 1) // 2, n // 2 + 1
+        elif aggregation == "trimmed_mean":
+            if not 0 <= trim < 0.5:
+                raise ValueError(f"Trim must be between 0 and 0.5, not {trim}.")
+            start, stop = int(trim * n), n - int(trim * n)
+        else:
+            raise ValueError(f"Unknown aggregation '{aggregation}', aggregations are {AGGREGATIONS}.")
+        # Mean of the order statistics start to stop: each value counts for the ranks it covers in that window.
+        cumulative = np.cumsum(counts, axis=-1)
+        covered = np.clip(cumulative, start, stop) - np.clip(cumulative - counts, start, stop)
+        return covered @ values / (stop - start)
+
+    def aggregate_decision_options_evaluation(
+            self, aggregation: Aggregation = "mean", trim: float = 0.1) -> pd.DataFrame:
+        """(evaluation factors x decision options) ratings aggregated over raters."""
+        return pd.DataFrame(
+            self._aggregate_counts(
+                self._rating_counts, len(self.raters), aggregation, trim, DecisionMaker.MIN_DECISION_OPTION_VALUE),
+            index=self.evaluation_factors_list,
+            columns=self.decision_options_list,
+        )
+
+    def aggregate_evaluation_factor_importance(self, aggregation: Aggregation = "mean", trim: float = 0.1) -> pd.Series:
+        """Importance of each evaluation factor aggregated over raters."""
+        return pd.Series(
+            self._aggregate_counts(
+                self._importance_counts, len(self.raters), aggregation, trim,
+                DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE),
+            index=self.evaluation_factors_list,
+            name='Importance',
+        )
+
+    def aggregate_scores(self, aggregation: Aggregation = "mean", trim: float = 0.1) -> ScoringResult:
+        """
+        Score decision options with aggregated ratings weighted by aggregated importance.
+
+        `trim` is the proportion of raters cut from each end by the trimmed mean. The result can be
+        rendered by `DecisionMaker.plot_score` and `DecisionMaker.style_score_df`.
+        """
+        importance = self.aggregate_evaluation_factor_importance(aggregation, trim).to_numpy()
+        ratings = self.aggregate_decision_options_evaluation(aggregation, trim).to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = importance @ ratings / importance.sum()
+        return ScoringResult(
+            f"group_{aggregation}", f"group {aggregation.replace('_', ' ')}",
+            pd.Series(scores, index=self.decision_options_list, name='Score'),
+        )
+
+    def rater_scores_df(self) -> pd.DataFrame:
+        """(raters x decision options) decision scores of each rater, normalised like `compute_decision_score`."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = self._weighted_sums[:len(self.raters)] / self.evaluation_factor_importance.sum(
+                axis=1, dtype=np.int64, keepdims=True)
+        return pd.DataFrame(scores.round(1), index=self.raters, columns=self.decision_options_list)
+
+    def rater_rankings_df(self) -> pd.DataFrame:
+        """(raters x decision options) rank of each decision option for each rater, 1 being the best."""
+        return pd.DataFrame(
+            self._weighted_sums[:len(self.raters)], index=self.raters, columns=self.decision_options_list,
+        ).rank(axis=1, method='min', ascending=False).astype(np.int64)
+
+    def kendalls_w(self) -> float:
+        """
+        Kendall's coefficient of concordance of the raters' rankings, corrected for ties.
+
+        1 when all raters rank the decision options the same way, 0 when their rankings do not agree at all.
+        """
+        raters_count, decision_options_count = len(self.raters), len(self.decision_options_list)
+        deviations = self._rank_sums - raters_count * (decision_options_count + 1) / 2
+        denominator = raters_count ** 2 * (decision_options_count ** 3 - decision_options_count) \
+            - raters_count * self._tie_correction
+        if denominator <= 0:
+            return float('nan')
+        return float(12 * (deviations ** 2).sum() / denominator)
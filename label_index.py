@@ -0,0 +1,91 @@
+from typing import Iterable, Iterator
+
+
+class LabelIndex:
+    """
+    Ordered labels with stable integer ids.
+
+    Each label gets an id when it is added which does not change when the label is renamed
+    or when other labels are added or removed, so a rename is a single update of the id to label table.
+    """
+
+    def __init__(self, labels: Iterable[str] = ()):
+        self._next_id: int = 0
+        self._ids: list[int] = []
+        self._labels: dict[int, str] = {}
+        self.extend(labels)
+
+    def __repr__(self):
+        return f"LabelIndex({self.to_list()})"
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._labels[label_id] for label_id in self._ids)
+
+    def __getitem__(self, position: int) -> str:
+        return self._labels[self._ids[position]]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LabelIndex):
+            return self.to_list() == other.to_list()
+        return False
+
+    @property
+    def ids(self) -> list[int]:
+        return list(self._ids)
+
+    def id(self, position: int) -> int:
+        return self._ids[position]
+
+    def label(self, label_id: int) -> str:
+        return self._labels[label_id]
+
+    def to_list(self) -> list[str]:
+        return [self._labels[label_id] for label_id in self._ids]
+
+    def copy(self) -> "LabelIndex":
+        """Return a copy with the same ids."""
+        label_index = LabelIndex()
+        label_index._next_id = self._next_id
+        label_index._ids = list(self._ids)
+        label_index._labels = dict(self._labels)
+        return label_index
+
+    def rename(self, position: int, label: str) -> str:
+        """Rename the label at `position` and return the previous label."""
+        label_id = self._ids[position]
+        old_label = self._labels[label_id]
+        self._labels[label_id] = label
+        return old_label
+
+    def extend(self, labels: Iterable[str]) -> list[int]:
+        """Append labels and return their ids."""
+        new_ids = []
+        for label in labels:
+            self._labels[self._next_id] = label
+            new_ids.append(self._next_id)
+            self._next_id += 1
+        self._ids.extend(new_ids)
+        return new_ids
+
+    def insert(self, position: int, label: str) -> int:
+        """Insert a label before `position` and return its id."""
+        label_id = self._next_id
+        self._next_id += 1
+        self._labels[label_id] = label
+        self._ids.insert(position, label_id)
+        return label_id
+
+    def remove(self, position: int) -> str:
+        """Remove the label at `position` and return it."""
+        return self._labels.pop(self._ids.pop(position))
+
+    def move(self, position: int, new_position: int):
+        self._ids.insert(new_position, self._ids.pop(position))
+
+    def truncate(self, count: int):
+        for label_id in self._ids[count:]:
+            del self._labels[label_id]
+        del self._ids[count:]
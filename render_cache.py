@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class RenderCache:
+    """
+    Least recently used cache of rendered artifacts, like styled tables and figures.
+
+    Keys are expected to include a version of the data the artifact is rendered from,
+    so artifacts of older versions are never hit again and are evicted first.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._artifacts: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __str__(self):
+        return f"Render cache with {len(self)} of {self.maxsize} artifacts, {self.hits} hits and {self.misses} misses."
+
+    def __len__(self) -> int:
+        return len(self._artifacts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._artifacts
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        if key in self._artifacts:
+            self.hits += 1
+            self._artifacts.move_to_end(key)
+            return self._artifacts[key]
+        self.misses += 1
+        artifact = build()
+        self._artifacts[key] = artifact
+        while len(self._artifacts) > self.maxsize:
+            self._artifacts.popitem(last=False)
+        return artifact
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Evict the artifacts whose key matches `predicate` and return how many were evicted."""
+        keys = [key for key in self._artifacts if predicate(key)]
+        for key in keys:
+            del self._artifacts[key]
+        return len(keys)
+
+    def clear(self):
+        self._artifacts.clear()
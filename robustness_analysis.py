@@ -0,0 +1,183 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Literal, Union
+
+import numpy as np
+import pandas as pd
+
+from decision_maker import DecisionMaker, cmap_input
+
+
+def sample_rank_counts(
+        decision_options_evaluation: np.ndarray,
+        evaluation_factor_importance: np.ndarray,
+        samples: int,
+        seed: np.random.SeedSequence,
+        rating_noise: float = 1,
+        importance_noise: float = 1,
+        importance_distribution: Literal["uniform", "dirichlet"] = "uniform",
+        dirichlet_concentration: float = 10,
+) -> np.ndarray:
+    """
+    Sample perturbed importance and ratings and count how often each decision option lands in each rank.
+
+    Parameters
+    ----------
+    decision_options_evaluation: np.ndarray
+        (evaluation factors x decision options) ratings.
+    evaluation_factor_importance: np.ndarray
+        Importance of each evaluation factor.
+    samples: int
+        Number of samples to draw.
+    seed: np.random.SeedSequence
+        Seed of the random generator.
+    rating_noise: float
+        Ratings are perturbed with uniform noise in [-rating_noise, rating_noise].
+    importance_noise: float
+        Importance is perturbed with uniform noise in [-importance_noise, importance_noise]
+        when `importance_distribution` is "uniform".
+    importance_distribution: str
+        "uniform" for bounded uniform noise around the importance,
+        "dirichlet" for normalised importance drawn from a Dirichlet distribution centred on it.
+    dirichlet_concentration: float
+        Concentration of the Dirichlet distribution, higher values stay closer to the importance.
+
+    Returns
+    -------
+    np.ndarray
+        (decision options x ranks) counts, rank 0 being the best.
+    """
+    rng = np.random.default_rng(seed)
+    evaluation_factors_count, decision_options_count = decision_options_evaluation.shape
+
+    if importance_distribution == "dirichlet":
+        alpha = evaluation_factor_importance / max(evaluation_factor_importance.sum(), 1)
+        alpha = np.maximum(alpha * dirichlet_concentration * evaluation_factors_count, 1e-3)
+        importance = rng.dirichlet(alpha, size=samples)
+    elif importance_distribution == "uniform":
+        importance = np.clip(
+            evaluation_factor_importance + rng.uniform(
+                -importance_noise, importance_noise, size=(samples, evaluation_factors_count)),
+            DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE,
+            DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE,
+        )
+    else:
+        raise ValueError(f"Unknown importance distribution '{importance_distribution}'.")
+
+    if rating_noise:
+        ratings = np.clip(
+            decision_options_evaluation + rng.uniform(
+                -rating_noise, rating_noise, size=(samples, evaluation_factors_count, decision_options_count)),
+            DecisionMaker.MIN_DECISION_OPTION_VALUE,
+            DecisionMaker.MAX_DECISION_OPTION_VALUE,
+        )
+        weighted_sums = np.einsum('sf,sfo->so', importance, ratings)
+    else:
+        weighted_sums = importance @ decision_options_evaluation
+
+    # Normalising by the importance total does not change the ranks within a sample.
+    # Ties are broken at random, so decision options listed first do not win them.
+    order = np.lexsort((rng.random(weighted_sums.shape), -weighted_sums), axis=1)
+    ranks = np.argsort(order, axis=1)
+    return np.bincount(
+        (np.arange(decision_options_count) * decision_options_count + ranks).ravel(),
+        minlength=decision_options_count ** 2,
+    ).reshape(decision_options_count, decision_options_count)
+
+
+class RobustnessAnalysis:
+    """
+    Monte Carlo robustness analysis of the ranking of a decision maker's decision options.
+    """
+
+    def __init__(
+            self,
+            decision_maker: DecisionMaker,
+            rating_noise: float = 1,
+            importance_noise: float = 1,
+            importance_distribution: Literal["uniform", "dirichlet"] = "uniform",
+            dirichlet_concentration: float = 10,
+            max_chunk_bytes: int = 64 * 2 ** 20,
+    ):
+        self.decision_options_list: list[str] = list(decision_maker.decision_options_list)
+        self.evaluation_factors_list: list[str] = list(decision_maker.evaluation_factors_list)
+        self.decision_options_evaluation = decision_maker.decision_options_evaluation_array.astype(np.float64)
+        self.evaluation_factor_importance = decision_maker.evaluation_factor_importance_array.astype(np.float64)
+        self.rating_noise = rating_noise
+        self.importance_noise = importance_noise
+        self.importance_distribution = importance_distribution
+        self.dirichlet_concentration = dirichlet_concentration
+        self.max_chunk_bytes = max_chunk_bytes
+
+        self.samples: int = 0
+        self.rank_acceptability_df = pd.DataFrame()
+
+    def __str__(self):
+        return f"Robustness analysis " \
+               f"of {len(self.decision_options_list)} decision options " \
+               f"with {self.samples} samples."
+
+    @property
+    def chunk_size(self) -> int:
+        evaluation_factors_count, decision_options_count = self.decision_options_evaluation.shape
+        # The largest per-sample allocation is the perturbed rating matrix (or the score vector without it).
+        sample_bytes = 8 * (
+            evaluation_factors_count * decision_options_count if self.rating_noise
+            else evaluation_factors_count + decision_options_count
+        )
+        return max(1, self.max_chunk_bytes // max(sample_bytes, 1) // 4)
+
+    def run(self, samples: int = 10_000, seed: Union[int, None] = None, n_jobs: int = 1):
+        """
+        Draw `samples` perturbed decisions in chunks and compute rank acceptability indices.
+
+        Chunks get independent child seeds of `seed`, so results do not depend on `n_jobs`.
+        """
+        chunk_sizes = [self.chunk_size] * (samples // self.chunk_size)
+        if samples % self.chunk_size:
+            chunk_sizes.append(samples % self.chunk_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+        sample_args = [
+            (
+                self.decision_options_evaluation,
+                self.evaluation_factor_importance,
+                chunk_size,
+                chunk_seed,
+                self.rating_noise,
+                self.importance_noise,
+                self.importance_distribution,
+                self.dirichlet_concentration,
+            )
+            for chunk_size, chunk_seed in zip(chunk_sizes, seeds)
+        ]
+
+        decision_options_count = len(self.decision_options_list)
+        rank_counts = np.zeros((decision_options_count, decision_options_count), dtype=np.int64)
+        if n_jobs == 1:
+            for args in sample_args:
+                rank_counts += sample_rank_counts(*args)
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                for chunk_rank_counts in executor.map(sample_rank_counts, *zip(*sample_args)):
+                    rank_counts += chunk_rank_counts
+
+        self.samples = samples
+        self.rank_acceptability_df = pd.DataFrame(
+            rank_counts / max(samples, 1),
+            index=self.decision_options_list,
+            columns=[f"Rank {r + 1}" for r in range(decision_options_count)],
+        )
+        return self.rank_acceptability_df
+
+    @property
+    def win_probability(self) -> pd.Series:
+        return self.rank_acceptability_df['Rank 1'].rename('Win probability')
+
+    def style_rank_acceptability_df(
+            self,
+            format_str: str = '{:.1%}',
+            cmap: cmap_input = 'PuBu'
+    ):
+        return (
+            self.rank_acceptability_df
+            .style.format(format_str).background_gradient(axis=None, cmap=cmap)
+        )
@@ -0,0 +1,169 @@
+"""
+Scoring engines, which aggregate the ratings of decision options and the importance of evaluation factors
+into one score per decision option.
+
+An engine is a function of the (evaluation factors x decision options) rating matrix and the importance
+vector, both as float arrays, returning a score per decision option where higher is better.
+Engines are vectorized over the full matrix; pairwise engines compare decision options in blocks
+of at most `PAIRWISE_BLOCK_ELEMENTS` elements to bound their memory.
+"""
+from dataclasses import dataclass
+from typing import Callable, Union
+
+import numpy as np
+import pandas as pd
+
+PAIRWISE_BLOCK_ELEMENTS = 2 ** 22
+
+
+@dataclass(frozen=True, eq=False)
+class ScoringResult:
+    """Scores of decision options by a scoring engine, where higher is better."""
+    engine: str
+    label: str
+    scores: pd.Series
+    decimals: int = 1
+
+    @property
+    def ranks(self) -> pd.Series:
+        """Rank of each decision option, 1 is the best and ties share the best rank, missing without a score."""
+        return self.scores.rank(method='min', ascending=False).astype('Int64')
+
+    @property
+    def format_str(self) -> str:
+        return f"{{:.{self.decimals}f}}"
+
+    @property
+    def score_df(self) -> pd.DataFrame:
+        """(decision options x 'Score') dataframe of the rounded scores, like the transposed decision dataframe."""
+        return self.scores.round(self.decimals).to_frame('Score')
+
+
+@dataclass(frozen=True)
+class ScoringEngine:
+    name: str
+    label: str
+    score: Callable[..., np.ndarray]
+    decimals: int = 1
+
+
+def _weights(importance: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return importance / importance.sum(axis=-1, keepdims=True)
+
+
+def weighted_sum(ratings: np.ndarray, importance: np.ndarray) -> np.ndarray:
+    """Importance-weighted arithmetic mean of the ratings, the default decision score."""
+    return _weights(importance) @ ratings
+
+
+def weighted_product(ratings: np.ndarray, importance: np.ndarray) -> np.ndarray:
+    """
+    Weighted product model: importance-weighted geometric mean of the ratings.
+
+    An option rated 0 on any factor with importance scores 0, as poor ratings cannot be compensated.
+    """
+    weights = _weights(importance)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_ratings = np.where(weights > 0, weights * np.log(ratings), 0.)
+    return np.exp(log_ratings.sum(axis=0))
+
+
+def topsis(ratings: np.ndarray, importance: np.ndarray) -> np.ndarray:
+    """
+    TOPSIS: relative closeness of each option to the ideal option, between 0 and 1.
+
+    Ratings are normalised by the euclidean norm of their factor and weighted by importance;
+    the ideal and anti-ideal options take the best and worst weighted rating of every factor.
+    Options are equally close when all of them are equal on every weighted factor.
+    """
+    norms = np.linalg.norm(ratings, axis=1, keepdims=True)
+    weighted = _weights(importance)[:, None] * np.divide(
+        ratings, norms, out=np.zeros_like(ratings), where=norms > 0)
+    ideal_distance = np.linalg.norm(weighted - weighted.max(axis=1, keepdims=True), axis=0)
+    anti_ideal_distance = np.linalg.norm(weighted - weighted.min(axis=1, keepdims=True), axis=0)
+    distance = ideal_distance + anti_ideal_distance
+    return np.divide(anti_ideal_distance, distance, out=np.full_like(distance, 0.5), where=distance > 0)
+
+
+def promethee_ii(
+        ratings: np.ndarray,
+        importance: np.ndarray,
+        preference_threshold: float = 1.,
+        block_elements: int = PAIRWISE_BLOCK_ELEMENTS,
+) -> np.ndarray:
+    """
+    PROMETHEE II net outranking flow of each option, between -1 and 1.
+
+    The preference of option `a` over option `b` on a factor grows linearly with the rating difference
+    up to `preference_threshold`, so with the default threshold any better rating is fully preferred.
+    The (options x options) preferences are summed over factors one block of options at a time.
+    """
+    weights = _weights(importance)
+    factors_count, options_count = ratings.shape
+    if options_count < 2:
+        return np.zeros(options_count)
+    positive_flow = np.zeros(options_count)
+    negative_flow = np.zeros(options_count)
+    block_size = max(1, block_elements // max(factors_count * options_count, 1))
+    for start in range(0, options_count, block_size):
+        block = slice(start, start + block_size)
+        # (factors x block options x options) rating differences, then preference of the block over every option.
+        differences = ratings[:, block, None] - ratings[:, None, :]
+        preference = np.tensordot(weights, np.clip(differences / preference_threshold, 0, 1), axes=1)
+        positive_flow[block] = preference.sum(axis=1)
+        negative_flow += preference.sum(axis=0)
+    return (positive_flow - negative_flow) / (options_count - 1)
+
+
+def min_regret(
+        ratings: np.ndarray,
+        importance: np.ndarray,
+        stakeholder_importance: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Minimax regret: the negated largest regret of each option, so the option with least regret scores highest.
+
+    With a (stakeholder groups x evaluation factors) `stakeholder_importance` matrix, the regret of an option
+    for a group is how much lower its weighted-sum score is than the best option of that group.
+    Without it, the regret on a factor is how much lower an option is rated than the best option,
+    scaled by the importance of the factor relative to the most important one.
+    """
+    if stakeholder_importance is None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative_importance = importance / importance.max(initial=0)
+        regret = relative_importance[:, None] * (ratings.max(axis=1, keepdims=True) - ratings)
+    else:
+        scores = weighted_sum(ratings, np.atleast_2d(stakeholder_importance))
+        regret = scores.max(axis=1, keepdims=True) - scores
+    return -regret.max(axis=0, initial=0)
+
+
+SCORING_ENGINES: dict[str, ScoringEngine] = {}
+
+
+def register_scoring_engine(
+        name: str,
+        score: Callable[..., np.ndarray],
+        label: str = None,
+        decimals: int = 1,
+) -> ScoringEngine:
+    """Register a scoring engine under `name`, replacing any engine registered under it."""
+    engine = ScoringEngine(name, label or name, score, decimals)
+    SCORING_ENGINES[name] = engine
+    return engine
+
+
+def get_scoring_engine(engine: Union[str, ScoringEngine]) -> ScoringEngine:
+    if isinstance(engine, ScoringEngine):
+        return engine
+    if engine not in SCORING_ENGINES:
+        raise KeyError(f"Unknown scoring engine '{engine}', registered engines are {list(SCORING_ENGINES)}.")
+    return SCORING_ENGINES[engine]
+
+
+register_scoring_engine('weighted_sum', weighted_sum, "weighted sum")
+register_scoring_engine('weighted_product', weighted_product, "weighted product")
+register_scoring_engine('topsis', topsis, "TOPSIS", decimals=3)
+register_scoring_engine('promethee_ii', promethee_ii, "PROMETHEE II net flow", decimals=3)
+register_scoring_engine('min_regret', min_regret, "min-regret")
@@ -0,0 +1,405 @@
+"""
+HTTP scoring service for decisions, without Streamlit.
+
+    python scoring_service.py --port 8080 --workers 4
+
+Endpoints
+---------
+POST /score
+    One decision, as JSON in the `DecisionMaker.to_dict` shape or as CSV (`Content-Type: text/csv`)
+    in the `DecisionMaker.to_csv` shape. Responds with the scores, ranks and importance-adjusted breakdown,
+    or with status 422 and every validation violation.
+POST /score/batch
+    A JSON array of decisions, each a `to_dict` object or a CSV string. Responds with an array of results
+    in the same order; invalid decisions get their violations and do not fail the batch.
+GET /health
+    Responds with {"status": "ok"}.
+
+Requests are handled on an asyncio event loop. Large decisions and batches are scored on a worker pool,
+so the loop keeps serving other requests while CPU-bound scoring runs.
+"""
+import argparse
+import asyncio
+import io
+import json
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor
+from http import HTTPStatus
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+from decision_maker import DecisionMaker
+from decision_validation import Violation
+
+JSON_CONTENT_TYPE = "application/json"
+CSV_CONTENT_TYPE = "text/csv"
+# Request bodies up to this size are scored on the event loop, larger ones on the worker pool.
+OFFLOAD_BODY_BYTES = 64 * 2 ** 10
+MAX_BODY_BYTES = 64 * 2 ** 20
+BATCH_CHUNK_SIZE = 16
+
+
+class ScoringRequestError(Exception):
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+    def __reduce__(self):
+        # Raised in worker processes, so it must survive pickling with its status.
+        return type(self), (self.status, str(self))
+
+
+def decision_dataframe_from_dict(decision_dict: dict) -> pd.DataFrame:
+    """
+    Build a decision dataframe from a `DecisionMaker.to_dict` payload.
+
+    Labels come from the `*_list` keys when given, and from the dicts otherwise.
+    Missing ratings or importance values are left as NaN for validation to report.
+    """
+    importance_dict = decision_dict.get('evaluation_factor_importance_dict') or {}
+    evaluation_dict = decision_dict.get('decision_options_evaluation_dict') or {}
+    decision_options_list = decision_dict.get('decision_options_list') or list(evaluation_dict)
+    evaluation_factors_list = decision_dict.get('evaluation_factors_list') or list(importance_dict)
+    df = pd.DataFrame(
+        {
+            decision_option: [evaluation_dict.get(decision_option, {}).get(evaluation_factor)
+                              for evaluation_factor in evaluation_factors_list]
+            for decision_option in decision_options_list
+        },
+        index=pd.Index(evaluation_factors_list, name=decision_dict.get('decision', "")),
+        columns=decision_options_list,
+    )
+    df['Importance'] = [importance_dict.get(evaluation_factor) for evaluation_factor in evaluation_factors_list]
+    return df.infer_objects()
+
+
+def _json_number(value) -> Union[float, int, None]:
+    value = value.item() if isinstance(value, np.generic) else value
+    return None if isinstance(value, float) and math.isnan(value) else value
+
+
+def _violation_to_dict(violation: Violation) -> dict:
+    return {
+        'message': violation.message,
+        'row': violation.row,
+        'column': violation.column,
+        'value': _json_number(violation.value),
+    }
+
+
+def score_decision(decision: Union[dict, str]) -> dict:
+    """
+    Validate and score one decision given as a `to_dict` payload or CSV text.
+
+    Returns
+    -------
+    dict
+        `valid`, the `errors` found by `DecisionMaker.check_decision_dataframe` and, for a valid decision,
+        its `scores`, `ranks` (1 is the best, null without any importance) and `adj_by_importance` breakdown.
+    """
+    if isinstance(decision, str):
+        df = pd.read_csv(io.StringIO(decision), index_col=0)
+    elif isinstance(decision, dict):
+        df = decision_dataframe_from_dict(decision)
+    else:
+        raise ScoringRequestError(
+            HTTPStatus.BAD_REQUEST, "A decision must be a `to_dict` JSON object or a CSV string.")
+    df = df[df.index != 'Score']
+    response = {'decision': df.index.name}
+
+    result = DecisionMaker.check_decision_dataframe(df)
+    if not result.is_valid:
+        response.update({
+            'valid': False,
+            'message': result.message,
+            'errors': [_violation_to_dict(violation) for violation in result.violations],
+            'error_count': result.violation_count,
+        })
+        return response
+
+    decision_maker = DecisionMaker()
+    decision_maker.from_dataframe(df, errors="ignore")
+    decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+    decision_maker.compute_decision_score()
+    scores = decision_maker.decision_options_evaluation_df.loc['Score']
+    ranks = scores.rank(method='min', ascending=False)
+    adj_by_importance_df = decision_maker.decision_options_evaluation_adj_by_importance_df.drop(index='Score')
+    response.update({
+        'valid': True,
+        'errors': [],
+        'scores': {decision_option: _json_number(score) for decision_option, score in scores.items()},
+        'ranks': {decision_option: None if math.isnan(rank) else int(rank) for decision_option, rank in ranks.items()},
+        'adj_by_importance': {
+            evaluation_factor: {decision_option: _json_number(value) for decision_option, value in row.items()}
+            for evaluation_factor, row in adj_by_importance_df.iterrows()
+        },
+    })
+    return response
+
+
+def score_request_body(body: bytes, content_type: str) -> dict:
+    """Decode a `/score` request body and score its decision."""
+    try:
+        if content_type == CSV_CONTENT_TYPE:
+            decision = body.decode()
+        elif content_type in (JSON_CONTENT_TYPE, ""):
+            decision = json.loads(body)
+        else:
+            raise ScoringRequestError(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE, f"Unsupported content type '{content_type}'.")
+        return score_decision(decision)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ScoringRequestError(HTTPStatus.BAD_REQUEST, f"Invalid request body: {e}")
+
+
+def score_decisions(decisions: list[Union[dict, str]]) -> list[dict]:
+    """Score a chunk of a batch; a decision that cannot be parsed gets an error instead of failing the chunk."""
+    responses = []
+    for decision in decisions:
+        try:
+            responses.append(score_decision(decision))
+        except (ScoringRequestError, ValueError) as e:
+            responses.append({'valid': False, 'message': str(e), 'errors': [], 'error_count': 1})
+    return responses
+
+
+class ScoringService:
+    """
+    Asyncio HTTP/1.1 server for the scoring endpoints.
+
+    Parameters
+    ----------
+    host, port: str, int
+        Address to listen on; port 0 picks a free port, available as `port` once started.
+    executor: concurrent.futures.Executor
+        Worker pool for CPU-bound scoring, a process pool of `max_workers` processes by default.
+        An executor passed in is not shut down by the service.
+    offload_body_bytes: int
+        `/score` bodies larger than this are scored on the worker pool; batches always are.
+    batch_chunksize: int
+        Number of decisions of a batch scored per worker pool task.
+    """
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 8080,
+            executor: Executor = None,
+            max_workers: int = None,
+            offload_body_bytes: int = OFFLOAD_BODY_BYTES,
+            max_body_bytes: int = MAX_BODY_BYTES,
+            batch_chunksize: int = BATCH_CHUNK_SIZE,
+    ):
+        self.host = host
+        self.port = port
+        self.offload_body_bytes = offload_body_bytes
+        self.max_body_bytes = max_body_bytes
+        self.batch_chunksize = batch_chunksize
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+        self._server: Union[asyncio.AbstractServer, None] = None
+
+    def __str__(self):
+        return f"Scoring service on http://{self.host}:{self.port}"
+
+    async def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def __aenter__(self) -> "ScoringService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def _run_in_executor(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    async def _score(self, body: bytes, content_type: str) -> tuple[HTTPStatus, Any]:
+        if len(body) > self.offload_body_bytes:
+            response = await self._run_in_executor(score_request_body, body, content_type)
+        else:
+            response = score_request_body(body, content_type)
+        return (HTTPStatus.OK if response['valid'] else HTTPStatus.UNPROCESSABLE_ENTITY), response
+
+    async def _score_batch(self, body: bytes, content_type: str) -> tuple[HTTPStatus, Any]:
+        if content_type not in (JSON_CONTENT_TYPE, ""):
+            raise ScoringRequestError(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE, f"Batches must be sent as '{JSON_CONTENT_TYPE}'.")
+        try:
+            decisions = json.loads(body)
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ScoringRequestError(HTTPStatus.BAD_REQUEST, f"Invalid request body: {e}")
+        if not isinstance(decisions, list):
+            raise ScoringRequestError(HTTPStatus.BAD_REQUEST, "A batch must be a JSON array of decisions.")
+        # Chunks are scored concurrently on the worker pool and reassembled in request order.
+        chunks = await asyncio.gather(*(
+            self._run_in_executor(score_decisions, decisions[i:i + self.batch_chunksize])
+            for i in range(0, len(decisions), self.batch_chunksize)
+        ))
+        return HTTPStatus.OK, [response for chunk in chunks for response in chunk]
+
+    async def _dispatch(self, method: str, path: str, body: bytes, content_type: str) -> tuple[HTTPStatus, Any]:
+        routes = {
+            ("GET", "/health"): None,
+            ("POST", "/score"): self._score,
+            ("POST", "/score/batch"): self._score_batch,
+        }
+        if (method, path) not in routes:
+            if any(route_path == path for _, route_path in routes):
+                raise ScoringRequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"Method {method} is not allowed on {path}.")
+            raise ScoringRequestError(HTTPStatus.NOT_FOUND, f"Path {path} is not found.")
+        handler = routes[(method, path)]
+        if handler is None:
+            return HTTPStatus.OK, {'status': "ok"}
+        return await handler(body, content_type)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while (line := await reader.readline()).strip():
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get('connection', "").lower() != "close"
+                try:
+                    method, target, _ = request_line.decode("latin-1").split()
+                    content_length = int(headers.get('content-length', 0))
+                    if content_length > self.max_body_bytes:
+                        keep_alive = False
+                        raise ScoringRequestError(
+                            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                            f"Request body must be at most {self.max_body_bytes} bytes.")
+                    body = await reader.readexactly(content_length)
+                    content_type = headers.get('content-type', "").split(";")[0].strip().lower()
+                    status, response = await self._dispatch(method, target.split("?")[0], body, content_type)
+                except ScoringRequestError as e:
+                    status, response = e.status, {'message': str(e)}
+                except ValueError:
+                    status, response, keep_alive = HTTPStatus.BAD_REQUEST, {'message': "Malformed request."}, False
+                except Exception as e:
+                    status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {'message': f"{type(e).__name__}: {e}"}
+                writer.write(_http_response(status, response, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def _http_response(status: HTTPStatus, response: Any, keep_alive: bool) -> bytes:
+    body = json.dumps(response).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {JSON_CONTENT_TYPE}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class ScoringClient:
+    """
+    Minimal asyncio client for a scoring service, reusing one keep-alive connection.
+
+        async with ScoringClient(service.host, service.port) as client:
+            status, response = await client.score(decision_maker.to_dict())
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080):
+        self.host = host
+        self.port = port
+        self._reader: Union[asyncio.StreamReader, None] = None
+        self._writer: Union[asyncio.StreamWriter, None] = None
+
+    async def __aenter__(self) -> "ScoringClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._reader = self._writer = None
+
+    async def request(
+            self,
+            method: str,
+            path: str,
+            body: bytes = b"",
+            content_type: str = JSON_CONTENT_TYPE,
+    ) -> tuple[int, Any]:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._writer.write((
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode("latin-1") + body)
+        await self._writer.drain()
+        status = int((await self._reader.readline()).split()[1])
+        headers = {}
+        while (line := await self._reader.readline()).strip():
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        response = json.loads(await self._reader.readexactly(int(headers['content-length'])))
+        if headers.get('connection', "").lower() == "close":
+            await self.close()
+        return status, response
+
+    async def score(self, decision: Union[dict, str]) -> tuple[int, Any]:
+        if isinstance(decision, str):
+            return await self.request("POST", "/score", decision.encode(), CSV_CONTENT_TYPE)
+        return await self.request("POST", "/score", json.dumps(decision).encode())
+
+    async def score_batch(self, decisions: list[Union[dict, str]]) -> tuple[int, Any]:
+        return await self.request("POST", "/score/batch", json.dumps(decisions).encode())
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Serve decision scoring over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of scoring processes.")
+    args = parser.parse_args(argv)
+
+    service = ScoringService(args.host, args.port, max_workers=args.workers)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
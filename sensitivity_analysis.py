@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+
+from decision_maker import DecisionMaker, plotly_cmap_default
+
+
+class SensitivityAnalysis:
+    """
+    Analytic sensitivity of the decision ranking to evaluation factor importance.
+
+    A decision score is a weighted mean of ratings, so changing the importance of factor `f` by `delta`
+    makes option `a` and option `b` swap ranks when `(S_a - S_b) + delta * (r_fa - r_fb)` changes sign,
+    where `S` are the importance-weighted rating sums. The rank-reversal threshold is therefore
+    `delta = -(S_a - S_b) / (r_fa - r_fb)`.
+    """
+
+    def __init__(self, decision_maker: DecisionMaker):
+        self.decision_options_list: list[str] = list(decision_maker.decision_options_list)
+        self.evaluation_factors_list: list[str] = list(decision_maker.evaluation_factors_list)
+        self.decision_options_evaluation = decision_maker.decision_options_evaluation_array.astype(np.float64)
+        self.evaluation_factor_importance = decision_maker.evaluation_factor_importance_array.astype(np.float64)
+        self.weighted_sums = self.evaluation_factor_importance @ self.decision_options_evaluation
+
+        self.top_decision_option_thresholds_df = pd.DataFrame()
+
+    def __str__(self):
+        return f"Sensitivity analysis " \
+               f"of {len(self.decision_options_list)} decision options " \
+               f"and {len(self.evaluation_factors_list)} evaluation factors."
+
+    @property
+    def top_decision_option(self) -> str:
+        return self.decision_options_list[int(np.argmax(self.weighted_sums))]
+
+    def _is_feasible(self, delta: np.ndarray) -> np.ndarray:
+        importance = self.evaluation_factor_importance.reshape((-1,) + (1,) * (delta.ndim - 1)) + delta
+        return (
+                ~np.isnan(delta)
+                & (importance >= DecisionMaker.MIN_EVALUATION_FACTOR_IMPORTANCE)
+                & (importance <= DecisionMaker.MAX_EVALUATION_FACTOR_IMPORTANCE)
+        )
+
+    def compute_rank_reversal_thresholds(self, feasible_only: bool = False) -> np.ndarray:
+        """
+        Compute the importance change of every evaluation factor that makes every pair of options swap ranks.
+
+        Parameters
+        ----------
+        feasible_only: bool
+            Set thresholds that take importance outside of its allowed range to NaN.
+
+        Returns
+        -------
+        np.ndarray
+            (evaluation factors x decision options x decision options) importance changes,
+            NaN where the pair cannot swap ranks through that factor.
+        """
+        score_differences = self.weighted_sums[:, None] - self.weighted_sums[None, :]
+        rating_differences = (
+                self.decision_options_evaluation[:, :, None] - self.decision_options_evaluation[:, None, :]
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            thresholds = np.where(
+                rating_differences != 0, -score_differences[None] / rating_differences, np.nan)
+        if feasible_only:
+            thresholds = np.where(self._is_feasible(thresholds), thresholds, np.nan)
+        return thresholds
+
+    def rank_reversal_thresholds_df(self, feasible_only: bool = False) -> pd.DataFrame:
+        thresholds = self.compute_rank_reversal_thresholds(feasible_only=feasible_only)
+        return pd.DataFrame(
+            thresholds.reshape(len(self.evaluation_factors_list), -1).T,
+            index=pd.MultiIndex.from_product(
+                [self.decision_options_list, self.decision_options_list],
+                names=["Decision option", "Other decision option"]),
+            columns=self.evaluation_factors_list,
+        )
+
+    def compute_top_decision_option_thresholds(self) -> pd.DataFrame:
+        """
+        Compute the smallest decrease and increase of each evaluation factor importance
+        that makes another option overtake the top decision option.
+        """
+        top = int(np.argmax(self.weighted_sums))
+        score_differences = self.weighted_sums[top] - self.weighted_sums
+        rating_differences = self.decision_options_evaluation[:, [top]] - self.decision_options_evaluation
+        with np.errstate(divide='ignore', invalid='ignore'):
+            thresholds = np.where(
+                rating_differences != 0, -score_differences[None] / rating_differences, np.nan)
+        thresholds[:, top] = np.nan
+        thresholds = np.where(self._is_feasible(thresholds), thresholds, np.nan)
+
+        decreases = np.where(rating_differences > 0, thresholds, np.nan)
+        increases = np.where(rating_differences < 0, thresholds, np.nan)
+        has_decrease = ~np.isnan(decreases).all(axis=1)
+        has_increase = ~np.isnan(increases).all(axis=1)
+        decrease_challengers = np.argmax(np.nan_to_num(decreases, nan=-np.inf), axis=1)
+        increase_challengers = np.argmin(np.nan_to_num(increases, nan=np.inf), axis=1)
+        rows = np.arange(len(self.evaluation_factors_list))
+
+        options = np.array(self.decision_options_list, dtype=object)
+        self.top_decision_option_thresholds_df = pd.DataFrame(
+            {
+                'Importance': self.evaluation_factor_importance,
+                'Decrease threshold': np.where(has_decrease, decreases[rows, decrease_challengers], np.nan),
+                'Decrease challenger': np.where(has_decrease, options[decrease_challengers], None),
+                'Increase threshold': np.where(has_increase, increases[rows, increase_challengers], np.nan),
+                'Increase challenger': np.where(has_increase, options[increase_challengers], None),
+            },
+            index=self.evaluation_factors_list,
+        )
+        return self.top_decision_option_thresholds_df
+
+    def plot_top_decision_option_thresholds(self, color_discrete_sequence: list[str] = plotly_cmap_default):
+        if self.top_decision_option_thresholds_df.empty:
+            self.compute_top_decision_option_thresholds()
+        import plotly.express as px
+
+        fig = px.bar(
+            self.top_decision_option_thresholds_df[['Decrease threshold', 'Increase threshold']].round(1),
+            orientation='h', barmode='relative', text_auto=True,
+            labels={"index": "Evaluation factor", "value": "Importance change", "variable": "Threshold"},
+            title=f"Importance change needed to replace `{self.top_decision_option}` as the top decision option",
+            color_discrete_sequence=color_discrete_sequence,
+        )
+        fig.update_traces(textposition='outside', cliponaxis=False, textangle=0)
+
+        return fig
@@ -0,0 +1,125 @@
+"""
+Memory accounting of app sessions, to size deployments by bytes per session.
+
+    session_memory_usage(st.session_state)
+    decision_maker_memory_usage(st.session_state['decision_maker'])
+
+Decision makers of sessions get a smaller history budget than the `DecisionHistory` defaults,
+see `limit_session_history`.
+
+Sizes are deep: containers and objects are followed to what they hold and every object is counted once.
+Arrays shared by all sessions, like the frozen default and example decisions, are not counted.
+"""
+import sys
+import types
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from decision_maker import DecisionMaker
+
+# Undo steps and change feed kept per session. The app does not read the feed, its share is small.
+SESSION_HISTORY_MAX_BYTES = 4 * 2 ** 20
+SESSION_HISTORY_MAX_FEED_BYTES = 2 ** 20
+
+SKIPPED_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+)
+
+
+def shared_object_ids() -> set[int]:
+    """Ids of the objects every session shares, which are not counted per session."""
+    import decision_maker_defaults
+    import decision_maker_mockup
+
+    return {id(array) for array in (
+        decision_maker_defaults.default_evaluation_factor_importance_array,
+        decision_maker_defaults.default_decision_options_evaluation_array,
+        decision_maker_mockup.example_evaluation_factor_importance_array,
+        decision_maker_mockup.example_decision_options_evaluation_array,
+    )}
+
+
+def _referents(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, dict):
+        return [*obj.keys(), *obj.values()]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return obj
+    referents = list(getattr(obj, '__dict__', {}).values())
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, '__slots__', ()):
+            if hasattr(obj, slot):
+                referents.append(getattr(obj, slot))
+    return referents
+
+
+def sizeof(obj: Any, seen: set[int] = None) -> int:
+    """
+    Deep size of an object in bytes, skipping objects whose id is in `seen` and adding the counted ones to it.
+
+    Arrays count their data once through their base array, pandas objects their deep memory usage,
+    plotly figures their JSON data. Classes, modules and functions are not counted.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen or isinstance(obj, SKIPPED_TYPES):
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        # `getsizeof` counts the data of arrays that own it; views count the array they view instead.
+        return sys.getsizeof(obj) + (sizeof(obj.base, seen) if obj.base is not None else 0)
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Index):
+        return int(obj.memory_usage(deep=True))
+    if hasattr(obj, 'to_plotly_json'):
+        return sizeof(obj.to_plotly_json(), seen)
+    return sys.getsizeof(obj) + sum(sizeof(referent, seen) for referent in _referents(obj))
+
+
+def decision_maker_memory_usage(decision_maker: DecisionMaker, seen: set[int] = None) -> dict[str, int]:
+    """Bytes held by each part of a decision maker, with the shared arrays it uses not counted."""
+    seen = shared_object_ids() if seen is None else seen
+    usage = {
+        'storage': sizeof(decision_maker._evaluation_factor_importance_array, seen)
+                   + sizeof(decision_maker._decision_options_evaluation_array, seen),
+        'labels': sizeof(decision_maker.decision_option_labels, seen)
+                  + sizeof(decision_maker.evaluation_factor_labels, seen),
+        'views': sizeof(decision_maker._views, seen),
+        'scores': sizeof(decision_maker.decision_options_evaluation_adj_by_importance_df, seen)
+                  + sizeof(decision_maker._weighted_sums, seen),
+        'render_cache': sizeof(decision_maker.render_cache, seen),
+        'history': sizeof(decision_maker.history, seen),
+    }
+    usage['other'] = sizeof(decision_maker, seen)
+    usage['total'] = sum(usage.values())
+    return usage
+
+
+def session_memory_usage(session_state: Mapping) -> dict[str, int]:
+    """
+    Bytes held by each key of a session state, including the key itself, and their `total`.
+
+    Objects referenced by several keys are counted for the first of them.
+    """
+    seen = shared_object_ids()
+    usage = {}
+    for key in list(session_state.keys()):
+        value = session_state[key]
+        if isinstance(value, DecisionMaker):
+            size = decision_maker_memory_usage(value, seen)['total']
+        else:
+            size = sizeof(value, seen)
+        usage[key] = sizeof(key, seen) + size
+    usage['total'] = sum(usage.values())
+    return usage
+
+
+def limit_session_history(
+        decision_maker: DecisionMaker,
+        max_bytes: int = SESSION_HISTORY_MAX_BYTES,
+        max_feed_bytes: int = SESSION_HISTORY_MAX_FEED_BYTES,
+):
+    """Bound the undo steps and the change feed a session's decision maker keeps to the session budget."""
+    decision_maker.history.max_bytes = max_bytes
+    decision_maker.history.max_feed_bytes = max_feed_bytes
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+import decision_maker_mockup
+from batch_scoring import find_decision_files, main, run_batch_scoring, score_decision_file
+
+
+@pytest.fixture
+def example_decision_files(tmp_path):
+    decision_maker = decision_maker_mockup.example_decision_maker
+    (tmp_path / "nested").mkdir()
+    decision_maker.to_csv(str(tmp_path / "example.csv"))
+    (tmp_path / "nested" / "example.xlsx").write_bytes(decision_maker.to_excel_writer().getvalue())
+    decision_maker.to_binary(str(tmp_path / "nested" / "example.dab"))
+    (tmp_path / "broken.csv").write_text("Decision,Flip a coin,Importance\nSpeed,11,5\n")
+    (tmp_path / "notes.txt").write_text("Not a decision file.")
+    return tmp_path
+
+
+class TestBatchScoring:
+
+    def test_find_decision_files(self, example_decision_files):
+        paths = find_decision_files([str(example_decision_files / "**" / "*")])
+        assert [path.rsplit("/", 1)[-1] for path in paths] == [
+            "broken.csv", "example.csv", "example.dab", "example.xlsx"]
+
+    def test_score_decision_file(self, example_decision_files):
+        path, rows, error_message = score_decision_file(str(example_decision_files / "example.csv"))
+        assert error_message is None
+        assert [(row[2], row[3], row[4]) for row in rows] == [
+            ("Use decision maker", 8.4, 1),
+            ("Listen to your heart", 6.0, 2),
+            ("Flip a coin", 5.9, 3),
+            ("Hire a consultant", 5.5, 4),
+        ]
+
+    def test_score_decision_file_isolates_errors(self, example_decision_files):
+        path, rows, error_message = score_decision_file(str(example_decision_files / "broken.csv"))
+        assert rows is None
+        assert error_message.startswith("Invalid input")
+        path, rows, error_message = score_decision_file(str(example_decision_files / "missing.csv"))
+        assert error_message.startswith("FileNotFoundError")
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_run_batch_scoring(self, example_decision_files, n_jobs):
+        paths = find_decision_files([str(example_decision_files / "**" / "*")])
+        rankings_df, errors_df = run_batch_scoring(paths, n_jobs=n_jobs)
+        assert len(rankings_df) == 12
+        assert rankings_df.groupby("File")["Score"].apply(tuple).nunique() == 1
+        assert errors_df["File"].tolist() == [str(example_decision_files / "broken.csv")]
+
+    def test_main(self, example_decision_files, capsys):
+        output = example_decision_files / "rankings.csv"
+        errors = example_decision_files / "errors.csv"
+        assert main([
+            str(example_decision_files / "*.csv"), "--output", str(output), "--errors", str(errors), "--jobs", "1",
+        ]) == 1
+        assert pd.read_csv(output)["Rank"].tolist() == [1, 2, 3, 4]
+        assert len(pd.read_csv(errors)) == 1
+        assert "Scored 2/2 files, 1 failed" in capsys.readouterr().err
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from benchmark import BENCHMARKS, STARTUP_MODULES, find_regressions, import_in_fresh_interpreter, main, run_benchmarks
+
+
+@pytest.fixture
+def example_baseline():
+    return {
+        "compute_decision_score": {"2": 0.010, "10": 0.010},
+        "to_csv": {"2": 0.0001},
+    }
+
+
+class TestBenchmark:
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(sizes=[2], repeat=1)
+        assert set(results) == {benchmark.name for benchmark in BENCHMARKS}
+        assert all(timings["2"] > 0 for timings in results.values())
+
+    def test_run_benchmarks_skips_sizes_above_max_size(self):
+        results = run_benchmarks(sizes=[2, 200], names=["to_excel_writer"], repeat=1)
+        assert list(results["to_excel_writer"]) == ["2"]
+
+    def test_startup_does_not_import_lazy_modules(self):
+        assert import_in_fresh_interpreter(STARTUP_MODULES) == []
+
+    def test_find_regressions(self, example_baseline):
+        results = {
+            "compute_decision_score": {"2": 0.011, "10": 0.020},
+            "to_csv": {"2": 0.0005},
+            "from_dataframe": {"2": 1.0},
+        }
+        regressions = find_regressions(results, example_baseline, threshold=0.25, min_seconds=0.001)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("compute_decision_score (size 10)")
+
+    def test_main_fails_on_regression(self, tmp_path, example_baseline):
+        baseline_path = tmp_path / "baseline.json"
+        args = ["--sizes", "2", "--repeat", "1", "--benchmarks", "compute_decision_score"]
+        assert main(args + ["--save-baseline", str(baseline_path)]) == 0
+        assert main(args + ["--baseline", str(baseline_path), "--threshold", "10"]) == 0
+
+        baseline = json.loads(baseline_path.read_text())
+        baseline["results"]["compute_decision_score"]["2"] = 0
+        baseline_path.write_text(json.dumps(baseline))
+        assert main(args + ["--baseline", str(baseline_path), "--min-seconds", "0"]) == 1
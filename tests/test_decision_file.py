@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from decision_file import DecisionFileError, read_decision_file, write_decision_file
+from decision_maker import DecisionMaker, InvalidInputError
+from decision_maker_mockup import example_decision_maker
+
+
+@pytest.fixture
+def example_decision_file():
+    return write_decision_file(
+        decision=example_decision_maker.decision,
+        decision_options_list=example_decision_maker.decision_options_list,
+        evaluation_factors_list=example_decision_maker.evaluation_factors_list,
+        evaluation_factor_importance=example_decision_maker.evaluation_factor_importance_array,
+        decision_options_evaluation=example_decision_maker.decision_options_evaluation_array,
+    )
+
+
+class TestDecisionFile:
+
+    def test_read_decision_file(self, example_decision_file):
+        header, ratings, importance = read_decision_file(example_decision_file)
+        assert header['decision'] == example_decision_maker.decision
+        assert header['decision_options_list'] == example_decision_maker.decision_options_list
+        assert header['evaluation_factors_list'] == example_decision_maker.evaluation_factors_list
+        assert np.array_equal(ratings, example_decision_maker.decision_options_evaluation_array)
+        assert np.array_equal(importance, example_decision_maker.evaluation_factor_importance_array)
+
+    def test_read_decision_file_is_memory_mapped(self, example_decision_file, tmp_path):
+        path = tmp_path / "decision.dab"
+        path.write_bytes(example_decision_file)
+        header, ratings, importance = read_decision_file(path)
+        assert isinstance(ratings.base, np.memmap)
+        assert isinstance(importance.base, np.memmap)
+        ratings[0, 0] = 0
+        assert path.read_bytes() == example_decision_file
+
+    @pytest.mark.parametrize("corrupt", [
+        lambda data: data[:-1],
+        lambda data: b"NOTADCSN" + data[8:],
+        lambda data: data[:8] + b"\2" + data[9:],
+        lambda data: data[:20],
+    ])
+    def test_read_invalid_decision_file(self, example_decision_file, corrupt):
+        with pytest.raises(DecisionFileError):
+            read_decision_file(corrupt(example_decision_file))
+
+
+class TestDecisionMakerBinary:
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "decision.dab"
+        example_decision_maker.to_binary(path)
+        obtained_decision_maker = DecisionMaker()
+        obtained_decision_maker.from_binary(path)
+        assert obtained_decision_maker.to_dict() == example_decision_maker.to_dict()
+        obtained_decision_maker.set_decision_options_evaluation(0, 0, 0)
+        assert obtained_decision_maker.decision_options_evaluation_dict["Flip a coin"]["Speed"] == 0
+
+    def test_from_binary_buffer(self):
+        obtained_decision_maker = DecisionMaker()
+        obtained_decision_maker.from_binary(example_decision_maker.save_options['dab'])
+        assert obtained_decision_maker.to_dict() == example_decision_maker.to_dict()
+        obtained_decision_maker.set_evaluation_factor_importance(0, 0)
+
+    def test_from_binary_out_of_range(self):
+        decision_file = write_decision_file(
+            "Decision", ["Option 1"], ["Factor 1"], np.array([11]), np.array([[5]]))
+        decision_maker = DecisionMaker()
+        assert decision_maker.from_binary(decision_file, errors="message").startswith("Invalid input")
+        with pytest.raises(InvalidInputError):
+            decision_maker.from_binary(decision_file[:-1])
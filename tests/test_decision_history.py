@@ -0,0 +1,170 @@
+import copy
+
+import numpy as np
+import pytest
+
+import decision_maker_mockup
+from decision_history import Change, DecisionHistory
+from decision_maker import DecisionMaker
+
+
+@pytest.fixture
+def example_decision_maker():
+    decision_maker = DecisionMaker(check_incremental_scores=True)
+    decision_maker.set_attributes_from(decision_maker_mockup.example_decision_maker)
+    decision_maker.history.clear()
+    decision_maker.compute_decision_score()
+    return decision_maker
+
+
+def edit(decision_maker: DecisionMaker, step: int):
+    edits = [
+        lambda: decision_maker.set_decision_options_evaluation(1, 2, 9),
+        lambda: decision_maker.set_evaluation_factor_importance(0, 1),
+        lambda: decision_maker.set_decision_option(0, "Ask friends"),
+        lambda: decision_maker.set_decision("Which way to take decisions?"),
+        lambda: decision_maker.insert_decision_option(2, "Wait", [1, 2, 3, 4]),
+        lambda: decision_maker.remove_evaluation_factor("Cost"),
+        lambda: decision_maker.move_decision_option(0, -1),
+        lambda: decision_maker.set_decision_options_count(3),
+        lambda: decision_maker.set_evaluation_factors_count(5),
+        lambda: decision_maker.insert_evaluation_factor(0, "Fun", 8, [1, 2, 3]),
+        lambda: decision_maker.remove_decision_option(1),
+        lambda: decision_maker.move_evaluation_factor("Fun", 2),
+        lambda: decision_maker.set_evaluation_factor_importance_with_dict(
+            {k: 3 for k in decision_maker.evaluation_factors_list}),
+    ]
+    edits[step]()
+
+
+class TestDecisionHistory:
+
+    def test_undo_and_redo_every_edit(self, example_decision_maker):
+        states = [copy.deepcopy(example_decision_maker.to_dict())]
+        for step in range(13):
+            edit(example_decision_maker, step)
+            states.append(copy.deepcopy(example_decision_maker.to_dict()))
+        assert len(example_decision_maker.history) == 13
+
+        for state in reversed(states[:-1]):
+            assert example_decision_maker.undo()
+            assert example_decision_maker.to_dict() == state
+        assert not example_decision_maker.undo()
+
+        for state in states[1:]:
+            assert example_decision_maker.redo()
+            assert example_decision_maker.to_dict() == state
+        assert not example_decision_maker.redo()
+        assert example_decision_maker.decision_options_evaluation_df.shape == (6, 2)
+
+    def test_undo_restores_scores(self, example_decision_maker):
+        scores = example_decision_maker.decision_options_evaluation_df.loc['Score'].copy()
+        for step in range(13):
+            edit(example_decision_maker, step)
+        while example_decision_maker.undo():
+            pass
+        example_decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        example_decision_maker.compute_decision_score()
+        assert example_decision_maker.decision_options_evaluation_df.loc['Score'].equals(scores)
+
+    def test_no_op_edits_are_not_recorded(self, example_decision_maker):
+        example_decision_maker.set_decision_options_evaluation(
+            1, 2, example_decision_maker.decision_options_evaluation_array[2, 1])
+        example_decision_maker.set_decision_options_count(example_decision_maker.decision_options_count)
+        example_decision_maker.set_attributes_from(decision_maker_mockup.example_decision_maker)
+        assert not example_decision_maker.history.can_undo
+
+    def test_new_edit_discards_redo(self, example_decision_maker):
+        edit(example_decision_maker, 0)
+        example_decision_maker.undo()
+        assert example_decision_maker.history.can_redo
+        edit(example_decision_maker, 1)
+        assert not example_decision_maker.history.can_redo
+
+    def test_batch_is_one_step(self, example_decision_maker):
+        state = copy.deepcopy(example_decision_maker.to_dict())
+        with example_decision_maker.batch():
+            for step in range(5):
+                edit(example_decision_maker, step)
+        assert len(example_decision_maker.history) == 1
+        example_decision_maker.undo()
+        assert example_decision_maker.to_dict() == state
+
+    def test_undo_inside_batch_raises(self, example_decision_maker):
+        edit(example_decision_maker, 0)
+        with pytest.raises(RuntimeError):
+            with example_decision_maker.batch():
+                example_decision_maker.undo()
+
+    def test_structural_edit_shares_arrays(self, example_decision_maker):
+        array = example_decision_maker._decision_options_evaluation_array
+        example_decision_maker.set_evaluation_factor_importance_with_dict(
+            {k: 3 for k in example_decision_maker.evaluation_factors_list})
+        change, = example_decision_maker.history.pop_undo_step()
+        assert change.inverse_args[0].decision_options_evaluation_array is array
+        assert change.args[0].decision_options_evaluation_array is array
+        example_decision_maker.set_decision_options_evaluation(0, 0, 0)
+        assert example_decision_maker._decision_options_evaluation_array is not array
+        assert array[0, 0] == decision_maker_mockup.example_decision_options_evaluation_dict["Flip a coin"]["Speed"]
+
+    def test_changes_since(self, example_decision_maker):
+        sequence = example_decision_maker.history.sequence
+        edit(example_decision_maker, 0)
+        edit(example_decision_maker, 1)
+        example_decision_maker.undo()
+        changes = example_decision_maker.history.changes_since(sequence)
+        assert [change.method for change in changes] == [
+            'set_decision_options_evaluation', 'set_evaluation_factor_importance', 'set_evaluation_factor_importance']
+        assert changes[2].args == (0, int(decision_maker_mockup.example_evaluation_factor_importance_dict["Speed"]))
+        assert example_decision_maker.history.changes_since(example_decision_maker.history.sequence) == []
+
+    def test_listeners(self, example_decision_maker):
+        published = []
+        example_decision_maker.history.subscribe(lambda sequence, change: published.append(change.method))
+        edit(example_decision_maker, 2)
+        example_decision_maker.undo()
+        assert published == ['update_decision_option', 'update_decision_option']
+
+
+class TestDecisionHistoryLimits:
+
+    def test_max_steps(self):
+        history = DecisionHistory(max_steps=2)
+        for i in range(5):
+            history.record(Change('set_decision', (str(i),), 'set_decision', ("",)))
+        assert len(history) == 2
+
+    def test_max_bytes(self):
+        history = DecisionHistory(max_bytes=10_000)
+        for i in range(5):
+            history.record(Change('f', (np.zeros(4_000, dtype=np.int8),), 'f', (np.zeros(4_000, dtype=np.int8),)))
+        assert len(history) == 1
+
+    def test_changes_since_truncated_feed(self):
+        history = DecisionHistory(max_feed=2)
+        for i in range(5):
+            history.publish(Change('set_decision', (str(i),), 'set_decision', ("",)))
+        assert history.changes_since(0) is None
+        assert [change.args for change in history.changes_since(3)] == [("3",), ("4",)]
+
+    def test_feed_max_bytes(self):
+        history = DecisionHistory(max_bytes=10_000)
+        for i in range(5):
+            history.publish(Change('f', (np.zeros(4_000, dtype=np.int8),), 'f', (np.zeros(4_000, dtype=np.int8),)))
+        assert history.feed_nbytes <= 10_000
+        assert history.changes_since(0) is None
+        assert len(history.changes_since(4)) == 1
+        history = DecisionHistory(max_bytes=10_000, max_feed_bytes=100_000)
+        for i in range(5):
+            history.publish(Change('f', (np.zeros(4_000, dtype=np.int8),), 'f', (np.zeros(4_000, dtype=np.int8),)))
+        assert len(history.changes_since(0)) == 5
+
+    def test_structural_edits_feed_is_bounded(self):
+        decision_maker = DecisionMaker()
+        decision_maker.history.max_bytes = 100_000
+        decision_maker.set_attributes_from_arrays(
+            "", [f"Option {i}" for i in range(100)], [f"Factor {k}" for k in range(100)],
+            np.ones(100, dtype=np.int64), np.ones((100, 100), dtype=np.int64))
+        for i in range(20):
+            decision_maker.set_decision_options_count(101 + i % 2)
+        assert decision_maker.history.feed_nbytes <= 100_000
@@ -1,3 +1,7 @@
+import io
+import pickle
+import re
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -573,6 +577,43 @@ class TestDecisionMaker:
         smaller_decision_maker.from_dataframe(example_decision_maker_df)
         assert smaller_decision_maker == example_decision_maker
 
+    def test_mockup_decision_maker_is_built_from_frozen_arrays(self, example_decision_maker):
+        assert decision_maker_mockup.example_decision_maker == example_decision_maker
+        assert decision_maker_mockup.example_decision_maker is decision_maker_mockup.example_decision_maker
+        assert not decision_maker_mockup.example_decision_options_evaluation_array.flags.writeable
+        decision_maker = DecisionMaker()
+        decision_maker_mockup.set_attributes_from_example(decision_maker)
+        decision_maker.set_decision_options_evaluation(0, 0, 0)
+        assert decision_maker_mockup.example_decision_options_evaluation_array[0, 0] == 10
+
+    def test_set_attributes_from_arrays_shares_only_frozen_arrays(self, example_decision_maker):
+        decision_maker = DecisionMaker()
+        decision_maker_mockup.set_attributes_from_example(decision_maker)
+        assert decision_maker._decision_options_evaluation_array is \
+               decision_maker_mockup.example_decision_options_evaluation_array
+        # A read-only view of another decision maker's writable storage is copied.
+        # Storage is frozen by history checkpoints until an in-place edit copies it, which makes it writable.
+        example_decision_maker.set_decision_options_evaluation(0, 0, 1)
+        assert example_decision_maker._decision_options_evaluation_array.flags.writeable
+        other = DecisionMaker()
+        other.set_attributes_from_arrays(
+            decision_maker.decision, decision_maker.decision_options_list, decision_maker.evaluation_factors_list,
+            example_decision_maker.evaluation_factor_importance_array,
+            example_decision_maker.decision_options_evaluation_array, copy=False)
+        assert not np.shares_memory(
+            other._decision_options_evaluation_array, example_decision_maker._decision_options_evaluation_array)
+
+    def test_unchanged_values_keep_version(self, example_decision_maker):
+        version, undo_steps = example_decision_maker.version, len(example_decision_maker.history)
+        example_decision_maker.set_decision_options_evaluation(
+            0, 0, example_decision_maker.decision_options_evaluation_array[0, 0])
+        example_decision_maker.set_evaluation_factor_importance(
+            0, example_decision_maker.evaluation_factor_importance_array[0])
+        example_decision_maker.set_decision_options_count(example_decision_maker.decision_options_count)
+        example_decision_maker.set_evaluation_factors_count(example_decision_maker.evaluation_factors_count)
+        assert example_decision_maker.version == version
+        assert len(example_decision_maker.history) == undo_steps
+
     def test_raise_invalid_input_error(
             self,
             example_decision_maker_dataframe,
@@ -593,4 +634,397 @@ class TestDecisionMaker:
             example_decision_maker_dataframe_w_values_out_of_range
         ]:
             with pytest.raises(InvalidInputError):
-                DecisionMaker.raise_invalid_input_error(df)
\ No newline at end of file
+                DecisionMaker.raise_invalid_input_error(df)
+
+class TestDecisionMakerStorage:
+
+    def test_storage_arrays(self, example_decision_maker, example_decision_options_evaluation_df):
+        assert example_decision_maker._decision_options_evaluation_array.dtype == DecisionMaker.DECISION_OPTION_VALUE_DTYPE
+        assert example_decision_maker._evaluation_factor_importance_array.dtype == \
+               DecisionMaker.EVALUATION_FACTOR_IMPORTANCE_DTYPE
+        assert (
+            example_decision_maker._decision_options_evaluation_array
+            == example_decision_options_evaluation_df.to_numpy()
+        ).all()
+
+    def test_views_are_refreshed_after_edit(self, example_decision_maker):
+        assert example_decision_maker.decision_options_evaluation_df.loc["Speed", "Listen to your heart"] == 2
+        example_decision_maker.set_decision_options_evaluation(1, 0, 6)
+        assert example_decision_maker.decision_options_evaluation_df.loc["Speed", "Listen to your heart"] == 6
+        assert example_decision_maker.decision_options_evaluation_dict["Listen to your heart"]["Speed"] == 6
+
+    def test_views_are_refreshed_after_rename(self, example_decision_maker):
+        example_decision_maker.decision_options_evaluation_df
+        example_decision_maker.set_decision_option(1, "Ask friends")
+        assert "Ask friends" in example_decision_maker.decision_options_evaluation_df.columns
+        assert example_decision_maker.decision_option_index["Ask friends"] == 1
+
+    def test_to_dict_returns_copies(self, example_decision_maker):
+        decision_dict = example_decision_maker.to_dict()
+        decision_dict['decision_options_evaluation_dict']['Flip a coin']['Speed'] = 0
+        decision_dict['evaluation_factor_importance_dict']['Speed'] = 0
+        decision_dict['decision_options_list'].append("Ask friends")
+        assert example_decision_maker.decision_options_evaluation_dict['Flip a coin']['Speed'] == 10
+        assert example_decision_maker.evaluation_factor_importance_dict['Speed'] == 4
+        assert example_decision_maker.decision_options_count == len(example_decision_maker.decision_options_list)
+        assert example_decision_maker.to_dict() != decision_dict
+
+    @pytest.mark.parametrize("value, message", [
+        (200, "Decision evaluation values must be between 10 and 0, found at ('Speed', 'Flip a coin')"),
+        (-1, "Decision evaluation values must be between 10 and 0"),
+        (5.5, "must only have integer values"),
+        (np.nan, "must have no missing values"),
+        ("5", "must only have integer values"),
+    ])
+    def test_setters_refuse_values_storage_cannot_hold(self, example_decision_maker, value, message):
+        version = example_decision_maker.version
+        with pytest.raises(InvalidInputError, match=re.escape(message)):
+            example_decision_maker.set_decision_options_evaluation(0, 0, value)
+        with pytest.raises(InvalidInputError):
+            example_decision_maker.set_evaluation_factor_importance(0, value)
+        assert example_decision_maker.version == version
+        assert example_decision_maker.decision_options_evaluation_array[0, 0] == 10
+
+    def test_bulk_setters_refuse_values_storage_cannot_hold(
+            self, example_decision_maker, example_decision_options_evaluation_dict,
+            example_evaluation_factor_importance_dict):
+        example_decision_options_evaluation_dict["Flip a coin"]["Speed"] = 300
+        with pytest.raises(InvalidInputError, match="found at \\('Speed', 'Flip a coin'\\)"):
+            example_decision_maker.set_decision_options_evaluation_with_dict(example_decision_options_evaluation_dict)
+        example_evaluation_factor_importance_dict["Cost"] = 40_000
+        with pytest.raises(InvalidInputError, match="found at \\('Cost', 'Importance'\\)"):
+            example_decision_maker.set_evaluation_factor_importance_with_dict(example_evaluation_factor_importance_dict)
+        with pytest.raises(InvalidInputError):
+            example_decision_maker.insert_decision_option(0, "Ask friends", [1, 2, 3, 200])
+        with pytest.raises(InvalidInputError):
+            example_decision_maker.insert_evaluation_factor(0, "Fun", importance=11)
+        with pytest.raises(InvalidInputError):
+            example_decision_maker.insert_evaluation_factor(0, "Fun", evaluation=[1, 2, 3, 4.5])
+        assert example_decision_maker.decision_options_count == example_decision_maker.evaluation_factors_count == 4
+        assert example_decision_maker.decision_options_evaluation_array[0, 0] == 10
+
+    def test_from_dataframe_ignoring_errors_refuses_values_storage_cannot_hold(self, example_decision_maker):
+        df = example_decision_maker.to_dataframe()
+        df.iloc[0, 0] = 300
+        with pytest.raises(InvalidInputError, match="between 10 and 0"):
+            DecisionMaker().from_dataframe(df, errors="ignore")
+        df = example_decision_maker.to_dataframe().astype(float)
+        df.iloc[0, 0] = 5.5
+        with pytest.raises(InvalidInputError, match="integer"):
+            DecisionMaker().from_dataframe(df, errors="ignore")
+
+    def test_large_matrix(self):
+        decision_options_list = [f"Option {i + 1}" for i in range(300)]
+        evaluation_factors_list = [f"Factor {k + 1}" for k in range(80)]
+        values = np.arange(300 * 80).reshape(80, 300) % 11
+        decision_maker = DecisionMaker()
+        decision_maker.set_attributes(
+            decision_options_count=len(decision_options_list),
+            decision_options_list=decision_options_list,
+            evaluation_factors_count=len(evaluation_factors_list),
+            evaluation_factors_list=evaluation_factors_list,
+            evaluation_factor_importance_dict={k: 5 for k in evaluation_factors_list},
+            decision_options_evaluation_dict=pd.DataFrame(
+                values, index=evaluation_factors_list, columns=decision_options_list).to_dict(),
+        )
+        assert (decision_maker.decision_options_evaluation_df.to_numpy() == values).all()
+
+    def test_batch_rebuilds_dataframes_once(self, example_decision_maker, monkeypatch):
+        calls = []
+        convert = example_decision_maker.convert_decision_options_evaluation_dict_to_df
+        monkeypatch.setattr(
+            example_decision_maker, 'convert_decision_options_evaluation_dict_to_df',
+            lambda: calls.append(1) or convert()
+        )
+        with example_decision_maker.batch():
+            with example_decision_maker.batch():
+                for i in range(example_decision_maker.decision_options_count):
+                    for k in range(example_decision_maker.evaluation_factors_count):
+                        example_decision_maker.set_decision_options_evaluation(i, k, 1)
+            assert example_decision_maker.in_batch
+            assert calls == []
+        assert not example_decision_maker.in_batch
+        assert calls == [1]
+        assert (example_decision_maker.decision_options_evaluation_df == 1).all().all()
+
+    def test_batch_reads_current_state(self, example_decision_maker):
+        with example_decision_maker.batch():
+            example_decision_maker.set_evaluation_factor_importance(0, 10)
+            assert example_decision_maker.evaluation_factor_importance_dict["Speed"] == 10
+
+    def test_incremental_scores_match_full_recompute(self, example_decision_maker, example_scores):
+        example_decision_maker.check_incremental_scores = True
+        example_decision_maker.compute_decision_score()
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            i = rng.integers(example_decision_maker.decision_options_count)
+            k = rng.integers(example_decision_maker.evaluation_factors_count)
+            example_decision_maker.set_decision_options_evaluation(i, k, rng.integers(0, 11))
+            example_decision_maker.set_evaluation_factor_importance(k, rng.integers(1, 11))
+        example_decision_maker.set_decision_options_evaluation_with_dict(
+            decision_maker_mockup.example_decision_options_evaluation_dict)
+        example_decision_maker.set_evaluation_factor_importance_with_dict(
+            decision_maker_mockup.example_evaluation_factor_importance_dict)
+        example_decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        example_decision_maker.compute_decision_score()
+        assert example_decision_maker.decision_options_evaluation_df.loc["Score"].equals(example_scores['Score'])
+
+    def test_incremental_scores_check_detects_divergence(self, example_decision_maker):
+        example_decision_maker.check_incremental_scores = True
+        example_decision_maker.compute_decision_score()
+        example_decision_maker._weighted_sums[0] += 1
+        with pytest.raises(AssertionError):
+            example_decision_maker.set_decision_options_evaluation(1, 1, 3)
+
+    def test_compute_scenario_scores(self, example_decision_maker, example_scores):
+        importance = pd.DataFrame(
+            [
+                example_decision_maker.evaluation_factor_importance_dict,
+                {"Speed": 10, "Quality": 0, "Cost": 0, "Certainty": 0},
+            ],
+            index=["Example", "Speed only"]
+        )[["Certainty", "Cost", "Quality", "Speed"]]
+        scores, rankings = example_decision_maker.compute_scenario_scores(importance)
+        assert scores.loc["Example"].equals(example_scores['Score'].rename("Example"))
+        assert scores.loc["Speed only"].tolist() == [10.0, 2.0, 5.0, 8.0]
+        assert rankings.loc["Example"].tolist() == [3, 2, 4, 1]
+        assert rankings.loc["Speed only"].tolist() == [1, 4, 3, 2]
+
+    def test_compute_scenario_scores_fractional_weights(self, example_decision_maker, example_scores):
+        scores, rankings = example_decision_maker.compute_scenario_scores(
+            np.array([[0.5, 0.25, 0.25, 0], [0.4, 0.9, 0.2, 0.6]]))
+        # Speed 0.5, Quality 0.25, Cost 0.25 of the ratings of each decision option.
+        assert scores.loc[0].tolist() == pytest.approx([7.8, 5.2, 4.5, 8.2], abs=0.05)
+        assert rankings.loc[0].tolist() == [2, 3, 4, 1]
+        assert scores.loc[1].tolist() == example_scores['Score'].tolist()
+
+    @pytest.mark.parametrize("importance, message", [
+        ([[4, 9, 2, 6], [0, 0, 0, 0]], r"found scenarios \[1\] without any"),
+        ([[4, 9, 2, -1]], "non-negative"),
+        ([[4, 9, 2, np.nan]], "finite"),
+        ([[4, 9, 2, np.inf]], "finite"),
+    ])
+    def test_compute_scenario_scores_invalid_weights(self, example_decision_maker, importance, message):
+        with pytest.raises(InvalidInputError, match=message):
+            example_decision_maker.compute_scenario_scores(np.array(importance, dtype=float))
+
+    def test_compute_scenario_scores_invalid_shape(self, example_decision_maker):
+        with pytest.raises(InvalidInputError):
+            example_decision_maker.compute_scenario_scores(np.ones((3, 2)))
+
+    def test_from_csv(self, example_decision_maker):
+        example_decision_maker.compute_decision_score()
+        obtained_decision_maker = DecisionMaker()
+        obtained_decision_maker.from_csv(io.StringIO(example_decision_maker.to_csv()), chunksize=3)
+        assert obtained_decision_maker.to_dict() == example_decision_maker.to_dict()
+
+    def test_from_excel(self, example_decision_maker):
+        buffer = example_decision_maker.to_excel_writer()
+        buffer.seek(0)
+        obtained_decision_maker = DecisionMaker()
+        obtained_decision_maker.from_excel(buffer, chunksize=1)
+        assert obtained_decision_maker == example_decision_maker
+
+    def test_from_dataframe_chunks_validates_every_chunk(
+            self,
+            example_decision_maker_dataframe,
+            example_decision_maker_dataframe_w_values_out_of_range
+    ):
+        decision_maker = DecisionMaker()
+        chunks = [example_decision_maker_dataframe.iloc[:3], example_decision_maker_dataframe.iloc[2:]]
+        assert decision_maker.from_dataframe_chunks(chunks, errors="message") == \
+               "Invalid input: decision dataframe must have no duplicated row names, found at row 'Cost'."
+        chunks = [
+            example_decision_maker_dataframe_w_values_out_of_range.iloc[:2],
+            example_decision_maker_dataframe_w_values_out_of_range.iloc[2:],
+        ]
+        with pytest.raises(InvalidInputError):
+            decision_maker.from_dataframe_chunks(chunks)
+        assert decision_maker == DecisionMaker()
+
+    def test_save_options_are_lazy(self, example_decision_maker):
+        calls = []
+        to_csv = example_decision_maker.to_csv
+        example_decision_maker.save_options.register('csv', lambda: calls.append(1) or to_csv())
+        assert list(example_decision_maker.save_options.keys()) == ['csv', 'xlsx', 'dab']
+        assert calls == []
+        csv = example_decision_maker.save_options['csv']
+        assert example_decision_maker.save_options['csv'] is csv
+        assert calls == [1]
+        example_decision_maker.set_decision_options_evaluation(0, 0, 0)
+        assert example_decision_maker.save_options['csv'] != csv
+        assert calls == [1, 1]
+
+    def test_save_options_xlsx(self, example_decision_maker):
+        obtained_decision_maker = DecisionMaker()
+        obtained_decision_maker.from_excel(io.BytesIO(example_decision_maker.save_options['xlsx']))
+        assert obtained_decision_maker == example_decision_maker
+
+    def test_pickle(self, example_decision_maker):
+        example_decision_maker.compute_decision_score()
+        example_decision_maker.save_options['xlsx']
+        obtained_decision_maker = pickle.loads(pickle.dumps(example_decision_maker))
+        assert obtained_decision_maker == example_decision_maker
+        assert obtained_decision_maker.save_options['xlsx'] == example_decision_maker.save_options['xlsx']
+
+    def test_rename_keeps_label_ids(self, example_decision_maker):
+        label_id = example_decision_maker.evaluation_factor_labels.id(1)
+        example_decision_maker.evaluation_factor_importance_dict
+        example_decision_maker.set_evaluation_factor(1, "Relevance")
+        assert example_decision_maker.evaluation_factor_labels.id(1) == label_id
+        assert example_decision_maker.evaluation_factors_list == ["Speed", "Relevance", "Cost", "Certainty"]
+        assert list(example_decision_maker.evaluation_factor_importance_dict) == example_decision_maker.evaluation_factors_list
+
+    def test_insert_decision_option(self, example_decision_maker):
+        example_decision_maker.check_incremental_scores = True
+        example_decision_maker.compute_decision_score()
+        example_decision_maker.insert_decision_option(1, "Ask friends", [1, 2, 3, 4])
+        assert example_decision_maker.decision_options_count == 5
+        assert example_decision_maker.decision_options_list[1] == "Ask friends"
+        assert example_decision_maker.decision_options_evaluation_df["Ask friends"].tolist() == [1, 2, 3, 4]
+        assert example_decision_maker.decision_option_index["Listen to your heart"] == 2
+        example_decision_maker.insert_decision_option(-1, "Wait", None)
+        assert example_decision_maker.decision_options_list[-1] == "Wait"
+        assert (example_decision_maker.decision_options_evaluation_df["Wait"]
+                == DecisionMaker.DEFAULT_DECISION_OPTION_VALUE).all()
+
+    def test_remove_and_move_decision_option(self, example_decision_maker, example_scores):
+        example_decision_maker.check_incremental_scores = True
+        example_decision_maker.compute_decision_score()
+        column = example_decision_maker.decision_options_evaluation_array[:, 0].copy()
+        removed = example_decision_maker.decision_options_list[0]
+        assert example_decision_maker.remove_decision_option(0) == removed
+        assert removed not in example_decision_maker.decision_options_evaluation_df.columns
+        example_decision_maker.insert_decision_option(0, removed, column.tolist())
+        example_decision_maker.move_decision_option(removed, 3)
+        example_decision_maker.move_decision_option(3, 0)
+        example_decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        example_decision_maker.compute_decision_score()
+        assert example_decision_maker.decision_options_evaluation_df.loc["Score"].equals(example_scores['Score'])
+        with pytest.raises(KeyError):
+            example_decision_maker.remove_decision_option("Unknown")
+
+    def test_insert_remove_and_move_evaluation_factor(self, example_decision_maker, example_scores):
+        example_decision_maker.check_incremental_scores = True
+        example_decision_maker.compute_decision_score()
+        example_decision_maker.insert_evaluation_factor(2, "Fun", 7, [1, 2, 3, 4])
+        assert example_decision_maker.evaluation_factors_list == ["Speed", "Quality", "Fun", "Cost", "Certainty"]
+        assert example_decision_maker.evaluation_factor_importance_dict["Fun"] == 7
+        assert example_decision_maker.decision_options_evaluation_df.loc["Fun"].tolist() == [1, 2, 3, 4]
+        example_decision_maker.move_evaluation_factor("Speed", -1)
+        assert example_decision_maker.evaluation_factors_list == ["Quality", "Fun", "Cost", "Certainty", "Speed"]
+        assert example_decision_maker.evaluation_factor_importance_dict["Speed"] == \
+               decision_maker_mockup.example_evaluation_factor_importance_dict["Speed"]
+        assert example_decision_maker.remove_evaluation_factor("Fun") == "Fun"
+        example_decision_maker.move_evaluation_factor(-1, 0)
+        example_decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        example_decision_maker.compute_decision_score()
+        assert example_decision_maker.decision_options_evaluation_df.loc["Score"].equals(example_scores['Score'])
+
+    def test_duplicate_labels_are_refused(self, example_decision_maker):
+        decision_options_evaluation_df = example_decision_maker.decision_options_evaluation_df.copy()
+        history_length = len(example_decision_maker.history)
+        with pytest.raises(InvalidInputError, match="decision option 'Flip a coin'"):
+            example_decision_maker.insert_decision_option(0, "Flip a coin", None)
+        with pytest.raises(InvalidInputError, match="evaluation factor 'Cost'"):
+            example_decision_maker.insert_evaluation_factor(0, "Cost", 5, None)
+        with pytest.raises(InvalidInputError, match="decision option 'Flip a coin' already exists"):
+            example_decision_maker.set_decision_option(1, "Flip a coin")
+        with pytest.raises(InvalidInputError, match="evaluation factor 'Cost' already exists"):
+            example_decision_maker.set_evaluation_factor(0, "Cost")
+        with pytest.raises(InvalidInputError, match="found 'Speed' more than once"):
+            example_decision_maker.set_evaluation_factors_with_list(["Speed", "Quality", "Speed", "Certainty"])
+        assert example_decision_maker.decision_options_evaluation_df.equals(decision_options_evaluation_df)
+        assert len(example_decision_maker.history) == history_length
+        # Renaming a label to itself is not a duplicate.
+        example_decision_maker.set_evaluation_factor(2, "Cost")
+
+    def test_labels_can_be_swapped(self, example_decision_maker):
+        speed_importance = example_decision_maker.evaluation_factor_importance_dict["Speed"]
+        example_decision_maker.set_evaluation_factors_with_list(["Quality", "Speed", "Cost", "Certainty"])
+        assert example_decision_maker.evaluation_factors_list == ["Quality", "Speed", "Cost", "Certainty"]
+        assert example_decision_maker.evaluation_factor_importance_array[0] == speed_importance
+
+    def test_count_change_skips_taken_default_labels(self):
+        decision_maker = DecisionMaker()
+        decision_maker.init_decision_options_count(2)
+        decision_maker.set_decision_option(0, "Option 3")
+        decision_maker.set_decision_options_count(4)
+        assert decision_maker.decision_options_list == ["Option 3", "Option 2", "Option 4", "Option 5"]
+
+    def test_diff_decision_options_evaluation_df(self, example_decision_maker):
+        df = example_decision_maker.decision_options_evaluation_df.copy()
+        df.loc["Cost", "Hire a consultant"] = 10
+        df.loc["Score"] = 0
+        assert example_decision_maker.diff_decision_options_evaluation_df(df) == [
+            ("Hire a consultant", "Cost", 0, 10)]
+
+    def test_update_from_df_applies_only_changed_cells(self, example_decision_maker, example_scores):
+        example_decision_maker.check_incremental_scores = True
+        ratings_df = example_decision_maker.decision_options_evaluation_df.copy()
+        example_decision_maker.compute_decision_score()
+        importance_df = example_decision_maker.evaluation_factor_importance_df.copy()
+        ratings_df.loc["Speed", "Flip a coin"] = 0
+        importance_df.loc["Quality", "Importance"] = 1
+        sequence = example_decision_maker.history.sequence
+        assert len(example_decision_maker.update_decision_options_evaluation_from_df(ratings_df)) == 1
+        assert len(example_decision_maker.update_evaluation_factor_importance_from_df(importance_df)) == 1
+        assert len(example_decision_maker.history.changes_since(sequence)) == 2
+        assert example_decision_maker.decision_options_evaluation_df.equals(ratings_df)
+        assert example_decision_maker.evaluation_factor_importance_df.equals(importance_df)
+        assert example_decision_maker.update_decision_options_evaluation_from_df(ratings_df) == []
+
+    def test_update_from_df_refuses_invalid_edits(self, example_decision_maker):
+        ratings_df = example_decision_maker.decision_options_evaluation_df.astype(float)
+        importance_df = example_decision_maker.evaluation_factor_importance_df.astype(float)
+        ratings_df.loc["Speed", "Flip a coin"] = 3
+        ratings_df.loc["Quality", "Flip a coin"] = np.nan
+        ratings_df.loc["Cost", "Flip a coin"] = 200
+        importance_df.loc["Cost", "Importance"] = 2.5
+        sequence = example_decision_maker.history.sequence
+        with pytest.raises(InvalidInputError) as error:
+            example_decision_maker.update_decision_options_evaluation_from_df(ratings_df)
+        assert [(violation.row, violation.column) for violation in error.value.violations] == [
+            ("Quality", "Flip a coin"), ("Cost", "Flip a coin")]
+        with pytest.raises(InvalidInputError, match="integer"):
+            example_decision_maker.update_evaluation_factor_importance_from_df(importance_df)
+        assert example_decision_maker.history.sequence == sequence
+        assert example_decision_maker.decision_options_evaluation_df.loc["Speed", "Flip a coin"] == 10
+        ratings_df.loc[["Quality", "Cost"], "Flip a coin"] = [2, 9]
+        changes = example_decision_maker.update_decision_options_evaluation_from_df(ratings_df)
+        assert changes == [("Flip a coin", "Speed", 10, 3)]
+        assert type(changes[0][3]) is int
+
+    def test_version_is_incremented_by_changes_only(self, example_decision_maker):
+        version = example_decision_maker.version
+        example_decision_maker.set_decision_options_evaluation(0, 0, 9)
+        assert example_decision_maker.version > version
+        version = example_decision_maker.version
+        example_decision_maker.decision_options_evaluation_df
+        example_decision_maker.compute_decision_score()
+        example_decision_maker.set_decision(example_decision_maker.decision)
+        assert example_decision_maker.version == version
+
+    def test_rendered_artifacts_are_cached_by_version(self, example_decision_maker):
+        example_decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        example_decision_maker.compute_decision_score()
+        styler = example_decision_maker.style_decision_options_evaluation_df(cmap='Greens')
+        fig = example_decision_maker.plot_score()
+        assert example_decision_maker.style_decision_options_evaluation_df(cmap='Greens') is styler
+        assert example_decision_maker.style_decision_options_evaluation_df(cmap='Blues') is not styler
+        assert example_decision_maker.plot_score() is fig
+
+        example_decision_maker.set_evaluation_factor_importance(0, 1)
+        example_decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        example_decision_maker.compute_decision_score()
+        assert example_decision_maker.plot_score() is not fig
+        assert example_decision_maker.style_decision_options_evaluation_df(cmap='Greens') is not styler
+
+    def test_rendered_artifacts_follow_score_computation(self, example_decision_maker):
+        example_decision_maker.compute_decision_score()
+        styler = example_decision_maker.style_score_df()
+        example_decision_maker.set_decision_options_evaluation(0, 0, 0)
+        example_decision_maker.compute_decision_score()
+        assert example_decision_maker.style_score_df().data.equals(
+            example_decision_maker.decision_options_evaluation_df.T[['Score']].sort_values('Score', ascending=False))
+        assert example_decision_maker.style_score_df() is not styler
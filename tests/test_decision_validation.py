@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import decision_maker_mockup
+from decision_maker import DecisionMaker, InvalidInputError
+from decision_validation import (
+    MISSING_VALUE_MESSAGE, NON_INTEGER_MESSAGE, ValidationResult, rating_range_message, validate_decision_dataframe,
+)
+
+
+@pytest.fixture
+def example_decision_maker_dataframe():
+    return decision_maker_mockup.example_decision_maker.to_dataframe()
+
+
+def validate(df: pd.DataFrame) -> ValidationResult:
+    return validate_decision_dataframe(df, importance_range=(0, 10), rating_range=(0, 10))
+
+
+class TestValidateDecisionDataframe:
+
+    def test_valid(self, example_decision_maker_dataframe):
+        result = validate(example_decision_maker_dataframe)
+        assert result.is_valid
+        assert result.message is None
+
+    def test_reports_every_violation(self, example_decision_maker_dataframe):
+        df = example_decision_maker_dataframe.astype(object)
+        df.iloc[0, 0] = np.nan
+        df.iloc[1, 1] = ""
+        df.iloc[2, 2] = "text"
+        df.iloc[3, 2] = 11
+        df.iloc[3, 3] = 5.5
+        df.iloc[0, -1] = -1
+        result = validate(df)
+        assert [(violation.message, violation.row, violation.column) for violation in result.violations] == [
+            (MISSING_VALUE_MESSAGE, "Speed", "Flip a coin"),
+            (NON_INTEGER_MESSAGE, "Quality", "Listen to your heart"),
+            (NON_INTEGER_MESSAGE, "Cost", "Hire a consultant"),
+            (NON_INTEGER_MESSAGE, "Certainty", "Use decision maker"),
+            ("Invalid input: Importance values must be between 10 and 0.", "Speed", "Importance"),
+            (rating_range_message((0, 10)), "Certainty", "Hire a consultant"),
+        ]
+        assert result.message.splitlines()[0] == \
+               "Invalid input: decision dataframe must have no missing values, found at ('Speed', 'Flip a coin')."
+
+    def test_labels(self, example_decision_maker_dataframe):
+        df = pd.concat([example_decision_maker_dataframe, example_decision_maker_dataframe.iloc[:1]])
+        df = df.drop(columns=["Importance"])
+        result = validate(df)
+        assert result.message.splitlines() == [
+            "Invalid input: 'Importance' column must be present in decision dataframe.",
+            "Invalid input: decision dataframe must have no duplicated row names, found at row 'Speed'.",
+        ]
+
+    def test_max_violations(self, example_decision_maker_dataframe):
+        df = example_decision_maker_dataframe + 20
+        result = validate_decision_dataframe(
+            df, importance_range=(0, 10), rating_range=(0, 10), result=ValidationResult(max_violations=3))
+        assert result.violation_count == df.size
+        assert len(result.violations) == 3
+        assert result.message.endswith(f"{df.size - 3} more violations were not listed.")
+
+
+class TestDecisionMakerValidation:
+
+    def test_raise_mode_carries_violations(self, example_decision_maker_dataframe):
+        df = example_decision_maker_dataframe.copy()
+        df.iloc[0, 0] = 11
+        df.iloc[1, 0] = 12
+        with pytest.raises(InvalidInputError) as excinfo:
+            DecisionMaker().from_dataframe(df)
+        assert [(violation.row, violation.value) for violation in excinfo.value.violations] == [
+            ("Speed", 11), ("Quality", 12)]
+
+    def test_message_mode_collects_every_chunk(self, example_decision_maker_dataframe):
+        df = example_decision_maker_dataframe.copy()
+        df.iloc[0, 0] = 11
+        df.iloc[3, 1] = -1
+        message = DecisionMaker().from_dataframe_chunks([df.iloc[:2], df.iloc[2:]], errors="message")
+        assert message == (
+            "Invalid input: Decision evaluation values must be between 10 and 0, "
+            "found at ('Speed', 'Flip a coin'), ('Certainty', 'Listen to your heart')."
+        )
+
+    def test_check_decision_arrays(self):
+        result = DecisionMaker.check_decision_arrays(
+            np.array([5, 11]), np.array([[0, 1], [-1, 10]]), ["Speed", "Cost"], ["A", "B"])
+        assert [(violation.row, violation.column) for violation in result.violations] == [
+            ("Cost", "Importance"), ("Cost", "A")]
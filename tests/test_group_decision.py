@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+from decision_maker import DecisionMaker, InvalidInputError
+from decision_maker_mockup import example_decision_maker
+from group_decision import AGGREGATIONS, GroupDecision
+
+
+@pytest.fixture
+def random_ratings():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 11, size=(9, 3, 5)), rng.integers(0, 11, size=(9, 3))
+
+
+@pytest.fixture
+def random_group_decision(random_ratings):
+    ratings, importance = random_ratings
+    group_decision = GroupDecision([f"Option {i}" for i in range(5)], [f"Factor {k}" for k in range(3)])
+    for r in range(len(ratings)):
+        group_decision.add_rater(f"Rater {r}", ratings[r], importance[r])
+    return group_decision
+
+
+def trimmed_mean(values: np.ndarray, trim: float) -> np.ndarray:
+    cut = int(trim * len(values))
+    return np.sort(values, axis=0)[cut:len(values) - cut].mean(axis=0)
+
+
+def geometric_mean(values: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore'):
+        return np.exp(np.log(values.astype(np.float64)).mean(axis=0))
+
+
+def kendalls_w(rankings: np.ndarray) -> float:
+    raters_count, options_count = rankings.shape
+    rank_sums = rankings.sum(axis=0)
+    ties = sum(
+        (counts ** 3 - counts).sum() for counts in (np.unique(ranking, return_counts=True)[1] for ranking in rankings))
+    s = ((rank_sums - rank_sums.mean()) ** 2).sum()
+    return 12 * s / (raters_count ** 2 * (options_count ** 3 - options_count) - raters_count * ties)
+
+
+class TestGroupDecision:
+
+    @pytest.mark.parametrize("raters_count", [1, 2, 5, 9])
+    @pytest.mark.parametrize("aggregation, reference", [
+        ("mean", lambda values: values.mean(axis=0)),
+        ("median", lambda values: np.median(values, axis=0)),
+        ("trimmed_mean", lambda values: trimmed_mean(values, 0.2)),
+        ("geometric_mean", geometric_mean),
+    ])
+    def test_aggregations_match_stacked_arrays(self, random_ratings, raters_count, aggregation, reference):
+        ratings, importance = (array[:raters_count] for array in random_ratings)
+        group_decision = GroupDecision([f"Option {i}" for i in range(5)], [f"Factor {k}" for k in range(3)])
+        for r in range(raters_count):
+            group_decision.add_rater(f"Rater {r}", ratings[r], importance[r])
+        assert np.array_equal(group_decision.decision_options_evaluation, ratings)
+        assert np.array_equal(group_decision.evaluation_factor_importance, importance)
+
+        aggregated_ratings = group_decision.aggregate_decision_options_evaluation(aggregation, trim=0.2).to_numpy()
+        aggregated_importance = group_decision.aggregate_evaluation_factor_importance(aggregation, trim=0.2).to_numpy()
+        assert aggregated_ratings == pytest.approx(reference(ratings))
+        assert aggregated_importance == pytest.approx(reference(importance))
+        scores = group_decision.aggregate_scores(aggregation, trim=0.2).scores
+        # A geometric mean is 0 when any rater gives 0, which can leave no importance to normalise by.
+        with np.errstate(invalid='ignore'):
+            expected_scores = aggregated_importance @ aggregated_ratings / aggregated_importance.sum()
+        assert scores.to_numpy() == pytest.approx(expected_scores, nan_ok=True)
+
+    def test_rater_rankings(self, random_group_decision, random_ratings):
+        ratings, importance = random_ratings
+        rankings_df = random_group_decision.rater_rankings_df()
+        assert rankings_df.shape == (9, 5)
+        weighted_sums = np.einsum('rf,rfo->ro', importance, ratings)
+        for r, ranking in enumerate(rankings_df.to_numpy()):
+            assert ranking.tolist() == [1 + (weighted_sums[r] > score).sum() for score in weighted_sums[r]]
+        scores_df = random_group_decision.rater_scores_df()
+        assert scores_df.loc["Rater 0"].tolist() == (weighted_sums[0] / importance[0].sum()).round(1).tolist()
+
+    def test_kendalls_w(self, random_group_decision):
+        rankings_df = random_group_decision.rater_rankings_df()
+        average_rankings = (
+            rankings_df.T.rank(method='min') + rankings_df.T.rank(method='max')).T.to_numpy() / 2
+        assert random_group_decision.kendalls_w() == pytest.approx(kendalls_w(average_rankings))
+
+    def test_kendalls_w_bounds(self):
+        group_decision = GroupDecision(["A", "B", "C"], ["Speed"])
+        for rater in ["X", "Y", "Z"]:
+            group_decision.add_rater(rater, [[9, 5, 1]], [5])
+        assert group_decision.kendalls_w() == pytest.approx(1)
+        group_decision = GroupDecision(["A", "B"], ["Speed"])
+        group_decision.add_rater("X", [[9, 1]], [5])
+        group_decision.add_rater("Y", [[1, 9]], [5])
+        assert group_decision.kendalls_w() == pytest.approx(0)
+        group_decision.add_rater("Z", [[5, 5]], [5])
+        assert group_decision.kendalls_w() == pytest.approx(0)
+
+    def test_add_rater_incrementally(self, random_group_decision, random_ratings):
+        ratings, importance = random_ratings
+        rating_counts = random_group_decision._rating_counts.copy()
+        random_group_decision.add_rater("Late rater", ratings[0], importance[0])
+        assert len(random_group_decision) == 10
+        assert random_group_decision._rating_counts.sum() - rating_counts.sum() == ratings[0].size
+        stacked = np.concatenate([ratings, ratings[:1]])
+        assert random_group_decision.aggregate_decision_options_evaluation("median").to_numpy() == pytest.approx(
+            np.median(stacked, axis=0))
+
+    def test_from_decision_makers_matches_labels(self):
+        reordered_decision_maker = DecisionMaker()
+        reordered_decision_maker.set_attributes_from(example_decision_maker)
+        reordered_decision_maker.move_decision_option(0, 3)
+        reordered_decision_maker.move_evaluation_factor(1, 0)
+        group_decision = GroupDecision.from_decision_makers(
+            {"Alice": example_decision_maker, "Bob": reordered_decision_maker})
+        assert group_decision.kendalls_w() == pytest.approx(1)
+        assert np.array_equal(*group_decision.decision_options_evaluation)
+        assert group_decision.aggregate_scores().scores.round(1).tolist() == [5.9, 6.0, 5.5, 8.4]
+
+    def test_invalid_raters(self, random_group_decision, random_ratings):
+        ratings, importance = random_ratings
+        with pytest.raises(InvalidInputError, match="already"):
+            random_group_decision.add_rater("Rater 0", ratings[0], importance[0])
+        with pytest.raises(InvalidInputError, match="must rate 5 decision options on 3 evaluation factors"):
+            random_group_decision.add_rater("New rater", ratings[0][:, :4], importance[0])
+        out_of_range = ratings[0].copy()
+        out_of_range[2, 4] = 11
+        with pytest.raises(InvalidInputError, match="found at \\('Factor 2', 'Option 4'\\)"):
+            random_group_decision.add_rater("New rater", out_of_range, importance[0])
+        with pytest.raises(InvalidInputError, match="integer"):
+            random_group_decision.add_rater("New rater", ratings[0] + 0.5, importance[0])
+        with pytest.raises(InvalidInputError):
+            random_group_decision.add_decision_maker("New rater", example_decision_maker)
+        assert len(random_group_decision) == 9
+
+    def test_unknown_aggregation(self, random_group_decision):
+        with pytest.raises(ValueError, match="Unknown aggregation"):
+            random_group_decision.aggregate_scores("mode")
+        assert set(AGGREGATIONS) == {"mean", "median", "trimmed_mean", "geometric_mean"}
@@ -0,0 +1,38 @@
+import pytest
+
+from label_index import LabelIndex
+
+
+@pytest.fixture
+def example_label_index():
+    return LabelIndex(["Speed", "Quality", "Cost", "Certainty"])
+
+
+class TestLabelIndex:
+
+    def test_init(self, example_label_index):
+        assert len(example_label_index) == 4
+        assert example_label_index.to_list() == ["Speed", "Quality", "Cost", "Certainty"]
+        assert example_label_index.ids == [0, 1, 2, 3]
+
+    def test_rename_keeps_id_and_order(self, example_label_index):
+        label_id = example_label_index.id(1)
+        assert example_label_index.rename(1, "Relevance") == "Quality"
+        assert example_label_index.id(1) == label_id
+        assert example_label_index.label(label_id) == "Relevance"
+        assert list(example_label_index) == ["Speed", "Relevance", "Cost", "Certainty"]
+
+    def test_extend_and_truncate(self, example_label_index):
+        example_label_index.truncate(2)
+        assert example_label_index.to_list() == ["Speed", "Quality"]
+        assert example_label_index.extend(["Price"]) == [4]
+        assert example_label_index.to_list() == ["Speed", "Quality", "Price"]
+        assert example_label_index[2] == "Price"
+
+    def test_insert_remove_and_move(self, example_label_index):
+        assert example_label_index.insert(1, "Price") == 4
+        assert example_label_index.to_list() == ["Speed", "Price", "Quality", "Cost", "Certainty"]
+        assert example_label_index.remove(2) == "Quality"
+        example_label_index.move(0, 3)
+        assert example_label_index.to_list() == ["Price", "Cost", "Certainty", "Speed"]
+        assert example_label_index.ids == [4, 2, 3, 0]
@@ -0,0 +1,30 @@
+from render_cache import RenderCache
+
+
+class TestRenderCache:
+
+    def test_get_or_build(self):
+        render_cache = RenderCache()
+        builds = []
+        assert render_cache.get_or_build("a", lambda: builds.append("a") or 1) == 1
+        assert render_cache.get_or_build("a", lambda: builds.append("a") or 2) == 1
+        assert builds == ["a"]
+        assert (render_cache.hits, render_cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        render_cache = RenderCache(maxsize=2)
+        render_cache.get_or_build("a", lambda: 1)
+        render_cache.get_or_build("b", lambda: 2)
+        render_cache.get_or_build("a", lambda: 1)
+        render_cache.get_or_build("c", lambda: 3)
+        assert "a" in render_cache and "c" in render_cache
+        assert "b" not in render_cache
+        assert len(render_cache) == 2
+
+    def test_discard(self):
+        render_cache = RenderCache()
+        for key in [("a", 1), ("a", 2), ("b", 2)]:
+            render_cache.get_or_build(key, lambda: key)
+        assert render_cache.discard(lambda key: key[1] != 2) == 1
+        assert ("a", 1) not in render_cache
+        assert len(render_cache) == 2
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from decision_maker_mockup import example_decision_maker
+from robustness_analysis import RobustnessAnalysis, sample_rank_counts
+
+
+@pytest.fixture
+def example_robustness_analysis():
+    return RobustnessAnalysis(example_decision_maker, max_chunk_bytes=2 ** 16)
+
+
+class TestRobustnessAnalysis:
+
+    def test_run(self, example_robustness_analysis):
+        rank_acceptability_df = example_robustness_analysis.run(samples=5_000, seed=0)
+        assert rank_acceptability_df.shape == (4, 4)
+        assert np.allclose(rank_acceptability_df.sum(axis=0), 1)
+        assert np.allclose(rank_acceptability_df.sum(axis=1), 1)
+        assert example_robustness_analysis.win_probability.idxmax() == "Use decision maker"
+
+    def test_run_is_seedable(self, example_robustness_analysis):
+        first = example_robustness_analysis.run(samples=1_000, seed=42).copy()
+        second = example_robustness_analysis.run(samples=1_000, seed=42)
+        assert first.equals(second)
+
+    def test_run_is_chunked(self, example_robustness_analysis):
+        assert example_robustness_analysis.chunk_size < 1_000
+        example_robustness_analysis.run(samples=1_000, seed=0)
+        assert example_robustness_analysis.samples == 1_000
+
+    def test_run_in_process_pool(self, example_robustness_analysis):
+        expected = example_robustness_analysis.run(samples=1_000, seed=1).copy()
+        assert example_robustness_analysis.run(samples=1_000, seed=1, n_jobs=2).equals(expected)
+
+    def test_no_noise_keeps_ranking(self):
+        rank_counts = sample_rank_counts(
+            example_decision_maker.decision_options_evaluation_array.astype(float),
+            example_decision_maker.evaluation_factor_importance_array.astype(float),
+            samples=10, seed=np.random.SeedSequence(0), rating_noise=0, importance_noise=0,
+        )
+        assert rank_counts[:, 0].tolist() == [0, 0, 0, 10]
+
+    def test_ties_are_split_evenly(self):
+        decision_options_evaluation = np.array([[8., 8., 2.], [3., 3., 3.]])
+        rank_counts = sample_rank_counts(
+            decision_options_evaluation, np.array([5., 5.]),
+            samples=10_000, seed=np.random.SeedSequence(0), rating_noise=0, importance_noise=0,
+        )
+        assert rank_counts[:, 0] / 10_000 == pytest.approx([0.5, 0.5, 0], abs=0.02)
+        assert rank_counts.sum(axis=0).tolist() == [10_000] * 3
+
+    def test_dirichlet(self, example_robustness_analysis):
+        example_robustness_analysis.importance_distribution = "dirichlet"
+        rank_acceptability_df = example_robustness_analysis.run(samples=1_000, seed=0)
+        assert np.allclose(rank_acceptability_df.sum(axis=1), 1)
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from decision_maker import DecisionMaker, InvalidInputError
+from decision_maker_mockup import set_attributes_from_example
+from scoring_engines import (
+    SCORING_ENGINES, ScoringResult, min_regret, promethee_ii, register_scoring_engine, topsis, weighted_product,
+)
+
+
+@pytest.fixture
+def example_decision_maker():
+    decision_maker = DecisionMaker()
+    set_attributes_from_example(decision_maker)
+    return decision_maker
+
+
+@pytest.fixture
+def random_decision():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 11, size=(7, 13)).astype(np.float64), rng.integers(0, 11, size=7).astype(np.float64)
+
+
+def promethee_ii_brute_force(ratings, importance, preference_threshold=1.):
+    weights = importance / importance.sum()
+    options_count = ratings.shape[1]
+    preference = np.zeros((options_count, options_count))
+    for a in range(options_count):
+        for b in range(options_count):
+            preference[a, b] = sum(
+                weights[k] * min(max((ratings[k, a] - ratings[k, b]) / preference_threshold, 0), 1)
+                for k in range(ratings.shape[0]))
+    return (preference.sum(axis=1) - preference.sum(axis=0)) / (options_count - 1)
+
+
+class TestScoringEngines:
+
+    @pytest.mark.parametrize("block_elements", [1, 7 * 13 * 4, 2 ** 22])
+    @pytest.mark.parametrize("preference_threshold", [1., 3.])
+    def test_promethee_ii_matches_brute_force(self, random_decision, block_elements, preference_threshold):
+        ratings, importance = random_decision
+        flows = promethee_ii(ratings, importance, preference_threshold, block_elements=block_elements)
+        assert flows == pytest.approx(promethee_ii_brute_force(ratings, importance, preference_threshold))
+        assert flows.sum() == pytest.approx(0)
+
+    def test_topsis(self):
+        ratings = np.array([[10., 0.], [0., 10.]])
+        assert topsis(ratings, np.array([1., 1.])) == pytest.approx([0.5, 0.5])
+        assert topsis(ratings, np.array([3., 1.])) == pytest.approx([0.75, 0.25])
+        assert topsis(np.full((2, 3), 5.), np.array([1., 1.])) == pytest.approx([0.5, 0.5, 0.5])
+        assert topsis(np.zeros((2, 3)), np.array([1., 1.])) == pytest.approx([0.5, 0.5, 0.5])
+
+    def test_weighted_product(self):
+        ratings = np.array([[4., 0., 10.], [9., 10., 10.]])
+        assert weighted_product(ratings, np.array([1., 1.])) == pytest.approx([6., 0., 10.])
+        # A zero rating on a factor without importance does not count.
+        assert weighted_product(ratings, np.array([0., 1.])) == pytest.approx([9., 10., 10.])
+
+    def test_min_regret(self):
+        ratings = np.array([[10., 6., 0.], [0., 6., 10.]])
+        assert min_regret(ratings, np.array([1., 1.])) == pytest.approx([-10., -4., -10.])
+        assert min_regret(ratings, np.array([1., 0.5])) == pytest.approx([-5., -4., -10.])
+        stakeholder_importance = np.array([[1., 0.], [0., 1.], [1., 1.]])
+        assert min_regret(ratings, np.array([1., 1.]), stakeholder_importance) == pytest.approx([-10., -4., -10.])
+
+    def test_min_regret_single_option(self):
+        assert min_regret(np.array([[3.], [4.]]), np.array([1., 2.])) == pytest.approx([0.])
+
+
+class TestDecisionMakerScore:
+
+    def test_weighted_sum_matches_decision_score(self, example_decision_maker):
+        example_decision_maker.compute_decision_score()
+        result = example_decision_maker.score()
+        assert result.score_df.equals(example_decision_maker.decision_options_evaluation_df.T[['Score']])
+        assert result.ranks.tolist() == [3, 2, 4, 1]
+
+    @pytest.mark.parametrize("engine", list(SCORING_ENGINES))
+    def test_every_engine_ranks_use_decision_maker_first(self, example_decision_maker, engine):
+        result = example_decision_maker.score(engine)
+        assert result.engine == engine
+        assert result.scores.index.tolist() == example_decision_maker.decision_options_list
+        assert result.ranks["Use decision maker"] == 1
+
+    def test_score_is_cached_until_the_decision_changes(self, example_decision_maker):
+        result = example_decision_maker.score('promethee_ii')
+        assert example_decision_maker.score('promethee_ii') is result
+        assert example_decision_maker.score('promethee_ii', preference_threshold=2.) is not result
+        example_decision_maker.set_decision_options_evaluation(0, 0, 0)
+        assert example_decision_maker.score('promethee_ii') is not result
+
+    def test_min_regret_with_stakeholder_importance(self, example_decision_maker):
+        stakeholder_importance = pd.DataFrame(
+            [[1, 0, 0, 0], [0, 0, 1, 0]], index=["Speed lovers", "Cost cutters"],
+            columns=["Speed", "Quality", "Cost", "Certainty"])
+        result = example_decision_maker.score('min_regret', stakeholder_importance=stakeholder_importance)
+        assert result.scores.tolist() == pytest.approx([-1., -8., -10., -2.])
+        assert example_decision_maker.score(
+            'min_regret', stakeholder_importance=stakeholder_importance.to_numpy()) is result
+        with pytest.raises(InvalidInputError):
+            example_decision_maker.score('min_regret', stakeholder_importance=np.ones((2, 3)))
+
+    @pytest.mark.parametrize("engine", list(SCORING_ENGINES))
+    def test_ranks_without_importance(self, example_decision_maker, engine):
+        for k in range(example_decision_maker.evaluation_factors_count):
+            example_decision_maker.set_evaluation_factor_importance(k, 0)
+        ranks = example_decision_maker.score(engine).ranks
+        assert ranks.dtype == 'Int64'
+        assert ranks.isna().all() or (ranks == 1).all()
+
+    def test_unknown_engine(self, example_decision_maker):
+        with pytest.raises(KeyError, match="Unknown scoring engine 'borda'"):
+            example_decision_maker.score('borda')
+
+    def test_registered_engine(self, example_decision_maker):
+        engine = register_scoring_engine('best_rating', lambda ratings, importance: ratings.max(axis=0), "best rating")
+        try:
+            assert example_decision_maker.score('best_rating').scores.tolist() == [10, 10, 8, 9]
+        finally:
+            del SCORING_ENGINES['best_rating']
+        assert example_decision_maker.score(engine).label == "best rating"
+
+    def test_render_result(self, example_decision_maker):
+        result = example_decision_maker.score('topsis')
+        fig = example_decision_maker.plot_score(result=result)
+        assert fig.layout.title.text == "Decision options ranked by TOPSIS score"
+        assert list(fig.data[0].x) == result.score_df.sort_values('Score')['Score'].tolist()
+        assert example_decision_maker.plot_score(result=example_decision_maker.score('topsis')) is fig
+        styler = example_decision_maker.style_score_df(result=result)
+        assert styler.data.equals(result.score_df.sort_values('Score', ascending=False))
+        assert f"{result.scores.max():.3f}" in styler.to_html()
+
+    def test_scoring_result_without_decision_maker(self):
+        result = ScoringResult('custom', "custom", pd.Series([0.25, 0.75], index=["A", "B"]), decimals=2)
+        assert result.ranks.tolist() == [2, 1]
+        assert result.format_str == "{:.2f}"
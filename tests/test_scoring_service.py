@@ -0,0 +1,117 @@
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import decision_maker_mockup
+from scoring_service import ScoringClient, ScoringService, decision_dataframe_from_dict, score_decision
+
+EXPECTED_SCORES = {
+    "Flip a coin": 5.9, "Listen to your heart": 6.0, "Hire a consultant": 5.5, "Use decision maker": 8.4,
+}
+EXPECTED_RANKS = {"Flip a coin": 3, "Listen to your heart": 2, "Hire a consultant": 4, "Use decision maker": 1}
+
+
+@pytest.fixture
+def example_decision_dict():
+    return decision_maker_mockup.example_decision_maker.to_dict()
+
+
+def serve(requests, **kwargs):
+    """Run `requests(client)` against a service on a free local port and return its result."""
+    async def run():
+        kwargs.setdefault('executor', ThreadPoolExecutor(max_workers=2))
+        async with ScoringService(port=0, **kwargs) as service:
+            async with ScoringClient(service.host, service.port) as client:
+                return await requests(client)
+    return asyncio.run(run())
+
+
+class TestScoreDecision:
+
+    def test_score_dict(self, example_decision_dict):
+        response = score_decision(example_decision_dict)
+        assert response['valid']
+        assert response['decision'] == "What is the best way to take decisions?"
+        assert response['scores'] == EXPECTED_SCORES
+        assert response['ranks'] == EXPECTED_RANKS
+        assert response['adj_by_importance']['Speed']['Flip a coin'] == pytest.approx(10 * 4 / 21)
+
+    def test_score_csv_matches_dict(self, example_decision_dict):
+        csv = decision_maker_mockup.example_decision_maker.to_csv()
+        assert score_decision(csv) == score_decision(example_decision_dict)
+
+    def test_score_reports_every_violation(self, example_decision_dict):
+        example_decision_dict['decision_options_evaluation_dict']['Flip a coin']['Speed'] = 11
+        example_decision_dict['decision_options_evaluation_dict']['Hire a consultant']['Cost'] = 12
+        del example_decision_dict['evaluation_factor_importance_dict']['Quality']
+        response = score_decision(example_decision_dict)
+        assert not response['valid']
+        assert 'scores' not in response
+        assert [(error['row'], error['column']) for error in response['errors']] == [
+            ('Quality', 'Importance'), ('Speed', 'Flip a coin'), ('Cost', 'Hire a consultant')]
+
+    def test_decision_dataframe_from_dict_without_lists(self, example_decision_dict):
+        for key in ['decision_options_list', 'evaluation_factors_list']:
+            del example_decision_dict[key]
+        df = decision_dataframe_from_dict(example_decision_dict)
+        assert df.equals(decision_maker_mockup.example_decision_maker.to_dataframe())
+
+
+class TestScoringService:
+
+    def test_score(self, example_decision_dict):
+        async def requests(client):
+            return [
+                await client.score(example_decision_dict),
+                await client.score(decision_maker_mockup.example_decision_maker.to_csv()),
+                await client.request("GET", "/health"),
+            ]
+        (json_status, json_response), (csv_status, csv_response), health = serve(requests)
+        assert json_status == csv_status == 200
+        assert json_response['scores'] == csv_response['scores'] == EXPECTED_SCORES
+        assert health == (200, {'status': "ok"})
+
+    def test_score_offloaded_to_process_pool(self, example_decision_dict):
+        status, response = serve(
+            lambda client: client.score(example_decision_dict), executor=None, max_workers=1, offload_body_bytes=0)
+        assert status == 200
+        assert response['ranks'] == EXPECTED_RANKS
+
+    def test_score_batch(self, example_decision_dict):
+        invalid_decision_dict = copy.deepcopy(example_decision_dict)
+        invalid_decision_dict['evaluation_factor_importance_dict']['Speed'] = -1
+        decisions = [example_decision_dict, invalid_decision_dict, "not,a\ncsv,file,at,all", 42] * 3
+        status, responses = serve(lambda client: client.score_batch(decisions), batch_chunksize=5)
+        assert status == 200
+        assert [response['valid'] for response in responses] == [True, False, False, False] * 3
+        assert responses[0]['scores'] == EXPECTED_SCORES
+        assert responses[1]['errors'][0]['value'] == -1
+
+    @pytest.mark.parametrize("method, path, body, content_type, expected_status", [
+        ("POST", "/score", b"{", "application/json", 400),
+        ("POST", "/score", b"<decision/>", "application/xml", 415),
+        ("POST", "/score/batch", b"{}", "application/json", 400),
+        ("GET", "/score", b"", "application/json", 405),
+        ("GET", "/missing", b"", "application/json", 404),
+    ])
+    def test_request_errors(self, method, path, body, content_type, expected_status):
+        async def requests(client):
+            # The connection is kept alive after an error response.
+            return [await client.request(method, path, body, content_type), await client.request("GET", "/health")]
+        (status, response), (health_status, _) = serve(requests)
+        assert status == expected_status
+        assert response['message']
+        assert health_status == 200
+
+    def test_invalid_decision_is_unprocessable(self, example_decision_dict):
+        example_decision_dict['decision_options_evaluation_dict']['Flip a coin']['Speed'] = 11
+        status, response = serve(lambda client: client.score(example_decision_dict))
+        assert status == 422
+        assert response['message'] == (
+            "Invalid input: Decision evaluation values must be between 10 and 0, found at ('Speed', 'Flip a coin').")
+
+    def test_body_too_large(self, example_decision_dict):
+        status, response = serve(lambda client: client.score(example_decision_dict), max_body_bytes=10)
+        assert status == 413
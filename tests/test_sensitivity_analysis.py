@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from decision_maker_mockup import example_decision_maker
+from sensitivity_analysis import SensitivityAnalysis
+
+
+@pytest.fixture
+def example_sensitivity_analysis():
+    return SensitivityAnalysis(example_decision_maker)
+
+
+def top_decision_option(importance: np.ndarray) -> str:
+    weighted_sums = importance @ example_decision_maker.decision_options_evaluation_array
+    return example_decision_maker.decision_options_list[int(np.argmax(weighted_sums))]
+
+
+class TestSensitivityAnalysis:
+
+    def test_top_decision_option(self, example_sensitivity_analysis):
+        assert example_sensitivity_analysis.top_decision_option == "Use decision maker"
+
+    def test_rank_reversal_thresholds(self, example_sensitivity_analysis):
+        thresholds = example_sensitivity_analysis.compute_rank_reversal_thresholds()
+        assert thresholds.shape == (4, 4, 4)
+        # "Listen to your heart" (6.0) overtakes "Flip a coin" (5.9) when Speed importance rises by 1/8.
+        assert thresholds[0, 0, 1] == pytest.approx(-(4 * 10 + 9 * 2 + 2 * 9 + 6 * 8 - (4 * 2 + 9 * 7 + 2 * 10 + 6 * 6)) / 8)
+        assert np.isnan(thresholds[:, range(4), range(4)]).all()
+        thresholds_df = example_sensitivity_analysis.rank_reversal_thresholds_df()
+        assert thresholds_df.loc[("Flip a coin", "Listen to your heart"), "Speed"] == thresholds[0, 0, 1]
+
+    def test_top_decision_option_thresholds_match_brute_force(self, example_sensitivity_analysis):
+        thresholds_df = example_sensitivity_analysis.compute_top_decision_option_thresholds()
+        importance = example_sensitivity_analysis.evaluation_factor_importance
+        for k, evaluation_factor in enumerate(example_sensitivity_analysis.evaluation_factors_list):
+            for column, sign in [('Decrease threshold', -1), ('Increase threshold', 1)]:
+                threshold = thresholds_df.loc[evaluation_factor, column]
+                if pd.isna(threshold):
+                    continue
+                before, after = importance.copy(), importance.copy()
+                before[k] += threshold - sign * 1e-6
+                after[k] += threshold + sign * 1e-6
+                assert top_decision_option(before) == "Use decision maker"
+                assert top_decision_option(after) == thresholds_df.loc[
+                    evaluation_factor, column.replace('threshold', 'challenger')]
+
+    def test_plot_top_decision_option_thresholds(self, example_sensitivity_analysis):
+        fig = example_sensitivity_analysis.plot_top_decision_option_thresholds()
+        assert len(fig.data) == 2
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+import decision_maker_mockup
+from decision_maker import DecisionMaker
+from session_memory import decision_maker_memory_usage, limit_session_history, session_memory_usage, sizeof
+
+
+class TestSessionMemory:
+
+    def test_sizeof_counts_shared_objects_once(self):
+        array = np.zeros(1000, dtype=np.int64)
+        assert sizeof(array) >= 8000
+        assert sizeof([array, array[:10]]) < sizeof(array) + 500
+        assert sizeof(pd.DataFrame({'a': np.zeros(1000)})) >= 8000
+        assert sizeof(len) == 0
+
+    def test_decision_maker_memory_usage(self):
+        decision_maker = DecisionMaker()
+        decision_maker_mockup.set_attributes_from_example(decision_maker)
+        usage = decision_maker_memory_usage(decision_maker)
+        # The frozen example arrays are shared by every session.
+        assert usage['storage'] == 0
+        assert usage['total'] == sum(value for key, value in usage.items() if key != 'total')
+
+        decision_maker.set_decision_options_evaluation(0, 0, 0)
+        assert decision_maker_memory_usage(decision_maker)['storage'] > 0
+
+    def test_compact_releases_stale_renders(self):
+        decision_maker = DecisionMaker()
+        decision_maker_mockup.set_attributes_from_example(decision_maker)
+        decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        decision_maker.compute_decision_score()
+        decision_maker.plot_score()
+        decision_maker.set_decision_options_evaluation(0, 0, 0)
+        decision_maker.compute_decision_options_evaluation_adj_by_importance_df()
+        decision_maker.compute_decision_score()
+        decision_maker.plot_score()
+        decision_maker.to_dict()
+        before = decision_maker_memory_usage(decision_maker)
+        decision_maker.compact()
+        after = decision_maker_memory_usage(decision_maker)
+        assert len(decision_maker.render_cache) == 1
+        assert after['render_cache'] < before['render_cache']
+        assert after['views'] < before['views']
+        assert decision_maker.decision_options_evaluation_dict["Flip a coin"]["Speed"] == 0
+
+    def test_session_memory_usage(self):
+        decision_maker = DecisionMaker()
+        decision_maker_mockup.set_attributes_from_example(decision_maker)
+        usage = session_memory_usage({'decision_maker': decision_maker, 'same_decision_maker': decision_maker})
+        assert usage['decision_maker'] > 0
+        assert usage['same_decision_maker'] == sizeof('same_decision_maker')
+        assert usage['total'] == usage['decision_maker'] + usage['same_decision_maker']
+
+    def test_limit_session_history(self):
+        decision_maker = DecisionMaker()
+        decision_maker.set_attributes_from_arrays(
+            "", [f"Option {i}" for i in range(1000)], [f"Factor {k}" for k in range(100)],
+            np.ones(100, dtype=np.int64), np.ones((100, 1000), dtype=np.int64))
+        limit_session_history(decision_maker, max_bytes=1_000_000, max_feed_bytes=500_000)
+        for i in range(20):
+            decision_maker.set_decision_options_count(1001 + i % 2)
+        assert 0 < decision_maker.history.nbytes <= 1_000_000
+        assert 0 < decision_maker.history.feed_nbytes <= 500_000
+        assert decision_maker.history.can_undo
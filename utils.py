@@ -1,16 +1,10 @@
+from functools import lru_cache
 from re import sub
 from typing import Union
 
 import toml
 
 
-def update_dict_key(dict_to_update: dict, old_key: str, new_key: str, new_value=None) -> dict:
-    return {
-        (new_key if k == old_key else k): (new_value if k == old_key and new_value else v)
-        for k, v in dict_to_update.items()
-    }
-
-
 # Define a function to convert a string to snake case
 def snake_case(s: str) -> str:
     """
@@ -37,3 +31,17 @@ def parse_toml(path: str) -> Union[dict, list]:
     with open(path, 'r') as f:
         config = toml.load(f)
     return config
+
+
+@lru_cache(maxsize=None)
+def load_toml(path: str) -> Union[dict, list]:
+    """`parse_toml` cached for the life of the process; the returned config is shared and must not be modified."""
+    return parse_toml(path)
+
+
+@lru_cache(maxsize=None)
+def gradient_cmap(name: str, colors: tuple[str, ...]):
+    """Build a `LinearSegmentedColormap` through `colors` once per process, importing matplotlib on first use."""
+    from matplotlib.colors import LinearSegmentedColormap
+
+    return LinearSegmentedColormap.from_list(name, list(colors))